@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+Benchmark the unpack -> condense -> pack -> validate loop on synthetic Office files.
+
+Generates .docx, .pptx and .xlsx packages of configurable size and times
+unpack_document, condense_xml, pack_document and the schema validators on
+them, writing the results as JSON.
+
+Example usage:
+    python benchmark.py [--paragraphs N] [--slides N] [--sheets N] [--media N]
+                        [--repeat N] [--jobs N] [--output results.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from pack import condense_xml_bytes, pack_document
+from unpack import unpack_document
+from validation import DOCXSchemaValidator, PPTXSchemaValidator
+
+# Namespaces used by the generated parts
+CONTENT_TYPES_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+RELATIONSHIPS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+OFFICE_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+DRAWING_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+PRESENTATION_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+SPREADSHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+
+CONTENT_TYPE_PREFIX = "application/vnd.openxmlformats-officedocument"
+
+# Smallest valid PNG (1x1, transparent); media files repeat it to the requested size
+PNG_BYTES = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c63000100000500010d0a2db40000000049454e44ae426082"
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark Office file unpack/pack/validate on synthetic packages"
+    )
+    parser.add_argument(
+        "--formats",
+        default="docx,pptx,xlsx",
+        help="Comma-separated formats to benchmark (default: docx,pptx,xlsx)",
+    )
+    parser.add_argument(
+        "--paragraphs", type=int, default=2000, help="Paragraphs in the .docx"
+    )
+    parser.add_argument("--slides", type=int, default=50, help="Slides in the .pptx")
+    parser.add_argument(
+        "--sheets", type=int, default=10, help="Worksheets in the .xlsx"
+    )
+    parser.add_argument("--rows", type=int, default=500, help="Rows per worksheet")
+    parser.add_argument("--media", type=int, default=10, help="Media files per package")
+    parser.add_argument(
+        "--media-size", type=int, default=64, help="Size of each media file in KiB"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per step")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for unpack/validation",
+    )
+    parser.add_argument("--output", help="Write JSON results here instead of stdout")
+    args = parser.parse_args()
+
+    results = run_benchmarks(
+        formats=[f.strip() for f in args.formats.split(",") if f.strip()],
+        paragraphs=args.paragraphs,
+        slides=args.slides,
+        sheets=args.sheets,
+        rows=args.rows,
+        media=args.media,
+        media_size=args.media_size * 1024,
+        repeat=args.repeat,
+        jobs=args.jobs,
+    )
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+def run_benchmarks(
+    formats=("docx", "pptx", "xlsx"),
+    paragraphs=2000,
+    slides=50,
+    sheets=10,
+    rows=500,
+    media=10,
+    media_size=64 * 1024,
+    repeat=3,
+    jobs=1,
+):
+    """Generate synthetic packages and time each step of the round trip.
+
+    Returns:
+        dict: Benchmark configuration, environment and per-format step timings
+    """
+    generators = {
+        "docx": lambda path: make_docx(path, paragraphs, media, media_size),
+        "pptx": lambda path: make_pptx(path, slides, media, media_size),
+        "xlsx": lambda path: make_xlsx(path, sheets, rows, media, media_size),
+    }
+    validators = {"docx": DOCXSchemaValidator, "pptx": PPTXSchemaValidator}
+
+    results = {
+        "config": {
+            "paragraphs": paragraphs,
+            "slides": slides,
+            "sheets": sheets,
+            "rows": rows,
+            "media": media,
+            "media_size": media_size,
+            "repeat": repeat,
+            "jobs": jobs,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": {},
+    }
+
+    for fmt in formats:
+        if fmt not in generators:
+            raise ValueError(f"Unsupported format: {fmt}")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            original = temp_path / f"original.{fmt}"
+            generators[fmt](original)
+
+            unpacked = temp_path / "unpacked"
+            xml_files = []
+
+            def unpack():
+                xml_files[:] = unpack_document(original, unpacked, jobs=jobs)
+
+            def condense():
+                for xml_file in xml_files:
+                    condense_xml_bytes(xml_file)
+
+            def pack():
+                pack_document(unpacked, temp_path / f"packed.{fmt}", validate=False)
+
+            steps = {
+                "unpack": unpack,
+                "condense_xml": condense,
+                "pack_document": pack,
+            }
+
+            validator_class = validators.get(fmt)
+            if validator_class is not None:
+
+                def validate():
+                    validator = validator_class(unpacked, original, max_workers=jobs)
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        if not validator.validate():
+                            raise RuntimeError(f"Synthetic {fmt} failed validation")
+
+                steps[f"{validator_class.__name__}.validate"] = validate
+
+            format_results = {
+                "package_bytes": original.stat().st_size,
+                "parts": len(zipfile.ZipFile(original).namelist()),
+                "steps": {},
+            }
+            for name, step in steps.items():
+                format_results["steps"][name] = _time_step(step, repeat)
+            results["results"][fmt] = format_results
+
+    return results
+
+
+def _time_step(step, repeat):
+    """Run a step repeat times and summarize its wall times in seconds."""
+    runs = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        step()
+        runs.append(time.perf_counter() - start)
+    return {
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "max": max(runs),
+        "runs": runs,
+    }
+
+
+def _content_types(defaults, overrides):
+    """Build [Content_Types].xml from extension and part name mappings."""
+    entries = [
+        f'<Default Extension="{ext}" ContentType="{ctype}"/>'
+        for ext, ctype in defaults.items()
+    ] + [
+        f'<Override PartName="/{part}" ContentType="{ctype}"/>'
+        for part, ctype in overrides.items()
+    ]
+    return f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<Types xmlns="{CONTENT_TYPES_NS}">{"".join(entries)}</Types>'
+
+
+def _relationships(relationships):
+    """Build a .rels part from (id, type, target) tuples."""
+    entries = "".join(
+        f'<Relationship Id="{rid}" Type="{OFFICE_REL}/{rel_type}" Target="{target}"/>'
+        for rid, rel_type, target in relationships
+    )
+    return f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<Relationships xmlns="{RELATIONSHIPS_NS}">{entries}</Relationships>'
+
+
+def _media(media_size):
+    """Get the bytes of a synthetic PNG media file of roughly media_size bytes."""
+    return PNG_BYTES * max(1, media_size // len(PNG_BYTES))
+
+
+def _write_package(path, parts):
+    """Write a package from a part name -> str/bytes mapping."""
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, content in parts.items():
+            zf.writestr(name, content)
+
+
+def make_docx(path, paragraphs, media, media_size):
+    """Generate a .docx with the given number of paragraphs and media files."""
+    body = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">Paragraph {i} of the synthetic '
+        f"benchmark document with some representative body text. </w:t></w:r></w:p>"
+        for i in range(paragraphs)
+    )
+    parts = {
+        "[Content_Types].xml": _content_types(
+            {
+                "rels": "application/vnd.openxmlformats-package.relationships+xml",
+                "xml": "application/xml",
+                "png": "image/png",
+            },
+            {
+                "word/document.xml": f"{CONTENT_TYPE_PREFIX}.wordprocessingml.document.main+xml"
+            },
+        ),
+        "_rels/.rels": _relationships(
+            [("rId1", "officeDocument", "word/document.xml")]
+        ),
+        "word/document.xml": (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<w:document xmlns:w="{WORD_NS}" xmlns:r="{OFFICE_REL}">'
+            f"<w:body>{body}<w:sectPr/></w:body></w:document>"
+        ),
+        "word/_rels/document.xml.rels": _relationships(
+            [(f"rId{i + 1}", "image", f"media/image{i + 1}.png") for i in range(media)]
+        ),
+    }
+    for i in range(media):
+        parts[f"word/media/image{i + 1}.png"] = _media(media_size)
+    _write_package(path, parts)
+
+
+def make_pptx(path, slides, media, media_size):
+    """Generate a .pptx with the given number of slides and media files."""
+    namespaces = (
+        f'xmlns:a="{DRAWING_NS}" xmlns:r="{OFFICE_REL}" xmlns:p="{PRESENTATION_NS}"'
+    )
+    empty_tree = (
+        '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+        "<p:grpSpPr/>"
+    )
+    color_map = (
+        '<p:clrMap bg1="lt1" tx1="dk1" bg2="lt2" tx2="dk2" accent1="accent1" '
+        'accent2="accent2" accent3="accent3" accent4="accent4" accent5="accent5" '
+        'accent6="accent6" hlink="hlink" folHlink="folHlink"/>'
+    )
+
+    overrides = {
+        "ppt/presentation.xml": f"{CONTENT_TYPE_PREFIX}.presentationml.presentation.main+xml",
+        "ppt/slideMasters/slideMaster1.xml": f"{CONTENT_TYPE_PREFIX}.presentationml.slideMaster+xml",
+        "ppt/slideLayouts/slideLayout1.xml": f"{CONTENT_TYPE_PREFIX}.presentationml.slideLayout+xml",
+        "ppt/theme/theme1.xml": f"{CONTENT_TYPE_PREFIX}.theme+xml",
+    }
+    for i in range(slides):
+        overrides[f"ppt/slides/slide{i + 1}.xml"] = (
+            f"{CONTENT_TYPE_PREFIX}.presentationml.slide+xml"
+        )
+
+    slide_ids = "".join(
+        f'<p:sldId id="{256 + i}" r:id="rId{i + 2}"/>' for i in range(slides)
+    )
+    parts = {
+        "[Content_Types].xml": _content_types(
+            {
+                "rels": "application/vnd.openxmlformats-package.relationships+xml",
+                "xml": "application/xml",
+                "png": "image/png",
+            },
+            overrides,
+        ),
+        "_rels/.rels": _relationships(
+            [("rId1", "officeDocument", "ppt/presentation.xml")]
+        ),
+        "ppt/presentation.xml": (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f"<p:presentation {namespaces}>"
+            '<p:sldMasterIdLst><p:sldMasterId id="2147483648" r:id="rId1"/></p:sldMasterIdLst>'
+            f"<p:sldIdLst>{slide_ids}</p:sldIdLst>"
+            '<p:sldSz cx="9144000" cy="6858000"/><p:notesSz cx="6858000" cy="9144000"/>'
+            "</p:presentation>"
+        ),
+        "ppt/_rels/presentation.xml.rels": _relationships(
+            [("rId1", "slideMaster", "slideMasters/slideMaster1.xml")]
+            + [
+                (f"rId{i + 2}", "slide", f"slides/slide{i + 1}.xml")
+                for i in range(slides)
+            ]
+        ),
+        "ppt/slideMasters/slideMaster1.xml": (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f"<p:sldMaster {namespaces}><p:cSld><p:spTree>{empty_tree}</p:spTree></p:cSld>"
+            f"{color_map}"
+            '<p:sldLayoutIdLst><p:sldLayoutId id="2147483649" r:id="rId1"/></p:sldLayoutIdLst>'
+            "</p:sldMaster>"
+        ),
+        "ppt/slideMasters/_rels/slideMaster1.xml.rels": _relationships(
+            [
+                ("rId1", "slideLayout", "../slideLayouts/slideLayout1.xml"),
+                ("rId2", "theme", "../theme/theme1.xml"),
+            ]
+        ),
+        "ppt/slideLayouts/slideLayout1.xml": (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f"<p:sldLayout {namespaces}><p:cSld><p:spTree>{empty_tree}</p:spTree></p:cSld>"
+            "</p:sldLayout>"
+        ),
+        "ppt/slideLayouts/_rels/slideLayout1.xml.rels": _relationships(
+            [("rId1", "slideMaster", "../slideMasters/slideMaster1.xml")]
+        ),
+        "ppt/theme/theme1.xml": _theme(),
+    }
+
+    for i in range(slides):
+        slide_rels = [("rId1", "slideLayout", "../slideLayouts/slideLayout1.xml")]
+        # Spread the media files over the slides
+        slide_rels += [
+            (f"rId{m + 2}", "image", f"../media/image{m + 1}.png")
+            for m in range(media)
+            if m % max(1, slides) == i
+        ]
+        parts[f"ppt/slides/slide{i + 1}.xml"] = (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f"<p:sld {namespaces}><p:cSld><p:spTree>{empty_tree}"
+            '<p:sp><p:nvSpPr><p:cNvPr id="2" name="Text"/><p:cNvSpPr txBox="1"/><p:nvPr/>'
+            "</p:nvSpPr><p:spPr/><p:txBody><a:bodyPr/>"
+            f'<a:p><a:r><a:rPr lang="en-US"/><a:t>Slide {i + 1}</a:t></a:r></a:p>'
+            "</p:txBody></p:sp></p:spTree></p:cSld></p:sld>"
+        )
+        parts[f"ppt/slides/_rels/slide{i + 1}.xml.rels"] = _relationships(slide_rels)
+    for i in range(media):
+        parts[f"ppt/media/image{i + 1}.png"] = _media(media_size)
+    _write_package(path, parts)
+
+
+def _theme():
+    """Build a minimal but schema-valid theme part."""
+    colors = "".join(
+        f'<a:{name}><a:srgbClr val="{value}"/></a:{name}>'
+        for name, value in [
+            ("dk1", "000000"),
+            ("lt1", "FFFFFF"),
+            ("dk2", "1F497D"),
+            ("lt2", "EEECE1"),
+            ("accent1", "4F81BD"),
+            ("accent2", "C0504D"),
+            ("accent3", "9BBB59"),
+            ("accent4", "8064A2"),
+            ("accent5", "4BACC6"),
+            ("accent6", "F79646"),
+            ("hlink", "0000FF"),
+            ("folHlink", "800080"),
+        ]
+    )
+    fonts = '<a:latin typeface="Calibri"/><a:ea typeface=""/><a:cs typeface=""/>'
+    fill = '<a:solidFill><a:schemeClr val="phClr"/></a:solidFill>'
+    line = f'<a:ln w="9525">{fill}</a:ln>'
+    effect = "<a:effectStyle><a:effectLst/></a:effectStyle>"
+    return (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<a:theme xmlns:a="{DRAWING_NS}" name="Benchmark"><a:themeElements>'
+        f'<a:clrScheme name="Benchmark">{colors}</a:clrScheme>'
+        f'<a:fontScheme name="Benchmark"><a:majorFont>{fonts}</a:majorFont>'
+        f"<a:minorFont>{fonts}</a:minorFont></a:fontScheme>"
+        f'<a:fmtScheme name="Benchmark"><a:fillStyleLst>{fill * 3}</a:fillStyleLst>'
+        f"<a:lnStyleLst>{line * 3}</a:lnStyleLst>"
+        f"<a:effectStyleLst>{effect * 3}</a:effectStyleLst>"
+        f"<a:bgFillStyleLst>{fill * 3}</a:bgFillStyleLst></a:fmtScheme>"
+        "</a:themeElements></a:theme>"
+    )
+
+
+def make_xlsx(path, sheets, rows, media, media_size):
+    """Generate an .xlsx with the given number of worksheets, rows and media files."""
+    overrides = {
+        "xl/workbook.xml": f"{CONTENT_TYPE_PREFIX}.spreadsheetml.sheet.main+xml",
+    }
+    for i in range(sheets):
+        overrides[f"xl/worksheets/sheet{i + 1}.xml"] = (
+            f"{CONTENT_TYPE_PREFIX}.spreadsheetml.worksheet+xml"
+        )
+
+    sheet_entries = "".join(
+        f'<sheet name="Sheet{i + 1}" sheetId="{i + 1}" r:id="rId{i + 1}"/>'
+        for i in range(sheets)
+    )
+    parts = {
+        "[Content_Types].xml": _content_types(
+            {
+                "rels": "application/vnd.openxmlformats-package.relationships+xml",
+                "xml": "application/xml",
+                "png": "image/png",
+            },
+            overrides,
+        ),
+        "_rels/.rels": _relationships([("rId1", "officeDocument", "xl/workbook.xml")]),
+        "xl/workbook.xml": (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<workbook xmlns="{SPREADSHEET_NS}" xmlns:r="{OFFICE_REL}">'
+            f"<sheets>{sheet_entries}</sheets></workbook>"
+        ),
+        "xl/_rels/workbook.xml.rels": _relationships(
+            [
+                (f"rId{i + 1}", "worksheet", f"worksheets/sheet{i + 1}.xml")
+                for i in range(sheets)
+            ]
+            + [
+                (f"rId{sheets + m + 1}", "image", f"media/image{m + 1}.png")
+                for m in range(media)
+            ]
+        ),
+    }
+
+    for i in range(sheets):
+        sheet_rows = "".join(
+            f'<row r="{r}"><c r="A{r}"><v>{r}</v></c><c r="B{r}"><v>{r * 1.5}</v></c>'
+            f'<c r="C{r}"><f>A{r}+B{r}</f></c></row>'
+            for r in range(1, rows + 1)
+        )
+        parts[f"xl/worksheets/sheet{i + 1}.xml"] = (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<worksheet xmlns="{SPREADSHEET_NS}"><sheetData>{sheet_rows}</sheetData></worksheet>'
+        )
+    for i in range(media):
+        parts[f"xl/media/image{i + 1}.png"] = _media(media_size)
+    _write_package(path, parts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental validation with a part manifest.
+
+A validator given the manifest of the last successful validation must skip
+the per-part checks of the parts that did not change since.
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path to import validation
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validation.docx import DOCXSchemaValidator
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+# Minimal unpacked document
+PARTS = {
+    "[Content_Types].xml": """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+  <Default Extension="xml" ContentType="application/xml"/>
+  <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+  <Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>
+</Types>""",
+    "_rels/.rels": """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>""",
+    "word/_rels/document.xml.rels": """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings" Target="settings.xml"/>
+</Relationships>""",
+    "word/settings.xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:settings {W}>
+  <w:defaultTabStop w:val="720"/>
+</w:settings>""",
+    "word/document.xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document {W}>
+  <w:body>
+    <w:p><w:r><w:t>First paragraph</w:t></w:r></w:p>
+  </w:body>
+</w:document>""",
+}
+
+
+class RecordingValidator(DOCXSchemaValidator):
+    """DOCXSchemaValidator recording the parts it validates against XSD."""
+
+    def _validate_files_against_xsd(self, xml_files):
+        self.xsd_parts = sorted(self._part_name(xml_file) for xml_file in xml_files)
+        return super()._validate_files_against_xsd(xml_files)
+
+
+class TestManifest(unittest.TestCase):
+    """Only parts changed since the last successful validation are rechecked."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        temp_path = Path(temp_dir.name)
+        self.original = temp_path / "original"
+        for part_name, content in PARTS.items():
+            path = self.original / part_name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+        self.unpacked = temp_path / "unpacked"
+        shutil.copytree(self.original, self.unpacked)
+        self.manifest = {}
+
+    def validate(self):
+        validator = RecordingValidator(
+            self.unpacked, self.original, manifest=self.manifest
+        )
+        return validator.validate(), validator.xsd_parts
+
+    def replace_in_part(self, part_name, old, new):
+        path = self.unpacked / part_name
+        path.write_text(path.read_text(encoding="utf-8").replace(old, new), "utf-8")
+
+    def test_first_validation_checks_every_part(self):
+        valid, xsd_parts = self.validate()
+        self.assertTrue(valid)
+        self.assertEqual(xsd_parts, sorted(PARTS))
+        self.assertEqual(sorted(self.manifest), sorted(PARTS))
+
+    def test_unchanged_parts_skipped(self):
+        self.validate()
+        valid, xsd_parts = self.validate()
+        self.assertTrue(valid)
+        self.assertEqual(xsd_parts, [])
+
+    def test_changed_part_rechecked(self):
+        self.validate()
+        digest = self.manifest["word/settings.xml"]["digest"]
+        self.replace_in_part("word/settings.xml", 'w:val="720"', 'w:val="708"')
+        valid, xsd_parts = self.validate()
+        self.assertTrue(valid)
+        self.assertEqual(xsd_parts, ["word/settings.xml"])
+        self.assertNotEqual(self.manifest["word/settings.xml"]["digest"], digest)
+
+    def test_failed_validation_keeps_manifest(self):
+        self.validate()
+        recorded = {name: dict(entry) for name, entry in self.manifest.items()}
+        self.replace_in_part("word/document.xml", "<w:body>", "<w:body><w:unknown/>")
+        valid, xsd_parts = self.validate()
+        self.assertFalse(valid)
+        self.assertEqual(xsd_parts, ["word/document.xml"])
+        self.assertEqual(self.manifest, recorded)
+        # The broken part is checked again next time
+        self.assertFalse(self.validate()[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
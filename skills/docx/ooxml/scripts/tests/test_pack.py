@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for pack.py's XML condensing.
+
+The streaming condenser must produce exactly the bytes of the minidom path it
+replaces, on whichever Python version runs the tests.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path to import pack
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pack import _condense_xml_dom, _DOMRequired, _XMLCondenser, condense_xml_bytes
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+# Documents the streaming condenser handles itself
+STREAMED_CASES = {
+    "whitespace": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document {W}>
+  <w:body>
+    <w:p>
+      <w:r><w:t xml:space="preserve">  kept  </w:t></w:r>
+      <w:r><w:t>   </w:t></w:r>
+    </w:p>
+  </w:body>
+</w:document>""",
+    "comments": f"""<?xml version="1.0"?>
+<!-- before the root -->
+<w:document {W}>
+  <!-- dropped -->
+  <w:p><w:r><w:t>a<!-- kept in w:t -->b</w:t></w:r></w:p>
+</w:document>
+<!-- after the root -->""",
+    "processing instructions": f"""<?xml version="1.0"?>
+<?mso-application progid="Word.Document"?>
+<w:document {W}><?pi inside?>
+  <w:p><?pi in paragraph?></w:p>
+</w:document>""",
+    "cdata": f"""<w:document {W}>
+  <w:t><![CDATA[<raw> & "text"]]></w:t>
+  <w:p>before<![CDATA[]]>after</w:p>
+  <w:p>   <![CDATA[   ]]>   </w:p>
+  <w:p><![CDATA[x]]>  <![CDATA[y]]></w:p>
+</w:document>""",
+    "entities in text": f"""<w:document {W}>
+  <w:t>&amp; &lt; &gt; &quot; &apos; &#9; &#10; &#13; &#x263A;</w:t>
+  <w:p>"quoted" &amp; 'apostrophes' &gt;</w:p>
+</w:document>""",
+    "entities in attributes": f"""<w:document {W}>
+  <w:p w:a="&amp;&lt;&gt;&quot;&apos;" w:b="tab&#9;lf&#10;cr&#13;" w:c='"double"'/>
+  <w:p w:d="plain	tab
+newline"/>
+</w:document>""",
+    "namespaces": """<root xmlns="urn:default" xmlns:a="urn:a?x=1&amp;y=&quot;2&quot;">
+  <a:child a:attr="1" plain="2"><inner xmlns="urn:other"/></a:child>
+  <empty></empty>
+</root>""",
+    "non-ascii": f"""<w:document {W}>
+  <w:t>café 中文 \U0001F600</w:t>
+  <w:p w:v="üß"/>
+</w:document>""",
+}
+
+# Documents that fall back to minidom
+DOCTYPE_CASES = {
+    "doctype": f"""<?xml version="1.0"?>
+<!DOCTYPE w:document>
+<w:document {W}>
+  <!-- dropped -->
+  <w:p><w:r><w:t> &amp; </w:t></w:r></w:p>
+</w:document>""",
+    "doctype with system id": f"""<!DOCTYPE w:document SYSTEM "document.dtd">
+<w:document {W}><w:p><![CDATA[cdata]]><?pi data?></w:p></w:document>""",
+}
+
+
+class TestCondenseXML(unittest.TestCase):
+    """Compare the streaming condenser against the minidom path."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def write(self, content):
+        path = Path(self.temp_dir.name) / "part.xml"
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def test_streamed_output_matches_minidom(self):
+        """The streaming condenser writes the same bytes as minidom."""
+        for name, content in STREAMED_CASES.items():
+            with self.subTest(case=name):
+                path = self.write(content)
+                self.assertEqual(
+                    _XMLCondenser().condense(path), _condense_xml_dom(path)
+                )
+
+    def test_doctype_falls_back_to_minidom(self):
+        """Documents with a DOCTYPE are condensed by minidom."""
+        for name, content in DOCTYPE_CASES.items():
+            with self.subTest(case=name):
+                path = self.write(content)
+                with self.assertRaises(_DOMRequired):
+                    _XMLCondenser().condense(path)
+                self.assertEqual(condense_xml_bytes(path), _condense_xml_dom(path))
+
+    def test_condensed_output(self):
+        """Whitespace and comments go, except inside w:t and outside the root."""
+        condensed = condense_xml_bytes(self.write(STREAMED_CASES["comments"]))
+        self.assertEqual(
+            condensed.decode("utf-8"),
+            '<?xml version="1.0" encoding="UTF-8"?><!-- before the root -->'
+            f"<w:document {W}><w:p><w:r><w:t>a<!-- kept in w:t -->b</w:t>"
+            "</w:r></w:p></w:document><!-- after the root -->",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for OOXMLPackage in validation/package.py.
+
+Every test runs on a package opened on a zip file and on an unpacked
+directory with the same parts.
+"""
+
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+# Add parent directory to path to import validation
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validation.package import OOXMLPackage
+
+PARTS = {
+    "[Content_Types].xml": b'<?xml version="1.0"?><Types xmlns="urn:types"/>',
+    "_rels/.rels": b'<?xml version="1.0"?><Relationships xmlns="urn:rels"/>',
+    "word/document.xml": b'<?xml version="1.0"?><document><p>text</p></document>',
+    "word/media/image1.png": b"\x89PNG not really",
+}
+
+
+class PackageTestCase(unittest.TestCase):
+    """Base class writing PARTS as a zip file and as a directory."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+
+    def write_package(self, kind):
+        """Write PARTS as a "zip" or "directory" package and return its path."""
+        if kind == "zip":
+            path = self.temp_path / "package.docx"
+            with zipfile.ZipFile(path, "w") as zf:
+                for name, content in PARTS.items():
+                    zf.writestr(name, content)
+            return path
+
+        path = self.temp_path / "package"
+        for name, content in PARTS.items():
+            (path / name).parent.mkdir(parents=True, exist_ok=True)
+            (path / name).write_bytes(content)
+        return path
+
+    def open_packages(self):
+        """Yield (kind, package) for a new package of each kind."""
+        for kind in ("zip", "directory"):
+            package = OOXMLPackage(self.write_package(kind))
+            self.addCleanup(package.close)
+            yield kind, package
+
+    def read_all(self, path):
+        """Read every part of a package from disk into a dict."""
+        with OOXMLPackage(path) as package:
+            return {name: package.read(name) for name in package.names()}
+
+
+class TestRead(PackageTestCase):
+    """Parts must read the same from a zip file and a directory."""
+
+    def test_names_and_content(self):
+        for kind, package in self.open_packages():
+            with self.subTest(kind=kind):
+                self.assertEqual(sorted(package.names()), sorted(PARTS))
+                for name, content in PARTS.items():
+                    self.assertIn(name, package)
+                    self.assertEqual(package.read(name), content)
+                    self.assertEqual(package.size(name), len(content))
+                    with package.open(name) as part:
+                        self.assertEqual(part.read(), content)
+
+    def test_missing_part(self):
+        for kind, package in self.open_packages():
+            with self.subTest(kind=kind):
+                self.assertNotIn("word/missing.xml", package)
+                with self.assertRaises(KeyError):
+                    package.read("word/missing.xml")
+
+    def test_tree_reparsed_after_set_part(self):
+        for kind, package in self.open_packages():
+            with self.subTest(kind=kind):
+                tree = package.get_tree("word/document.xml")
+                self.assertIs(package.get_tree("word/document.xml"), tree)
+                package.set_part("word/document.xml", b"<document/>")
+                root = package.get_tree("word/document.xml").getroot()
+                self.assertEqual(len(root), 0)
+
+
+class TestWrite(PackageTestCase):
+    """Set and removed parts must be written, and nothing else changed."""
+
+    def change(self, package):
+        """Replace, add and remove a part, and return the expected parts."""
+        package.set_part("word/document.xml", b"<document>changed</document>")
+        package.set_part("word/people.xml", b"<people/>")
+        package.remove_part("word/media/image1.png")
+        expected = dict(PARTS)
+        expected["word/document.xml"] = b"<document>changed</document>"
+        expected["word/people.xml"] = b"<people/>"
+        del expected["word/media/image1.png"]
+        return expected
+
+    def test_pending_changes_are_read(self):
+        for kind, package in self.open_packages():
+            with self.subTest(kind=kind):
+                self.assertFalse(package.has_changes())
+                expected = self.change(package)
+                self.assertTrue(package.has_changes())
+                self.assertEqual(sorted(package.names()), sorted(expected))
+                self.assertNotIn("word/media/image1.png", package)
+                # Nothing is written before write()
+                self.assertEqual(self.read_all(package.path), PARTS)
+
+    def test_write_in_place(self):
+        for kind, package in self.open_packages():
+            with self.subTest(kind=kind):
+                expected = self.change(package)
+                package.write()
+                self.assertFalse(package.has_changes())
+                self.assertEqual(self.read_all(package.path), expected)
+                self.assertEqual(package.read("word/people.xml"), b"<people/>")
+
+    def test_write_in_place_keeps_unchanged_files(self):
+        path = self.write_package("directory")
+        rels = path / "_rels" / ".rels"
+        before = rels.stat().st_mtime_ns
+        package = OOXMLPackage(path)
+        self.change(package)
+        package.write()
+        self.assertEqual(rels.stat().st_mtime_ns, before)
+        self.assertFalse((path / "word" / "media" / "image1.png").exists())
+
+    def test_write_to_destination(self):
+        for kind in ("zip", "directory"):
+            for name in ("copy.docx", "copy"):
+                with self.subTest(kind=kind, destination=name):
+                    package = OOXMLPackage(self.write_package(kind))
+                    self.addCleanup(package.close)
+                    expected = self.change(package)
+                    destination = self.temp_path / kind / name
+                    package.write(destination)
+                    self.assertEqual(destination.is_file(), name == "copy.docx")
+                    self.assertEqual(self.read_all(destination), expected)
+                    # The package itself is not changed
+                    self.assertEqual(self.read_all(package.path), PARTS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent XSD result cache in validation/result_cache.py.
+"""
+
+import itertools
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path to import validation
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validation import result_cache
+from validation.docx import DOCXSchemaValidator
+from validation.result_cache import ResultCache
+
+DOCUMENT = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body><w:p><w:r><w:t>text</w:t></w:r></w:p></w:body>
+</w:document>"""
+
+
+class CacheTestCase(unittest.TestCase):
+    """Base class with a cache database in a temporary directory."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+        self.cache_file = self.temp_path / "results.sqlite3"
+
+    def open_cache(self, **kwargs):
+        cache = ResultCache(self.cache_file, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def query(self, sql):
+        """Run an SQL statement on the cache database and return its rows."""
+        connection = sqlite3.connect(self.cache_file)
+        try:
+            with connection:
+                return connection.execute(sql).fetchall()
+        finally:
+            connection.close()
+
+    def count_entries(self):
+        return self.query("SELECT COUNT(*) FROM results")[0][0]
+
+
+class TestResultCache(CacheTestCase):
+    """Results must be returned as stored, and old ones evicted first."""
+
+    def test_miss_and_hit(self):
+        cache = self.open_cache()
+        self.assertIsNone(cache.get("key"))
+        cache.put("key", False, {"first error", "second error"})
+        self.assertEqual(cache.get("key"), (False, {"first error", "second error"}))
+        self.assertIsNone(cache.get("other key"))
+
+    def test_shared_across_instances(self):
+        self.open_cache().put("key", True, set())
+        self.assertEqual(self.open_cache().get("key"), (True, set()))
+
+    def test_least_recently_used_evicted(self):
+        # Each entry takes 3 bytes (key and "[]"), so 3 entries fit
+        cache = self.open_cache(max_bytes=9)
+        clock = itertools.count()
+        with mock.patch.object(result_cache, "EVICTION_INTERVAL", 1), mock.patch.object(
+            result_cache.time, "time", lambda: next(clock)
+        ):
+            for key in "abc":
+                cache.put(key, True, set())
+            # Reading "a" makes "b" the least recently used
+            self.assertIsNotNone(cache.get("a"))
+            cache.put("d", True, set())
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("d"))
+        self.assertLessEqual(self.count_entries(), 3)
+
+
+class TestValidatorKeys(CacheTestCase):
+    """The validator must only reuse results cached for the same version."""
+
+    def setUp(self):
+        super().setUp()
+        self.unpacked = self.temp_path / "unpacked"
+        (self.unpacked / "word").mkdir(parents=True)
+        (self.unpacked / "word" / "document.xml").write_bytes(DOCUMENT)
+
+    def validate(self, validator_class):
+        validator = validator_class(
+            self.unpacked, self.unpacked, cache_file=self.cache_file
+        )
+        self.addCleanup(validator.result_cache.close)
+        return validator._validate_single_file_xsd(
+            validator.unpacked_dir / "word" / "document.xml", validator.unpacked_dir
+        )
+
+    def mark_cached_results(self):
+        """Replace every cached result, so results served from the cache stand out."""
+        self.query("""UPDATE results SET is_valid = 0, errors = '["cached"]'""")
+
+    def test_same_version_reused(self):
+        self.assertEqual(self.validate(DOCXSchemaValidator), (True, set()))
+        self.mark_cached_results()
+        self.assertEqual(self.validate(DOCXSchemaValidator), (False, {"cached"}))
+
+    def test_new_version_not_reused(self):
+        class NewerValidator(DOCXSchemaValidator):
+            VALIDATOR_VERSION = DOCXSchemaValidator.VALIDATOR_VERSION + 1
+
+        self.validate(DOCXSchemaValidator)
+        self.mark_cached_results()
+        self.assertEqual(self.validate(NewerValidator), (True, set()))
+        self.assertEqual(self.count_entries(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
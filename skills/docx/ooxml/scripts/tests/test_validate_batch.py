@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for validate.py's batch mode.
+
+Manifest entries that cannot be validated must be reported as error results
+while the rest of the batch is still validated.
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+# Add parent directory to path to import validate
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validate import run_batch
+
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body><w:p><w:r><w:t>text</w:t></w:r></w:p></w:body>
+</w:document>"""
+
+
+class TestBatch(unittest.TestCase):
+    """Bad entries give error results instead of stopping the batch."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+
+        # A document that can be validated, so the batch has real work too
+        self.unpacked = self.temp_path / "unpacked"
+        (self.unpacked / "word").mkdir(parents=True)
+        (self.unpacked / "word" / "document.xml").write_text(DOCUMENT, "utf-8")
+        self.original = self.temp_path / "original.docx"
+        with zipfile.ZipFile(self.original, "w") as zf:
+            zf.writestr("word/document.xml", DOCUMENT)
+
+    def run_batch(self, lines):
+        """Run a batch over manifest lines; return its status and results by index."""
+        manifest = self.temp_path / "manifest.jsonl"
+        manifest.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            status = run_batch(str(manifest), jobs=1, use_cache=False)
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        return status, {result["index"]: result for result in results}
+
+    def entry(self, path, original):
+        return json.dumps({"path": str(path), "original": str(original)})
+
+    def test_bad_entries_reported(self):
+        status, results = self.run_batch(
+            [
+                "{not json",
+                json.dumps({"path": str(self.unpacked)}),
+                self.entry(self.temp_path / "missing", self.original),
+                self.entry(self.unpacked, self.temp_path / "missing.docx"),
+                self.entry(self.unpacked, self.original),
+            ]
+        )
+
+        self.assertEqual(status, 1)
+        self.assertEqual(sorted(results), [0, 1, 2, 3, 4])
+        for index in (0, 1):
+            with self.subTest(index=index):
+                self.assertFalse(results[index]["valid"])
+                self.assertIn("Bad manifest line", results[index]["error"])
+        with self.subTest(index=2):
+            self.assertIn("does not exist", results[2]["error"])
+        with self.subTest(index=3):
+            self.assertIn("is not a file", results[3]["error"])
+        with self.subTest(index=4):
+            self.assertNotIn("error", results[4])
+            self.assertIn("DOCXSchemaValidator", results[4]["validators"])
+
+    def test_blank_lines_skipped(self):
+        status, results = self.run_batch(
+            ["", self.entry(self.temp_path / "missing", self.original), "  "]
+        )
+        self.assertEqual(status, 1)
+        self.assertEqual(list(results), [0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,29 +1,106 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""
+Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
 
+Example usage:
+    python unpack.py <office_file> <output_dir> [--jobs N] [--lazy <glob>]
+"""
+
+import argparse
 import random
-import sys
 import defusedxml.minidom
 import zipfile
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Unpack an Office file and pretty-print its XML parts"
+    )
+    parser.add_argument("input_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for pretty-printing (default: 1)",
+    )
+    parser.add_argument(
+        "--lazy",
+        action="append",
+        metavar="GLOB",
+        help="Only pretty-print XML parts matching this glob, e.g. 'word/*.xml' "
+        "(can be repeated; other parts are extracted as-is)",
+    )
+    args = parser.parse_args()
+
+    unpack_document(args.input_file, args.output_dir, jobs=args.jobs, lazy=args.lazy)
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.input_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
+def unpack_document(input_file, output_dir, jobs=None, lazy=None):
+    """Unpack an Office file and pretty-print its XML parts.
 
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
+    Args:
+        input_file: Path to the Office file (.docx/.pptx/.xlsx)
+        output_dir: Directory to unpack into (created if needed)
+        jobs: Number of worker processes for pretty-printing (None or 1 runs serially)
+        lazy: Optional glob pattern or list of patterns (matched like
+            PurePath.match against part names). Only XML parts matching one are
+            pretty-printed; all other parts are extracted unchanged.
 
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
+    Returns:
+        list: Paths of the XML files that were pretty-printed
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    if isinstance(lazy, str):
+        lazy = [lazy]
+
+    # Extract every member once; XML parts are then formatted in place
+    xml_files = []
+    with zipfile.ZipFile(input_file) as zf:
+        for info in zf.infolist():
+            target = Path(zf.extract(info, output_path))
+            if info.is_dir() or not info.filename.endswith((".xml", ".rels")):
+                continue
+            if lazy and not any(
+                PurePosixPath(info.filename).match(pattern) for pattern in lazy
+            ):
+                continue
+            xml_files.append(target)
+
+    # Pretty print all XML files
+    if not jobs or jobs <= 1 or len(xml_files) <= 1:
+        for xml_file in xml_files:
+            _pretty_print(xml_file)
+    else:
+        workers = min(jobs, len(xml_files))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Consume the results so worker errors are raised here
+            list(
+                executor.map(
+                    _pretty_print,
+                    xml_files,
+                    chunksize=max(1, len(xml_files) // (workers * 4)),
+                )
+            )
+
+    return xml_files
+
+
+def _pretty_print(xml_file):
+    """Rewrite an XML file indented, one element per line."""
     content = xml_file.read_text(encoding="utf-8")
     dom = defusedxml.minidom.parseString(content)
     xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
 
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+if __name__ == "__main__":
+    main()
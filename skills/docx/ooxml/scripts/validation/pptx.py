@@ -2,6 +2,7 @@
 Validator for PowerPoint presentation XML files against XSD schemas.
 """
 
+import posixpath
 import re
 
 from .base import BaseSchemaValidator
@@ -28,50 +29,53 @@ class PPTXSchemaValidator(BaseSchemaValidator):
     def validate(self):
         """Run all validation checks and return True if all pass."""
         # Test 0: XML well-formedness
-        if not self.validate_xml():
+        if not self._run_check(self.validate_xml):
             return False
 
         # Test 1: Namespace declarations
         all_valid = True
-        if not self.validate_namespaces():
+        if not self._run_check(self.validate_namespaces):
             all_valid = False
 
         # Test 2: Unique IDs
-        if not self.validate_unique_ids():
+        if not self._run_check(self.validate_unique_ids):
             all_valid = False
 
         # Test 3: UUID ID validation
-        if not self.validate_uuid_ids():
+        if not self._run_check(self.validate_uuid_ids):
             all_valid = False
 
         # Test 4: Relationship and file reference validation
-        if not self.validate_file_references():
+        if not self._run_check(self.validate_file_references):
             all_valid = False
 
         # Test 5: Slide layout ID validation
-        if not self.validate_slide_layout_ids():
+        if not self._run_check(self.validate_slide_layout_ids):
             all_valid = False
 
         # Test 6: Content type declarations
-        if not self.validate_content_types():
+        if not self._run_check(self.validate_content_types):
             all_valid = False
 
         # Test 7: XSD schema validation
-        if not self.validate_against_xsd():
+        if not self._run_check(self.validate_against_xsd):
             all_valid = False
 
         # Test 8: Notes slide reference validation
-        if not self.validate_notes_slide_references():
+        if not self._run_check(self.validate_notes_slide_references):
             all_valid = False
 
         # Test 9: Relationship ID reference validation
-        if not self.validate_all_relationship_ids():
+        if not self._run_check(self.validate_all_relationship_ids):
             all_valid = False
 
         # Test 10: Duplicate slide layout references validation
-        if not self.validate_no_duplicate_slide_layouts():
+        if not self._run_check(self.validate_no_duplicate_slide_layouts):
             all_valid = False
 
+        if all_valid:
+            self._update_manifest()
+
         return all_valid
 
     def validate_uuid_ids(self):
@@ -85,8 +89,11 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         )
 
         for xml_file in self.xml_files:
+            if self._is_unchanged(xml_file):
+                continue
+
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
 
                 # Check all elements for ID attributes
                 for elem in root.iter():
@@ -132,7 +139,13 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         errors = []
 
         # Find all slide master files
-        slide_masters = list(self.unpacked_dir.glob("ppt/slideMasters/*.xml"))
+        graph = self._get_package_graph()
+        slide_masters = [
+            self.unpacked_dir / part_name
+            for part_name in graph["files"]
+            if posixpath.dirname(part_name) == "ppt/slideMasters"
+            and part_name.endswith(".xml")
+        ]
 
         if not slide_masters:
             if self.verbose:
@@ -142,29 +155,26 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for slide_master in slide_masters:
             try:
                 # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
+                root = self._parse_xml(slide_master).getroot()
 
                 # Find the corresponding _rels file for this slide master
-                rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
+                rels_part = self._rels_part_for(self._part_name(slide_master))
+                rels = graph["rels"].get(rels_part)
 
-                if not rels_file.exists():
+                if rels is None:
                     errors.append(
                         f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                        f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
+                        f"Missing relationships file: {rels_part}"
                     )
                     continue
-
-                # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                if rels["error"] is not None:
+                    raise rels["error"]
 
                 # Build a set of valid relationship IDs that point to slide layouts
                 valid_layout_rids = set()
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "slideLayout" in rel_type:
-                        valid_layout_rids.add(rel.get("Id"))
+                for rel in rels["relationships"]:
+                    if "slideLayout" in rel["type"]:
+                        valid_layout_rids.add(rel["id"])
 
                 # Find all sldLayoutId elements in the slide master
                 for sld_layout_id in root.findall(
@@ -202,22 +212,17 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_no_duplicate_slide_layouts(self):
         """Validate that each slide has exactly one slideLayout reference."""
-        import lxml.etree
-
         errors = []
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels = self._get_slide_rels()
 
-        for rels_file in slide_rels_files:
+        for rels_file, rels in slide_rels:
             try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                if rels["error"] is not None:
+                    raise rels["error"]
 
                 # Find all slideLayout relationships
                 layout_rels = [
-                    rel
-                    for rel in root.findall(
-                        f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                    )
-                    if "slideLayout" in rel.get("Type", "")
+                    rel for rel in rels["relationships"] if "slideLayout" in rel["type"]
                 ]
 
                 if len(layout_rels) > 1:
@@ -248,25 +253,22 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         notes_slide_references = {}  # Track which slides reference each notesSlide
 
         # Find all slide relationship files
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels = self._get_slide_rels()
 
-        if not slide_rels_files:
+        if not slide_rels:
             if self.verbose:
                 print("PASSED - No slide relationship files found")
             return True
 
-        for rels_file in slide_rels_files:
+        for rels_file, rels in slide_rels:
             try:
-                # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                if rels["error"] is not None:
+                    raise rels["error"]
 
                 # Find all notesSlide relationships
-                for rel in root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "notesSlide" in rel_type:
-                        target = rel.get("Target", "")
+                for rel in rels["relationships"]:
+                    if "notesSlide" in rel["type"]:
+                        target = rel["target"] or ""
                         if target:
                             # Normalize the target path to handle relative paths
                             normalized_target = target.replace("../", "")
@@ -310,6 +312,16 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All notes slide references are unique")
             return True
 
+    def _get_slide_rels(self):
+        """Get (rels file, relationships entry) pairs for ppt/slides/_rels/*.xml.rels."""
+        graph = self._get_package_graph()
+        return [
+            (rels["file"], rels)
+            for rels_part, rels in graph["rels"].items()
+            if posixpath.dirname(rels_part) == "ppt/slides/_rels"
+            and rels_part.endswith(".xml.rels")
+        ]
+
 
 if __name__ == "__main__":
     raise RuntimeError("This module should not be run directly.")
@@ -2,117 +2,139 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
+import copy
+import difflib
+import hashlib
+import re
+import xml.etree.ElementTree as ET
 import zipfile
+from collections import namedtuple
 from pathlib import Path
 
+from .package import as_package
+
+# Maximum number of changed regions shown in a failed validation's diff
+MAX_DIFF_PARAGRAPHS = 50
+
+# Changed paragraphs longer than this (in characters) are diffed by word
+MAX_CHAR_DIFF_LENGTH = 4000
+
+# Paragraphs and characters of each side of a changed region that are diffed;
+# the rest is left out of the report so large rewrites stay fast to diff
+MAX_HUNK_PARAGRAPHS = 20
+MAX_HUNK_CHARS = 4000
+
+PARA_ID_ATTR = "{http://schemas.microsoft.com/office/word/2010/wordml}paraId"
+
+# Text hash of a non-empty paragraph, with its 1-based position among all w:p
+# elements and its w14:paraId (None if absent) for reporting
+ParagraphFingerprint = namedtuple(
+    "ParagraphFingerprint", ["fingerprint", "number", "para_id", "text"]
+)
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False):
-        self.unpacked_dir = Path(unpacked_dir)
-        self.original_docx = Path(original_docx)
+    def __init__(
+        self, unpacked_dir, original_docx, verbose=False, original_document=None
+    ):
+        # Either may also be an OOXMLPackage (e.g. with parts set in memory)
+        self.unpacked_dir = unpacked_dir
+        self.original_docx = original_docx
         self.verbose = verbose
+        # Optional pre-parsed root of the original word/document.xml; when set,
+        # original_docx is never opened. It is not modified, so callers can
+        # reuse it across validations
+        self.original_document = original_document
         self.namespaces = {
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
 
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
-        # Verify unpacked directory exists and has correct structure
-        modified_file = self.unpacked_dir / "word" / "document.xml"
-        if not modified_file.exists():
+        # Verify unpacked directory (or packed document) has correct structure
+        try:
+            package = as_package(self.unpacked_dir)
+            has_document = "word/document.xml" in package
+        except (OSError, zipfile.BadZipFile):
+            has_document = False
+        if not has_document:
+            modified_dir = getattr(self.unpacked_dir, "path", self.unpacked_dir)
+            modified_file = Path(modified_dir) / "word" / "document.xml"
             print(f"FAILED - Modified document.xml not found at {modified_file}")
             return False
 
-        # First, check if there are any tracked changes by Claude to validate
+        # Parse the modified document once for both the quick check and the comparison
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-
-            # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
-                if self.verbose:
-                    print("PASSED - No tracked changes by Claude found.")
-                return True
-
-        except Exception:
-            # If we can't parse the XML, continue with full validation
-            pass
-
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
+            with package, package.open("word/document.xml") as part:
+                modified_root = ET.parse(part).getroot()
+        except ET.ParseError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+
+        # First, check if there are any tracked changes by Claude to validate
+        author_attr = f"{{{self.namespaces['w']}}}author"
+        has_claude_changes = any(
+            elem.get(author_attr) == "Claude"
+            for path in (".//w:del", ".//w:ins")
+            for elem in modified_root.iterfind(path, self.namespaces)
+        )
+
+        # Redlining validation is only needed if tracked changes by Claude have been used.
+        if not has_claude_changes:
+            if self.verbose:
+                print("PASSED - No tracked changes by Claude found.")
+            return True
+
+        if self.original_document is None:
+            # Read just word/document.xml from the original docx
             try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
+                with as_package(self.original_docx) as original_package:
+                    try:
+                        original_xml = original_package.read("word/document.xml")
+                    except KeyError:
+                        print(
+                            f"FAILED - Original document.xml not found in {original_package.path}"
+                        )
+                        return False
             except Exception as e:
                 print(f"FAILED - Error unpacking original docx: {e}")
                 return False
 
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
             try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
+                self.original_document = ET.fromstring(original_xml)
             except ET.ParseError as e:
                 print(f"FAILED - Error parsing XML files: {e}")
                 return False
 
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
+        # Work on a copy so the parsed baseline stays reusable
+        original_root = copy.deepcopy(self.original_document)
+
+        # Remove Claude's tracked changes from both documents
+        self._remove_claude_tracked_changes(original_root)
+        self._remove_claude_tracked_changes(modified_root)
+
+        # Compare paragraph fingerprints; only diverging paragraphs are diffed
+        original_paragraphs = self._paragraph_fingerprints(original_root)
+        modified_paragraphs = self._paragraph_fingerprints(modified_root)
+
+        if [p.fingerprint for p in original_paragraphs] != [
+            p.fingerprint for p in modified_paragraphs
+        ]:
+            # Show detailed character-level differences for each changed paragraph
+            error_message = self._generate_detailed_diff(
+                original_paragraphs, modified_paragraphs
+            )
+            print(error_message)
+            return False
 
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return True
 
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
-
-            if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
-            return True
-
-    def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+    def _generate_detailed_diff(self, original_paragraphs, modified_paragraphs):
+        """Generate detailed character-level differences between two paragraph lists."""
         error_parts = [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
@@ -127,92 +149,134 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
+        word_diff = self._get_word_diff(original_paragraphs, modified_paragraphs)
+        if word_diff:
+            error_parts.extend(["Differences:", "============", word_diff])
         else:
-            error_parts.append("Unable to generate word diff (git not available)")
+            error_parts.append("Unable to generate word diff")
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
+    def _get_word_diff(self, original_paragraphs, modified_paragraphs):
+        """Generate a git-style word diff ([-removed-]{+added+}) of changed paragraphs.
 
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
+        Paragraphs are matched by fingerprint, so only the changed ones are
+        diffed character by character. Each changed region is preceded by the
+        paragraph number and paraId it starts at. Paragraphs too long for a
+        character diff are diffed word by word instead. The output is capped at
+        MAX_DIFF_PARAGRAPHS changed regions, and each region at
+        MAX_HUNK_PARAGRAPHS paragraphs and MAX_HUNK_CHARS characters per side.
+        """
+        original_prints = [p.fingerprint for p in original_paragraphs]
+        modified_prints = [p.fingerprint for p in modified_paragraphs]
+
+        # Most paragraphs are untouched; trim the common head and tail before
+        # matching so long documents only pay for the region that changed
+        start = 0
+        limit = min(len(original_prints), len(modified_prints))
+        while start < limit and original_prints[start] == modified_prints[start]:
+            start += 1
+        end = 0
+        while (
+            end < limit - start
+            and original_prints[-1 - end] == modified_prints[-1 - end]
+        ):
+            end += 1
+
+        matcher = difflib.SequenceMatcher(
+            None,
+            original_prints[start : len(original_prints) - end],
+            modified_prints[start : len(modified_prints) - end],
+            autojunk=False,
+        )
+        hunks = [
+            (
+                original_paragraphs[start + i1 : start + i2],
+                modified_paragraphs[start + j1 : start + j2],
+            )
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+            if tag != "equal"
+        ]
 
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
+        content_lines = []
+        for old, new in hunks[:MAX_DIFF_PARAGRAPHS]:
+            old_text, old_omitted = self._hunk_text(old)
+            new_text, new_omitted = self._hunk_text(new)
+            if not old:
+                diff = "\n".join(f"{{+{line}+}}" for line in new_text.split("\n"))
+            elif not new:
+                diff = "\n".join(f"[-{line}-]" for line in old_text.split("\n"))
+            else:
+                diff = self._diff_paragraphs(old_text, new_text)
+            content_lines.append(self._describe_region(old, new))
+            # Like git -U0, show only non-blank changed lines
+            content_lines.extend(line for line in diff.split("\n") if line.strip())
+            for side, omitted in (("original", old_omitted), ("modified", new_omitted)):
+                if omitted:
+                    content_lines.append(f"... {omitted} of the {side} text not shown")
+
+        if len(hunks) > MAX_DIFF_PARAGRAPHS:
+            content_lines.append(
+                f"... and {len(hunks) - MAX_DIFF_PARAGRAPHS} more changed regions"
+            )
+
+        return "\n".join(content_lines) or None
+
+    def _hunk_text(self, paragraphs):
+        """Join one side of a changed region for diffing, within the per-region caps.
+
+        Returns:
+            tuple: (text, omitted) where omitted describes what was left out
+                (e.g. "12 more paragraphs"), or None if nothing was
+        """
+        shown = paragraphs[:MAX_HUNK_PARAGRAPHS]
+        text = "\n".join(p.text for p in shown)
+        omitted = []
+        if len(paragraphs) > len(shown):
+            omitted.append(f"{len(paragraphs) - len(shown)} more paragraphs")
+        if len(text) > MAX_HUNK_CHARS:
+            omitted.insert(0, f"{len(text) - MAX_HUNK_CHARS} more characters")
+            text = text[:MAX_HUNK_CHARS]
+        return text, " and ".join(omitted) or None
+
+    def _describe_region(self, old, new):
+        """Get a hunk header like '@@ paragraphs 12-13 (paraId 1A2B3C4D) @@'."""
+        # Locate insertions and edits in the modified document, deletions in the original
+        paragraphs, label = (new, "paragraph") if new else (old, "original paragraph")
+        first, last = paragraphs[0], paragraphs[-1]
+        if first is last:
+            location = f"{label} {first.number}"
+        else:
+            location = f"{label}s {first.number}-{last.number}"
+        if first.para_id:
+            location += f" (paraId {first.para_id})"
+        return f"@@ {location} @@"
 
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
+    def _diff_paragraphs(self, old, new):
+        """Mark up the differences between two changed paragraphs inline.
 
-        return None
+        Diffs character by character, falling back to words for paragraphs
+        longer than MAX_CHAR_DIFF_LENGTH.
+        """
+        if len(old) + len(new) > MAX_CHAR_DIFF_LENGTH:
+            old_tokens = re.findall(r"\s+|\w+|[^\w\s]", old)
+            new_tokens = re.findall(r"\s+|\w+|[^\w\s]", new)
+        else:
+            old_tokens, new_tokens = old, new
+
+        parts = []
+        matcher = difflib.SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            removed = "".join(old_tokens[i1:i2])
+            added = "".join(new_tokens[j1:j2])
+            if tag == "equal":
+                parts.append(removed)
+                continue
+            if removed:
+                parts.append(f"[-{removed}-]")
+            if added:
+                parts.append(f"{{+{added}+}}")
+        return "".join(parts)
 
     def _remove_claude_tracked_changes(self, root):
         """Remove tracked changes authored by Claude from the XML root."""
@@ -251,28 +315,40 @@ class RedliningValidator:
                     parent.insert(del_index, child)
                 parent.remove(del_elem)
 
-    def _extract_text_content(self, root):
-        """Extract text content from Word XML, preserving paragraph structure.
+    def _paragraph_fingerprints(self, root):
+        """Fingerprint the text of each non-empty paragraph in document order.
 
         Empty paragraphs are skipped to avoid false positives when tracked
-        insertions add only structural elements without text content.
+        insertions add only structural elements without text content. The
+        fingerprint covers the text only; the paragraph number and
+        w14:paraId are kept to report where a mismatch is.
+
+        Returns:
+            list: ParagraphFingerprint tuples
         """
         p_tag = f"{{{self.namespaces['w']}}}p"
         t_tag = f"{{{self.namespaces['w']}}}t"
 
         paragraphs = []
-        for p_elem in root.findall(f".//{p_tag}"):
+        for number, p_elem in enumerate(root.iter(p_tag), start=1):
             # Get all text elements within this paragraph
-            text_parts = []
-            for t_elem in p_elem.findall(f".//{t_tag}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            paragraph_text = "".join(text_parts)
+            paragraph_text = "".join(
+                t_elem.text for t_elem in p_elem.iter(t_tag) if t_elem.text
+            )
             # Skip empty paragraphs - they don't affect content validation
             if paragraph_text:
-                paragraphs.append(paragraph_text)
+                paragraphs.append(
+                    ParagraphFingerprint(
+                        hashlib.blake2b(
+                            paragraph_text.encode("utf-8"), digest_size=16
+                        ).digest(),
+                        number,
+                        p_elem.get(PARA_ID_ATTR),
+                        paragraph_text,
+                    )
+                )
 
-        return "\n".join(paragraphs)
+        return paragraphs
 
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+"""
+Persistent cache of per-part XSD validation results shared across runs.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+# Default upper bound on the size of cached results before old entries are evicted
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Number of inserts between checks of the cache size
+EVICTION_INTERVAL = 64
+
+
+def default_cache_file():
+    """Get the default location of the result cache database.
+
+    Uses $XDG_CACHE_HOME when set and ~/.cache otherwise.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "ooxml-validation" / "results.sqlite3"
+
+
+class ResultCache:
+    """On-disk, size-bounded LRU cache of XSD validation results.
+
+    Entries map a key string (built by the validator from the part's content
+    hash, the schema path and a hash of the schema files, and the validator
+    version) to an (is_valid, errors) result.
+    The cache is best effort: any database error is treated as a miss, so a
+    locked or corrupt cache never fails a validation.
+    """
+
+    def __init__(self, cache_file, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_file = Path(cache_file)
+        self.max_bytes = max_bytes
+        self._connection = None
+        self._puts_until_eviction = 0
+
+    def _connect(self):
+        if self._connection is None:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit; several XSD worker processes may share the database
+            self._connection = sqlite3.connect(
+                str(self.cache_file), timeout=30, isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, is_valid INTEGER NOT NULL, "
+                "errors TEXT NOT NULL, size INTEGER NOT NULL, "
+                "last_used REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+            )
+        return self._connection
+
+    def get(self, key):
+        """Get a cached (is_valid, errors_set) result, or None on a miss."""
+        try:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT is_valid, errors FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            return bool(row[0]), set(json.loads(row[1]))
+        except (sqlite3.Error, OSError, ValueError):
+            return None
+
+    def put(self, key, is_valid, errors):
+        """Store a result, periodically evicting least recently used entries.
+
+        The size budget is checked every EVICTION_INTERVAL inserts.
+        """
+        errors_json = json.dumps(sorted(errors))
+        size = len(key) + len(errors_json)
+        try:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (key, int(is_valid), errors_json, size, time.time()),
+            )
+            if self._puts_until_eviction <= 0:
+                self._evict()
+                self._puts_until_eviction = EVICTION_INTERVAL
+            self._puts_until_eviction -= 1
+        except (sqlite3.Error, OSError):
+            pass
+
+    def _evict(self):
+        """Drop the least recently used entries until the cache fits its budget."""
+        connection = self._connect()
+        total = connection.execute("SELECT SUM(size) FROM results").fetchone()[0]
+        if not total or total <= self.max_bytes:
+            return
+
+        # Trim to 90% of the budget so eviction doesn't run on every insert
+        excess = total - int(self.max_bytes * 0.9)
+        stale_keys = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM results ORDER BY last_used"
+        ):
+            if excess <= 0:
+                break
+            stale_keys.append((key,))
+            excess -= size
+        connection.executemany("DELETE FROM results WHERE key = ?", stale_keys)
+
+    def close(self):
+        """Close the database connection (reopened on next use)."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -34,11 +34,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from defusedxml import minidom
-from ooxml.scripts.pack import pack_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
+from ooxml.scripts.validation.package import OOXMLPackage
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import LxmlXMLEditor, XMLEditor, _edits_dom
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
@@ -56,6 +56,10 @@ class DocxXMLEditor(XMLEditor):
         dom (defusedxml.minidom.Document): The DOM document for direct manipulation
     """
 
+    # Methods usable in apply_edits(), with and without an XML fragment argument
+    FRAGMENT_EDITS = ("replace_node", "insert_after", "insert_before", "append_to")
+    ELEMENT_EDITS = ("suggest_deletion", "revert_insertion", "revert_deletion")
+
     def __init__(
         self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
     ):
@@ -72,11 +76,19 @@ class DocxXMLEditor(XMLEditor):
         self.author = author
         self.initials = initials
 
+        # Shared date and change ID counter while apply_edits() runs
+        self._batch = None
+
     def _get_next_change_id(self):
         """Get the next available change ID by checking all tracked change elements."""
+        if self._batch is not None:
+            change_id = self._batch["next_change_id"]
+            self._batch["next_change_id"] += 1
+            return change_id
+
         max_id = -1
         for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
+            elements = self._get_elements_by_tag(tag)
             for elem in elements:
                 change_id = elem.getAttribute("w:id")
                 if change_id:
@@ -88,30 +100,21 @@ class DocxXMLEditor(XMLEditor):
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16du",
-                "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
-            )
+        self._declare_root_namespace(
+            "w16du", "http://schemas.microsoft.com/office/word/2023/wordml/word16du"
+        )
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16cex",
-                "http://schemas.microsoft.com/office/word/2018/wordml/cex",
-            )
+        self._declare_root_namespace(
+            "w16cex", "http://schemas.microsoft.com/office/word/2018/wordml/cex"
+        )
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w14"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w14",
-                "http://schemas.microsoft.com/office/word/2010/wordml",
-            )
+        self._declare_root_namespace(
+            "w14", "http://schemas.microsoft.com/office/word/2010/wordml"
+        )
 
     def _inject_attributes_to_nodes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
@@ -129,12 +132,15 @@ class DocxXMLEditor(XMLEditor):
         """
         from datetime import datetime, timezone
 
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        if self._batch is not None:
+            timestamp = self._batch["timestamp"]
+        else:
+            timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        def is_inside_deletion(elem):
-            """Check if element is inside a w:del element."""
+        def is_inside_deletion(elem, stop=None):
+            """Check if element is inside a w:del element (below stop, if given)."""
             parent = elem.parentNode
-            while parent:
+            while parent and parent is not stop:
                 if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:del":
                     return True
                 parent = parent.parentNode
@@ -155,9 +161,9 @@ class DocxXMLEditor(XMLEditor):
                 self._ensure_w14_namespace()
                 elem.setAttribute("w14:textId", _generate_hex_id())
 
-        def add_rsid_to_r(elem):
+        def add_rsid_to_r(elem, in_deletion):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
-            if is_inside_deletion(elem):
+            if in_deletion:
                 if not elem.hasAttribute("w:rsidDel"):
                     elem.setAttribute("w:rsidDel", self.rsid)
             else:
@@ -168,6 +174,15 @@ class DocxXMLEditor(XMLEditor):
             # Auto-assign w:id if not present
             if not elem.hasAttribute("w:id"):
                 elem.setAttribute("w:id", str(self._get_next_change_id()))
+            elif self._batch is not None:
+                # Keep the batch's counter past IDs given in the fragments
+                batch = self._batch
+                try:
+                    batch["next_change_id"] = max(
+                        batch["next_change_id"], int(elem.getAttribute("w:id")) + 1
+                    )
+                except ValueError:
+                    pass
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
@@ -208,11 +223,15 @@ class DocxXMLEditor(XMLEditor):
             if node.nodeType != node.ELEMENT_NODE:
                 continue
 
+            # Whether the node is inside a w:del; its descendants then only need
+            # to look for one up to the node
+            node_in_deletion = is_inside_deletion(node)
+
             # Handle the node itself
             if node.tagName == "w:p":
                 add_rsid_to_p(node)
             elif node.tagName == "w:r":
-                add_rsid_to_r(node)
+                add_rsid_to_r(node, node_in_deletion)
             elif node.tagName == "w:t":
                 add_xml_space_to_t(node)
             elif node.tagName in ("w:ins", "w:del"):
@@ -226,7 +245,12 @@ class DocxXMLEditor(XMLEditor):
             for elem in node.getElementsByTagName("w:p"):
                 add_rsid_to_p(elem)
             for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
+                add_rsid_to_r(
+                    elem,
+                    node_in_deletion
+                    or node.tagName == "w:del"
+                    or is_inside_deletion(elem, stop=node),
+                )
             for elem in node.getElementsByTagName("w:t"):
                 add_xml_space_to_t(elem)
             for tag in ("w:ins", "w:del"):
@@ -237,30 +261,108 @@ class DocxXMLEditor(XMLEditor):
             for elem in node.getElementsByTagName("w16cex:commentExtensible"):
                 add_comment_extensible_date(elem)
 
+        # Re-file the nodes under the attribute values just set
+        self._index_nodes(nodes)
+
+    @_edits_dom
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
         nodes = super().replace_node(elem, new_content)
         self._inject_attributes_to_nodes(nodes)
         return nodes
 
+    @_edits_dom
     def insert_after(self, elem, xml_content):
         """Insert after with automatic attribute injection."""
         nodes = super().insert_after(elem, xml_content)
         self._inject_attributes_to_nodes(nodes)
         return nodes
 
+    @_edits_dom
     def insert_before(self, elem, xml_content):
         """Insert before with automatic attribute injection."""
         nodes = super().insert_before(elem, xml_content)
         self._inject_attributes_to_nodes(nodes)
         return nodes
 
+    @_edits_dom
     def append_to(self, elem, xml_content):
         """Append to with automatic attribute injection."""
         nodes = super().append_to(elem, xml_content)
         self._inject_attributes_to_nodes(nodes)
         return nodes
 
+    @_edits_dom
+    def apply_edits(self, edits):
+        """Apply a list of edits in one pass.
+
+        Each edit is a tuple naming an editing method followed by its arguments:
+            ("replace_node", elem, xml), ("insert_after", elem, xml),
+            ("insert_before", elem, xml), ("append_to", elem, xml),
+            ("suggest_deletion", elem), ("revert_insertion", elem),
+            ("revert_deletion", elem)
+
+        All XML fragments are parsed together in one wrapper document, and the
+        whole batch shares one date and a running change ID counter, so the
+        cost grows linearly with the number of edits. Edits run in order;
+        operations and fragments are checked before anything is changed.
+
+        Args:
+            edits: List of edit tuples
+
+        Returns:
+            list: The return value of each edit, in order
+
+        Raises:
+            ValueError: If an edit is not a tuple naming a known method, or has
+                the wrong arguments
+
+        Example:
+            editor = doc["word/document.xml"]
+            editor.apply_edits(
+                [("suggest_deletion", run) for run in runs_to_delete]
+                + [("insert_after", para, new_para_xml)]
+            )
+        """
+        edits = list(edits)
+        for edit in edits:
+            if not isinstance(edit, (tuple, list)) or not edit:
+                raise ValueError(f"Edits must be non-empty tuples, got {edit!r}")
+            if not isinstance(edit[0], str):
+                raise ValueError(f"Edits must start with a method name, got {edit!r}")
+            if edit[0] in self.FRAGMENT_EDITS:
+                arity = 3
+            elif edit[0] in self.ELEMENT_EDITS:
+                arity = 2
+            else:
+                raise ValueError(f"Unknown edit: {edit[0]}")
+            if len(edit) != arity:
+                raise ValueError(f"{edit[0]} edits take {arity - 1} argument(s)")
+            if arity == 3 and not isinstance(edit[2], str):
+                raise ValueError(f"{edit[0]} edits take an XML string as last item")
+
+        fragments = iter(
+            self._parse_fragments(
+                [edit[2] for edit in edits if edit[0] in self.FRAGMENT_EDITS]
+            )
+        )
+
+        self._batch = {
+            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "next_change_id": self._get_next_change_id(),
+        }
+        try:
+            results = []
+            for operation, elem, *_ in edits:
+                if operation in self.FRAGMENT_EDITS:
+                    results.append(getattr(self, operation)(elem, next(fragments)))
+                else:
+                    results.append(getattr(self, operation)(elem))
+            return results
+        finally:
+            self._batch = None
+
+    @_edits_dom
     def revert_insertion(self, elem):
         """Reject an insertion by wrapping its content in a deletion.
 
@@ -318,14 +420,7 @@ class DocxXMLEditor(XMLEditor):
                     run.setAttribute("w:rsidDel", self.rsid)
 
                 for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while t_elem.firstChild:
-                        del_text.appendChild(t_elem.firstChild)
-                    for i in range(t_elem.attributes.length):
-                        attr = t_elem.attributes.item(i)
-                        del_text.setAttribute(attr.name, attr.value)
-                    t_elem.parentNode.replaceChild(del_text, t_elem)
+                    self._rename_element(t_elem, "w:delText")
 
             # Move all children from ins to del wrapper
             while ins_elem.firstChild:
@@ -339,6 +434,7 @@ class DocxXMLEditor(XMLEditor):
 
         return [elem]
 
+    @_edits_dom
     def revert_deletion(self, elem):
         """Reject a deletion by re-inserting the deleted content.
 
@@ -399,14 +495,7 @@ class DocxXMLEditor(XMLEditor):
 
                 # Convert w:delText → w:t
                 for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while del_text.firstChild:
-                        t_elem.appendChild(del_text.firstChild)
-                    for i in range(del_text.attributes.length):
-                        attr = del_text.attributes.item(i)
-                        t_elem.setAttribute(attr.name, attr.value)
-                    del_text.parentNode.replaceChild(t_elem, del_text)
+                    self._rename_element(del_text, "w:t")
 
                 # Update run attributes: w:rsidDel → w:rsidR
                 if new_run.hasAttribute("w:rsidDel"):
@@ -418,7 +507,7 @@ class DocxXMLEditor(XMLEditor):
                 ins_elem.appendChild(new_run)
 
             # Insert the new insertion after the deletion
-            nodes = self.insert_after(del_elem, ins_elem.toxml())
+            nodes = self.insert_after(del_elem, [ins_elem])
 
             # If processing a single w:del, track the created insertion
             if is_single_del and nodes:
@@ -479,6 +568,7 @@ class DocxXMLEditor(XMLEditor):
 
         return para.toxml()
 
+    @_edits_dom
     def suggest_deletion(self, elem):
         """Mark a w:r or w:p element as deleted with tracked changes (in-place DOM manipulation).
 
@@ -502,15 +592,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Convert w:t → w:delText
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
+                self._rename_element(t_elem, "w:delText")
 
             # Update run attributes: w:rsidR → w:rsidDel
             if elem.hasAttribute("w:rsidR"):
@@ -559,15 +641,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Convert w:t → w:delText in all runs
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
+                self._rename_element(t_elem, "w:delText")
 
             # Update run attributes: w:rsidR → w:rsidDel
             for run in elem.getElementsByTagName("w:r"):
@@ -587,12 +661,27 @@ class DocxXMLEditor(XMLEditor):
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
+            # Index the new w:pPr/w:rPr/w:del marker too
+            self._index_nodes([elem])
+
             return elem
 
         else:
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
+class LxmlDocxXMLEditor(DocxXMLEditor, LxmlXMLEditor):
+    """DocxXMLEditor on the lxml engine (see LxmlXMLEditor).
+
+    Attributes:
+        dom: minidom Document stand-in holding the lxml tree
+    """
+
+
+# XML editor class for each Document engine
+EDITOR_ENGINES = {"minidom": DocxXMLEditor, "lxml": LxmlDocxXMLEditor}
+
+
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
@@ -604,6 +693,12 @@ def _generate_hex_id() -> str:
     return f"{random.randint(1, 0x7FFFFFFE):08X}"
 
 
+def _file_stat(path):
+    """Get the size and modification time of a file, which change when it is written."""
+    stat = path.stat()
+    return (stat.st_size, stat.st_mtime_ns)
+
+
 def _generate_rsid() -> str:
     """Generate random 8-character hex RSID."""
     return "".join(random.choices("0123456789ABCDEF", k=8))
@@ -619,6 +714,7 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        engine="minidom",
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -630,22 +726,23 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            engine: XML editor engine, "minidom" (default) or "lxml". lxml uses
+                far less memory and saves faster on large documents.
         """
+        if engine not in EDITOR_ENGINES:
+            raise ValueError(f"Unknown engine: {engine}")
+        self.engine = engine
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
-        # Create temporary directory with subdirectories for unpacked content and baseline
+        # Temporary workspace layered over the original directory: it only holds
+        # the parts opened by editors and files added to it (see _workspace_file)
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
-
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
-
         self.word_path = self.unpacked_path / "word"
+        self.word_path.mkdir(parents=True)
 
         # Generate RSID if not provided
         self.rsid = rsid if rsid else _generate_rsid()
@@ -658,6 +755,25 @@ class Document:
         # Cache for lazy-loaded editors
         self._editors = {}
 
+        # Size and modification time of workspace files as copied from or last
+        # saved to the original directory; other files are saved (see _changed_files)
+        self._workspace_stats = {}
+
+        # Parts the editors wrote to the workspace since the last in-place save
+        self._changed_parts = set()
+
+        # Original directory as it was when the Document was created, the baseline
+        # for validation. Opened on first use (see _get_baseline)
+        self._baseline = None
+
+        # Part digests from the last successful schema validation, so repeated
+        # validate() calls only re-check parts that changed since
+        self._validation_manifest = {}
+
+        # Parsed baseline word/document.xml, read from the baseline on the
+        # first redlining validation and reused by later ones
+        self._original_document = None
+
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
         self.comments_extended_path = self.word_path / "commentsExtended.xml"
@@ -701,11 +817,11 @@ class Document:
             comment = doc["word/comments.xml"].get_node(tag="w:comment", attrs={"w:id": "0"})
         """
         if xml_path not in self._editors:
-            file_path = self.unpacked_path / xml_path
+            file_path = self._workspace_file(xml_path)
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
             # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
+            self._editors[xml_path] = EDITOR_ENGINES[self.engine](
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
             )
         return self._editors[xml_path]
@@ -843,17 +959,26 @@ class Document:
             ValueError: If validation fails.
         """
         # Create validators with current state
+        package = self._workspace_package()
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            package,
+            self._get_baseline(),
+            verbose=False,
+            manifest=self._validation_manifest,
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            package,
+            self._get_baseline(),
+            verbose=False,
+            original_document=self._original_document,
         )
 
         # Run validations
         if not schema_validator.validate():
             raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
+        redlining_valid = redlining_validator.validate()
+        self._original_document = redlining_validator.original_document
+        if not redlining_valid:
             raise ValueError("Redlining validation failed")
 
     def save(self, destination=None, validate=True) -> None:
@@ -861,33 +986,104 @@ class Document:
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Only the parts changed through the editors are serialized. When saving
+        back to the original directory, only those parts and the files added
+        or replaced in unpacked_path (e.g. images) are written; other
+        destinations get a full copy of the document.
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
         """
         # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
+        if self._exists(self.comments_path):
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
 
         # Save all modified XML files in temp directory
-        for editor in self._editors.values():
-            editor.save()
+        for xml_path, editor in self._editors.items():
+            if editor.save():
+                self._changed_parts.add(Path(xml_path).as_posix())
 
         # Validate by default
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
+        # Write the original directory with the changed workspace files on top
+        package = self._workspace_package()
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        if target_path.resolve() != self.original_path.resolve():
+            package.write(target_path)
+            return
+
+        # Keep the baseline as it was before the parts are overwritten or added
+        baseline = self._get_baseline()
+        changed_names = sorted(package.dirty)
+        added_names = []
+        for name in changed_names:
+            if name in baseline.dirty or name in baseline.removed:
+                continue
+            if name in baseline:
+                baseline.set_part(name, baseline.read(name))
+            else:
+                added_names.append(name)
+        package.write()
+        for name in added_names:
+            baseline.remove_part(name)
+
+        for name in changed_names:
+            self._workspace_stats[name] = _file_stat(self.unpacked_path / name)
+        self._changed_parts.clear()
+
+    # ==================== Private: Workspace ====================
+
+    def _workspace_file(self, xml_path):
+        """Get the workspace path of a file, copied from the original directory first.
+
+        Files are copied on first use, so only the parts opened by editors are
+        ever read from the original directory.
+        """
+        path = self.unpacked_path / xml_path
+        original = self.original_path / xml_path
+        if not path.exists() and original.is_file():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(original, path)
+            self._workspace_stats[Path(xml_path).as_posix()] = _file_stat(path)
+        return path
+
+    def _exists(self, path):
+        """Check if a workspace file exists here or in the original directory."""
+        relative_path = path.relative_to(self.unpacked_path)
+        return path.exists() or (self.original_path / relative_path).is_file()
+
+    def _changed_files(self):
+        """Get the part names of the workspace files that differ from the originals."""
+        changed = set(self._changed_parts)
+        for path in self.unpacked_path.rglob("*"):
+            if path.is_file():
+                name = path.relative_to(self.unpacked_path).as_posix()
+                if self._workspace_stats.get(name) != _file_stat(path):
+                    changed.add(name)
+        return changed
+
+    def _workspace_package(self):
+        """Get the original directory as a package with the changed files set."""
+        package = OOXMLPackage(self.original_path)
+        for name in sorted(self._changed_files()):
+            package.set_part(name, (self.unpacked_path / name).read_bytes())
+        return package
+
+    def _get_baseline(self):
+        """Get the original directory as a package, as it was before any save."""
+        if self._baseline is None:
+            self._baseline = OOXMLPackage(self.original_path)
+        return self._baseline
 
     # ==================== Private: Initialization ====================
 
     def _get_next_comment_id(self):
         """Get the next available comment ID."""
-        if not self.comments_path.exists():
+        if not self._exists(self.comments_path):
             return 0
 
         editor = self["word/comments.xml"]
@@ -903,7 +1099,7 @@ class Document:
 
     def _load_existing_comments(self):
         """Load existing comments from files to enable replies."""
-        if not self.comments_path.exists():
+        if not self._exists(self.comments_path):
             return {}
 
         editor = self["word/comments.xml"]
@@ -953,7 +1149,7 @@ class Document:
 
     def _update_people_xml(self, path):
         """Create people.xml if it doesn't exist."""
-        if not path.exists():
+        if not self._exists(path):
             # Copy from template
             shutil.copy(TEMPLATE_DIR / "people.xml", path)
 
@@ -1069,7 +1265,7 @@ class Document:
         self, comment_id, para_id, text, author, initials, timestamp
     ):
         """Add a single comment to comments.xml."""
-        if not self.comments_path.exists():
+        if not self._exists(self.comments_path):
             shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
 
         editor = self["word/comments.xml"]
@@ -1090,7 +1286,7 @@ class Document:
 
     def _add_to_comments_extended_xml(self, para_id, parent_para_id):
         """Add a single comment to commentsExtended.xml."""
-        if not self.comments_extended_path.exists():
+        if not self._exists(self.comments_extended_path):
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
             )
@@ -1106,7 +1302,7 @@ class Document:
 
     def _add_to_comments_ids_xml(self, para_id, durable_id):
         """Add a single comment to commentsIds.xml."""
-        if not self.comments_ids_path.exists():
+        if not self._exists(self.comments_ids_path):
             shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
 
         editor = self["word/commentsIds.xml"]
@@ -1117,7 +1313,7 @@ class Document:
 
     def _add_to_comments_extensible_xml(self, durable_id):
         """Add a single comment to commentsExtensible.xml."""
-        if not self.comments_extensible_path.exists():
+        if not self._exists(self.comments_extensible_path):
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
             )
@@ -1183,7 +1379,7 @@ class Document:
         people_path = self.word_path / "people.xml"
 
         # people.xml should already exist from _setup_tracking
-        if not people_path.exists():
+        if not self._exists(people_path):
             raise ValueError("people.xml should exist after _setup_tracking")
 
         editor = self["word/people.xml"]
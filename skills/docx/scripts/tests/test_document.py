@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Tests for the Document class in document.py.
+
+Documents are opened on both engines ("minidom" and "lxml") unless a test
+is about something engine independent.
+"""
+
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the docx skill directory to path to import the scripts package
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.document import EDITOR_ENGINES, Document
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+# Minimal unpacked document
+PARTS = {
+    "[Content_Types].xml": """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+  <Default Extension="xml" ContentType="application/xml"/>
+  <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+  <Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>
+</Types>""",
+    "_rels/.rels": """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>""",
+    "word/_rels/document.xml.rels": """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings" Target="settings.xml"/>
+</Relationships>""",
+    "word/settings.xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:settings {W}>
+  <w:defaultTabStop w:val="720"/>
+  <w:compat/>
+</w:settings>""",
+    "word/document.xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document {W}>
+  <w:body>
+    <w:p><w:r><w:t>First paragraph</w:t></w:r></w:p>
+    <w:p><w:r><w:t>Second paragraph</w:t></w:r></w:p>
+  </w:body>
+</w:document>""",
+}
+
+# Attributes whose values differ between two runs of the same edits
+VARYING_ATTRIBUTES = r'(w:date|w16du:dateUtc|w14:paraId|w14:textId)="[^"]*"'
+
+
+class DocumentTestCase(unittest.TestCase):
+    """Base class writing PARTS to an unpacked directory."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+        self.unpacked = self.write_unpacked("unpacked")
+
+    def write_unpacked(self, name):
+        """Write PARTS to a new directory in the temp directory and return it."""
+        unpacked = self.temp_path / name
+        for part_name, content in PARTS.items():
+            path = unpacked / part_name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+        return unpacked
+
+    def open_document(self, engine="minidom"):
+        return Document(self.unpacked, engine=engine, rsid="00AB12CD")
+
+    def modification_times(self):
+        return {
+            path.relative_to(self.unpacked).as_posix(): path.stat().st_mtime_ns
+            for path in self.unpacked.rglob("*")
+            if path.is_file()
+        }
+
+
+class TestSave(DocumentTestCase):
+    """save() must write back only the parts that changed."""
+
+    def test_unchanged_parts_not_written(self):
+        before = self.modification_times()
+        doc = self.open_document()
+        doc["word/document.xml"].get_node(tag="w:p", contains="First")
+        doc.save(validate=False)
+        after = self.modification_times()
+
+        written = {name for name in after if before.get(name) != after[name]}
+        # Document adds people.xml and registers it, and puts its RSID in settings
+        self.assertEqual(
+            written,
+            {
+                "[Content_Types].xml",
+                "word/_rels/document.xml.rels",
+                "word/people.xml",
+                "word/settings.xml",
+            },
+        )
+
+    def test_editor_save_skips_clean_parts(self):
+        for engine in EDITOR_ENGINES:
+            with self.subTest(engine=engine):
+                doc = self.open_document(engine)
+                editor = doc["word/document.xml"]
+                self.assertFalse(editor.save())
+                paragraph = editor.get_node(tag="w:p", contains="First")
+                # Changes made directly on the DOM count too
+                paragraph.setAttribute("w:rsidR", "00AB12CD")
+                self.assertTrue(editor.save())
+                self.assertFalse(editor.save())
+
+    def test_lxml_native_edits_saved(self):
+        doc = self.open_document("lxml")
+        paragraph = doc["word/document.xml"].get_node(tag="w:p", contains="First")
+        # Changed through lxml's own API, which the editor doesn't count
+        paragraph.set(
+            "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}rsidR",
+            "00AB12CD",
+        )
+        doc.save(validate=False)
+
+        self.assertIn(
+            '<w:p w:rsidR="00AB12CD">',
+            (self.unpacked / "word" / "document.xml").read_text(encoding="utf-8"),
+        )
+
+    def test_changed_and_added_files_written(self):
+        doc = self.open_document()
+        editor = doc["word/document.xml"]
+        editor.insert_after(
+            editor.get_node(tag="w:p", contains="Second"),
+            "<w:p><w:r><w:t>Third paragraph</w:t></w:r></w:p>",
+        )
+        (doc.unpacked_path / "word" / "media").mkdir()
+        (doc.unpacked_path / "word" / "media" / "image1.png").write_bytes(b"png")
+        doc.save(validate=False)
+
+        self.assertIn(
+            "Third paragraph",
+            (self.unpacked / "word" / "document.xml").read_text(encoding="utf-8"),
+        )
+        self.assertEqual(
+            (self.unpacked / "word" / "media" / "image1.png").read_bytes(), b"png"
+        )
+
+    def test_workspace_holds_opened_parts(self):
+        doc = self.open_document()
+        self.assertFalse((doc.unpacked_path / "_rels" / ".rels").exists())
+        self.assertTrue((doc.unpacked_path / "word" / "document.xml").is_file())
+
+    def test_baseline_kept_after_save(self):
+        doc = self.open_document()
+        editor = doc["word/document.xml"]
+        editor.replace_node(
+            editor.get_node(tag="w:t", contains="First"), "<w:t>Changed</w:t>"
+        )
+        doc.save(validate=False)
+
+        baseline = doc._get_baseline()
+        content = baseline.read("word/document.xml").decode("utf-8")
+        self.assertIn("First paragraph", content)
+        self.assertNotIn("Changed", content)
+        # Parts added by the save are not part of the baseline
+        self.assertNotIn("word/people.xml", baseline)
+        self.assertNotIn("word/people.xml", baseline.names())
+
+    def test_save_to_destination(self):
+        destination = self.temp_path / "saved"
+        before = self.modification_times()
+        doc = self.open_document()
+        doc.save(destination, validate=False)
+
+        self.assertEqual(self.modification_times(), before)
+        self.assertEqual(
+            sorted(
+                path.relative_to(destination).as_posix()
+                for path in destination.rglob("*")
+                if path.is_file()
+            ),
+            sorted([*before, "word/people.xml"]),
+        )
+
+
+class TestRoundTrip(DocumentTestCase):
+    """Edits saved on either engine must read back the same way."""
+
+    def test_round_trip(self):
+        for engine in EDITOR_ENGINES:
+            with self.subTest(engine=engine):
+                self.unpacked = self.write_unpacked(engine)
+                doc = self.open_document(engine)
+                editor = doc["word/document.xml"]
+                editor.suggest_deletion(editor.get_node(tag="w:r", contains="Second"))
+                editor.insert_after(
+                    editor.get_node(tag="w:p", contains="First"),
+                    "<w:p><w:ins><w:r><w:t> Inserted </w:t></w:r></w:ins></w:p>",
+                )
+                doc.save(validate=False)
+
+                doc = self.open_document(engine)
+                editor = doc["word/document.xml"]
+                inserted = editor.get_node(tag="w:ins", contains="Inserted")
+                self.assertEqual(inserted.getAttribute("w:author"), "Claude")
+                t_elem = inserted.getElementsByTagName("w:t")[0]
+                self.assertEqual(t_elem.getAttribute("xml:space"), "preserve")
+                deleted = editor.get_node(tag="w:del", contains="Second")
+                self.assertEqual(len(deleted.getElementsByTagName("w:delText")), 1)
+                self.assertNotEqual(
+                    inserted.getAttribute("w:id"), deleted.getAttribute("w:id")
+                )
+
+
+
+class TestApplyEdits(DocumentTestCase):
+    """apply_edits() must match the editing methods and check edits first."""
+
+    def edits(self, editor):
+        first = editor.get_node(tag="w:p", contains="First")
+        second = editor.get_node(tag="w:r", contains="Second")
+        return [
+            ("insert_after", first, "<w:p><w:r><w:t>New</w:t></w:r></w:p>"),
+            ("suggest_deletion", second),
+            ("append_to", first, "<w:ins><w:r><w:t>More</w:t></w:r></w:ins>"),
+        ]
+
+    def test_matches_editing_methods(self):
+        for engine in EDITOR_ENGINES:
+            with self.subTest(engine=engine):
+                saved = []
+                for batch in (False, True):
+                    self.unpacked = self.write_unpacked(f"{engine}-{batch}")
+                    doc = self.open_document(engine)
+                    editor = doc["word/document.xml"]
+                    edits = self.edits(editor)
+                    if batch:
+                        editor.apply_edits(edits)
+                    else:
+                        for operation, *args in edits:
+                            getattr(editor, operation)(*args)
+                    editor.save()
+                    content = editor.xml_path.read_text(encoding="utf-8")
+                    # Dates may straddle a second, and paragraph IDs are random
+                    saved.append(re.sub(VARYING_ATTRIBUTES, "", content))
+                self.assertEqual(saved[0], saved[1])
+
+    def test_invalid_edits(self):
+        invalid_edits = {
+            "empty tuple": (),
+            "string": "suggest_deletion",
+            "method name only": ("suggest_deletion",),
+            "no method name": (0, "<w:p/>"),
+            "unknown method": ("delete", None),
+            "missing fragment": ("insert_after", None),
+            "extra argument": ("suggest_deletion", None, "<w:p/>"),
+            "parsed fragment": ("insert_after", None, []),
+        }
+        for engine in EDITOR_ENGINES:
+            doc = self.open_document(engine)
+            editor = doc["word/document.xml"]
+            edits = self.edits(editor)
+            indexes = editor._get_indexes()
+            for name, invalid_edit in invalid_edits.items():
+                with self.subTest(engine=engine, edit=name):
+                    with self.assertRaises(ValueError):
+                        editor.apply_edits([*edits, invalid_edit])
+                    # Nothing was changed, so the indexes are still valid
+                    self.assertIs(editor._get_indexes(), indexes)
+                    self.assertFalse(editor.save())
+
+    def test_invalid_fragment(self):
+        for engine in EDITOR_ENGINES:
+            with self.subTest(engine=engine):
+                doc = self.open_document(engine)
+                editor = doc["word/document.xml"]
+                edits = self.edits(editor)
+                first = edits[0][1]
+                with self.assertRaises(Exception):
+                    editor.apply_edits([*edits, ("insert_before", first, "<w:p>")])
+                self.assertFalse(editor.save())
+
+
+if __name__ == "__main__":
+    unittest.main()
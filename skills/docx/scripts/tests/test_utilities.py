@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Tests for the XML editors in utilities.py.
+
+Every test runs on both engines: XMLEditor (minidom) and LxmlXMLEditor.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path to import utilities
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utilities import FRAGMENT_CACHE_SIZE, LxmlXMLEditor, XMLEditor
+
+ENGINES = {"minidom": XMLEditor, "lxml": LxmlXMLEditor}
+
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body>
+    <w:p w:id="1"><w:r><w:t>first</w:t></w:r></w:p>
+    <w:p w:id="2"><w:r><w:t>second</w:t></w:r></w:p>
+    <w:p w:id="3"><w:r><w:t>third</w:t></w:r></w:p>
+  </w:body>
+</w:document>"""
+
+
+class EditorTestCase(unittest.TestCase):
+    """Base class opening DOCUMENT in a fresh editor of each engine."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def open_editor(self, engine, content=DOCUMENT):
+        """Write content to a file and open it in an editor of the engine."""
+        path = Path(self.temp_dir.name) / f"{engine}.xml"
+        path.write_text(content, encoding="utf-8")
+        return ENGINES[engine](path)
+
+
+class TestDirectChanges(EditorTestCase):
+    """Lookups must see changes made to the DOM without the editor's methods."""
+
+    def test_set_attribute(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                editor = self.open_editor(engine)
+                # Build the attribute index first
+                editor.get_node(tag="w:p", attrs={"w:id": "1"})
+                second = editor.get_node(tag="w:p", attrs={"w:id": "2"})
+                second.setAttribute("w:id", "1")
+                with self.assertRaisesRegex(ValueError, "Multiple nodes found"):
+                    editor.get_node(tag="w:p", attrs={"w:id": "1"})
+                with self.assertRaisesRegex(ValueError, "Node not found"):
+                    editor.get_node(tag="w:p", attrs={"w:id": "2"})
+
+    def test_remove_attribute(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                editor = self.open_editor(engine)
+                third = editor.get_node(tag="w:p", attrs={"w:id": "3"})
+                third.removeAttribute("w:id")
+                with self.assertRaisesRegex(ValueError, "Node not found"):
+                    editor.get_node(tag="w:p", attrs={"w:id": "3"})
+
+    def test_append_and_remove_child(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                editor = self.open_editor(engine)
+                first = editor.get_node(tag="w:p", contains="first")
+                second = editor.get_node(tag="w:p", contains="second")
+                run = second.getElementsByTagName("w:r")[0]
+                second.removeChild(run)
+                first.appendChild(run)
+                self.assertIs(editor.get_node(tag="w:p", contains="second"), first)
+                self.assertIs(
+                    editor.get_node(tag="w:p", contains="firstsecond"), first
+                )
+
+    def test_new_element(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                editor = self.open_editor(engine)
+                body = editor.get_node(tag="w:body")
+                editor.get_node(tag="w:p", attrs={"w:id": "1"})
+                paragraph = editor.dom.createElement("w:p")
+                paragraph.setAttribute("w:id", "4")
+                body.appendChild(paragraph)
+                self.assertIs(
+                    editor.get_node(tag="w:p", attrs={"w:id": "4"}), paragraph
+                )
+                self.assertEqual(len(editor._get_elements_by_tag("w:p")), 4)
+
+    def test_text_data(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                editor = self.open_editor(engine)
+                editor.get_node(tag="w:p", contains="first")
+                text = editor.get_node(tag="w:t", contains="second").firstChild
+                text.data = "first again"
+                with self.assertRaisesRegex(ValueError, "Multiple nodes found"):
+                    editor.get_node(tag="w:p", contains="first")
+
+    def test_text_node_added(self):
+        editor = self.open_editor("minidom")
+        t_elem = editor.get_node(tag="w:t", contains="third")
+        t_elem.appendChild(editor.dom.createTextNode(" and more"))
+        self.assertIs(editor.get_node(tag="w:t", contains="third and more"), t_elem)
+
+    def test_attribute_nodes(self):
+        editor = self.open_editor("minidom")
+        first = editor.get_node(tag="w:p", attrs={"w:id": "1"})
+        first.getAttributeNode("w:id").value = "4"
+        self.assertIs(editor.get_node(tag="w:p", attrs={"w:id": "4"}), first)
+        second = editor.get_node(tag="w:p", attrs={"w:id": "2"})
+        del second.attributes["w:id"]
+        with self.assertRaisesRegex(ValueError, "Node not found"):
+            editor.get_node(tag="w:p", attrs={"w:id": "2"})
+        second.attributes["w:id"] = "5"
+        self.assertIs(editor.get_node(tag="w:p", attrs={"w:id": "5"}), second)
+        self.assertTrue(editor.save())
+
+    def test_editing_methods_keep_indexes(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                editor = self.open_editor(engine)
+                paragraph = editor.get_node(tag="w:p", attrs={"w:id": "1"})
+                indexes = editor._get_indexes()
+                editor.insert_after(
+                    paragraph, '<w:p w:id="5"><w:r><w:t>new</w:t></w:r></w:p>'
+                )
+                self.assertIs(editor._get_indexes(), indexes)
+                self.assertEqual(
+                    editor.get_node(tag="w:p", contains="new").getAttribute("w:id"), "5"
+                )
+
+
+
+class TestEngineParity(EditorTestCase):
+    """Both engines must save the same XML for the same edits."""
+
+    def edit(self, editor):
+        """Make a mix of edits through the editing methods and the DOM."""
+        first = editor.get_node(tag="w:p", attrs={"w:id": "1"})
+        second = editor.get_node(tag="w:p", attrs={"w:id": "2"})
+        third = editor.get_node(tag="w:p", attrs={"w:id": "3"})
+        editor.insert_after(first, '<w:p w:id="4"><w:r><w:t>new</w:t></w:r></w:p>')
+        editor.insert_before(first, "<w:bookmarkStart/>")
+        editor.append_to(editor.get_node(tag="w:body"), "<w:sectPr/>")
+        editor.replace_node(
+            second.getElementsByTagName("w:r")[0],
+            "<w:r><w:t>replaced</w:t></w:r><w:r><w:t>twice</w:t></w:r>",
+        )
+        # Fragments with text before, between and after their elements
+        t_elem = editor.get_node(tag="w:t", contains="third")
+        editor.append_to(t_elem, " and <w:br/>more")
+        editor.insert_after(t_elem.getElementsByTagName("w:br")[0], "x<w:tab/>y")
+        editor.insert_before(third.firstChild, "lead<w:bookmarkEnd/>tail")
+        third.setAttribute("w:id", "5")
+        third.removeAttribute("w:id")
+        editor.get_node(tag="w:t", contains="new").firstChild.data = "changed"
+
+    def test_saved_xml(self):
+        saved = {}
+        for engine in ENGINES:
+            editor = self.open_editor(engine)
+            self.edit(editor)
+            editor.save()
+            # The engines write the XML declaration differently
+            declaration, _, body = editor.xml_path.read_bytes().partition(b"?>")
+            saved[engine] = body.lstrip(b"\n")
+        self.assertEqual(saved["minidom"], saved["lxml"])
+        self.assertIn(b"<w:t>third and <w:br/>x<w:tab/>ymore</w:t>", saved["lxml"])
+        self.assertIn(b"lead<w:bookmarkEnd/>tail<w:r>", saved["lxml"])
+
+    def test_fragment_text(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                editor = self.open_editor(engine)
+                t_elem = editor.get_node(tag="w:t", contains="first")
+                nodes = editor.append_to(t_elem, " text<w:br/>")
+                self.assertEqual(
+                    [node.nodeType for node in nodes],
+                    [nodes[0].TEXT_NODE, nodes[0].ELEMENT_NODE],
+                )
+                self.assertEqual(nodes[0].data, " text")
+                # lxml's toxml declares the namespaces in scope on the element
+                self.assertTrue(t_elem.toxml().endswith(">first text<w:br/></w:t>"))
+
+    def test_standalone(self):
+        declarations = {
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>': b"yes",
+            "<?xml version='1.0' standalone='no'?>": b"no",
+            '<?xml version="1.0" encoding="UTF-8"?>': None,
+            "": None,
+        }
+        for declaration, standalone in declarations.items():
+            with self.subTest(declaration=declaration):
+                content = declaration + DOCUMENT.partition("?>")[2]
+                editor = self.open_editor("lxml", content)
+                saved = editor.dom.toxml(encoding="utf-8").partition(b"?>")[0]
+                if standalone is None:
+                    self.assertNotIn(b"standalone", saved)
+                else:
+                    self.assertIn(b"standalone='" + standalone + b"'", saved)
+
+
+
+class TestFragmentCache(EditorTestCase):
+    """Fragments parsed before are cloned from templates that never change."""
+
+    FRAGMENT = '<w:p w:id="9"><w:r><w:t>cached</w:t></w:r></w:p>'
+
+    def test_clones_are_distinct(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                editor = self.open_editor(engine)
+                body = editor.get_node(tag="w:body")
+                first = editor.append_to(body, self.FRAGMENT)[0]
+                second = editor.append_to(body, self.FRAGMENT)[0]
+                self.assertIsNot(first, second)
+                first.setAttribute("w:id", "10")
+                self.assertEqual(second.getAttribute("w:id"), "9")
+                self.assertIs(editor.get_node(tag="w:p", attrs={"w:id": "9"}), second)
+
+    def test_template_not_changed(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                editor = self.open_editor(engine)
+                body = editor.get_node(tag="w:body")
+                inserted = editor.append_to(body, self.FRAGMENT)[0]
+                inserted.setAttribute("w:rsidR", "00AB12CD")
+                t_elem = inserted.getElementsByTagName("w:t")[0]
+                t_elem.firstChild.data = "changed"
+                again = editor.append_to(body, self.FRAGMENT)[0]
+                self.assertFalse(again.hasAttribute("w:rsidR"))
+                self.assertEqual(editor._get_element_text(again), "cached")
+
+    def test_new_root_namespace(self):
+        uri = "http://schemas.microsoft.com/office/word/2010/wordml"
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                editor = self.open_editor(engine)
+                body = editor.get_node(tag="w:body")
+                editor.append_to(body, self.FRAGMENT)
+                self.assertIsNotNone(editor._fragment_prelude)
+                editor._declare_root_namespace("w14", uri)
+                self.assertIsNone(editor._fragment_prelude)
+                paragraph = editor.append_to(body, '<w:p w14:paraId="1"/>')[0]
+                self.assertEqual(paragraph.getAttribute("w14:paraId"), "1")
+
+    def test_size_limit(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                editor = self.open_editor(engine)
+                fragments = [
+                    f'<w:p w:id="{i}"/>' for i in range(FRAGMENT_CACHE_SIZE + 1)
+                ]
+                editor._parse_fragments(fragments[:-1])
+                # Reusing the first fragment saves it from eviction
+                editor._parse_fragments(fragments[:1])
+                editor._parse_fragments(fragments[-1:])
+                cache = editor._fragment_cache
+                self.assertEqual(len(cache), FRAGMENT_CACHE_SIZE)
+                self.assertIn(fragments[0], cache)
+                self.assertNotIn(fragments[1], cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
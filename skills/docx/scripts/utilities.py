@@ -5,6 +5,7 @@ Utilities for editing OOXML documents.
 This module provides XMLEditor, a tool for manipulating XML files with support for
 line-number-based node finding and DOM manipulation. Each element is automatically
 annotated with its original line and column position during parsing.
+LxmlXMLEditor offers the same API on an lxml tree, for large files.
 
 Example usage:
     editor = XMLEditor("document.xml")
@@ -30,12 +31,66 @@ Example usage:
     editor.save()
 """
 
+import copy
+import functools
+import hashlib
 import html
+import io
+import re
+import xml.dom.minidom
+from bisect import bisect_left
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
+
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+# Number of parsed XML fragments each editor keeps as templates for reuse
+FRAGMENT_CACHE_SIZE = 256
+
+# Markup that starts with "<" in an XML file; only the bare "<" alternative is
+# an element start tag (comments, CDATA, PIs and declarations are skipped whole)
+START_TAG_PATTERN = re.compile(
+    rb"<!--.*?-->|<!\[CDATA\[.*?\]\]>|<\?.*?\?>|<!|<(?!/)", re.DOTALL
+)
+
+# standalone pseudo-attribute of an XML declaration (lxml reports a missing one
+# as standalone="no")
+STANDALONE_PATTERN = re.compile(
+    rb"(?:\xef\xbb\xbf)?<\?xml\s[^?]*?standalone\s*=\s*[\"'](yes|no)[\"']"
+)
+
+
+def _edits_dom(method):
+    """Mark an XMLEditor method that changes the DOM and updates the indexes itself.
+
+    Changes made to the DOM since the editor last looked (e.g. by calling
+    setAttribute on an element directly) invalidate the indexes first, and
+    the method's own changes are taken as seen once it returns. If it fails
+    after changing the DOM, the indexes are discarded.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._edit_depth:
+            return method(self, *args, **kwargs)
+        self._sync_indexes()
+        self._edit_depth += 1
+        try:
+            result = method(self, *args, **kwargs)
+        except BaseException:
+            self._sync_indexes()
+            raise
+        finally:
+            self._edit_depth -= 1
+        self._dirty = True
+        self._mark_dom_seen()
+        return result
+
+    return wrapper
 
 
 class XMLEditor:
@@ -46,6 +101,12 @@ class XMLEditor:
     of each element. This enables finding nodes by their line number in the original
     file, which is useful when working with Read tool output.
 
+    Lookups are served from indexes (by tag, by attribute value, by original line
+    and a cache of element text) built on first use and kept up to date by
+    replace_node, insert_after, insert_before and append_to. Changes made to
+    self.dom directly (setAttribute, appendChild, setting a text node's data,
+    ...) are noticed on the next lookup, which rebuilds the indexes.
+
     Attributes:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
@@ -70,8 +131,47 @@ class XMLEditor:
             header = f.read(200).decode("utf-8", errors="ignore")
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
 
+        self.dom = self._parse(self.xml_path)
+
+        # Lookup indexes, built on first use (see _get_indexes)
+        self._indexes = None
+        self._text_cache = {}
+        self._edit_depth = 0
+        self._mark_dom_seen()
+
+        # Whether the DOM changed since it was parsed or last saved
+        self._dirty = False
+
+        # Namespace wrapper and parsed templates for fragments (see _parse_fragments)
+        self._fragment_prelude = None
+        self._fragment_cache = {}
+
+    def _parse(self, xml_path):
+        """Parse the XML file into a DOM with parse_position attributes on elements."""
         parser = _create_line_tracking_parser()
-        self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        return defusedxml.minidom.parse(str(xml_path), parser)
+
+    def _get_line_number(self, elem):
+        """Get the line an element started on in the original file (None if inserted)."""
+        return getattr(elem, "parse_position", (None,))[0]
+
+    def _change_count(self):
+        """Get the number of changes made to the DOM since it was parsed."""
+        return self.dom._changes
+
+    def _mark_dom_seen(self):
+        """Record that the indexes reflect the DOM as it is now."""
+        self._seen_changes = self._change_count()
+
+    def _dom_changed(self):
+        """Check if the DOM changed since _mark_dom_seen was last called."""
+        return self._change_count() != self._seen_changes
+
+    def _sync_indexes(self):
+        """Discard the indexes if the DOM was changed outside the editing methods."""
+        if self._dom_changed():
+            self.invalidate_indexes()
+            self._mark_dom_seen()
 
     def get_node(
         self,
@@ -109,40 +209,18 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        if not self._edit_depth:
+            self._sync_indexes()
+        matches = self._find_nodes(tag, attrs, line_number, contains)
+        if not matches:
+            # The DOM may have been changed without updating the indexes; confirm
+            # with a full scan and rebuild them if it finds what they missed
+            self._text_cache.clear()
+            matches = self._find_nodes(
+                tag, attrs, line_number, contains, use_indexes=False
+            )
+            if matches:
+                self.invalidate_indexes()
 
         if not matches:
             # Build descriptive error message
@@ -180,12 +258,209 @@ class XMLEditor:
             )
         return matches[0]
 
+    def _find_nodes(self, tag, attrs, line_number, contains, use_indexes=True):
+        """Get the elements passing all get_node filters."""
+        # Normalize the search string: convert HTML entities to Unicode characters
+        # This allows searching for both "&#8220;Rowan" and ""Rowan"
+        normalized_contains = html.unescape(contains) if contains is not None else None
+
+        matches = []
+        if use_indexes:
+            candidates = self._get_candidates(tag, attrs, line_number)
+        else:
+            candidates = self.dom.getElementsByTagName(tag)
+        for elem in candidates:
+            # Index entries may be stale; check the element is still in the document
+            if elem.tagName != tag and tag != "*":
+                continue
+            if not self._is_attached(elem):
+                continue
+
+            # Check line_number filter
+            if line_number is not None:
+                elem_line = self._get_line_number(elem)
+
+                # Handle both single line number and range
+                if isinstance(line_number, range):
+                    if elem_line not in line_number:
+                        continue
+                else:
+                    if elem_line != line_number:
+                        continue
+
+            # Check attrs filter
+            if attrs is not None:
+                if not all(
+                    elem.getAttribute(attr_name) == attr_value
+                    for attr_name, attr_value in attrs.items()
+                ):
+                    continue
+
+            # Check contains filter
+            if normalized_contains is not None:
+                if normalized_contains not in self._get_element_text(elem):
+                    continue
+
+            # If all applicable filters passed, this is a match
+            matches.append(elem)
+
+        return matches
+
+    def _get_candidates(self, tag, attrs, line_number):
+        """Get the indexed elements that may match, using the most selective filter."""
+        if tag == "*":
+            return self.dom.getElementsByTagName(tag)
+
+        indexes = self._get_indexes()
+        if attrs:
+            buckets = [
+                self._get_attribute_index(tag, attr_name).get(attr_value, {})
+                for attr_name, attr_value in attrs.items()
+            ]
+            return list(min(buckets, key=len))
+
+        if line_number is not None:
+            if isinstance(line_number, range) and line_number.step == 1:
+                sorted_lines = indexes["sorted_lines"]
+                lines = sorted_lines[
+                    bisect_left(sorted_lines, line_number.start) : bisect_left(
+                        sorted_lines, line_number.stop
+                    )
+                ]
+            elif isinstance(line_number, range):
+                lines = line_number
+            else:
+                lines = [line_number]
+            return [
+                elem
+                for line in lines
+                for elem in indexes["lines"].get(line, ())
+                if elem.tagName == tag
+            ]
+
+        return list(indexes["tags"].get(tag, {}))
+
+    def _get_indexes(self):
+        """Get the tag and line indexes, building them on first use.
+
+        Returns:
+            dict with keys:
+                tags: Tag name -> elements (a dict used as an ordered set)
+                attrs: Tag name -> attribute name -> value -> elements, filled
+                    in per attribute by _get_attribute_index
+                lines: Original line number -> elements starting on that line
+                sorted_lines: The line numbers in ascending order
+        """
+        if not self._edit_depth:
+            self._sync_indexes()
+        if self._indexes is None:
+            tags = {}
+            lines = {}
+            for elem in self.dom.getElementsByTagName("*"):
+                tags.setdefault(elem.tagName, {})[elem] = None
+                line = self._get_line_number(elem)
+                if line is not None:
+                    lines.setdefault(line, []).append(elem)
+            self._indexes = {
+                "tags": tags,
+                "attrs": {},
+                "lines": lines,
+                "sorted_lines": sorted(lines),
+            }
+        return self._indexes
+
+    def _get_attribute_index(self, tag, attr_name):
+        """Get the value -> elements index of a tag's attribute, built on first use."""
+        tag_attrs = self._get_indexes()["attrs"].setdefault(tag, {})
+        if attr_name not in tag_attrs:
+            index = {}
+            for elem in self._get_indexes()["tags"].get(tag, {}):
+                index.setdefault(elem.getAttribute(attr_name), {})[elem] = None
+            tag_attrs[attr_name] = index
+        return tag_attrs[attr_name]
+
+    def _get_elements_by_tag(self, tag):
+        """Get all elements with a tag that are in the document, from the tag index."""
+        return [
+            elem
+            for elem in self._get_indexes()["tags"].get(tag, {})
+            if self._is_attached(elem)
+        ]
+
+    def _is_attached(self, elem):
+        """Check if an element is still part of the document."""
+        node = elem
+        while node is not None:
+            if node is self.dom:
+                return True
+            node = node.parentNode
+        return False
+
+    def _index_nodes(self, nodes):
+        """Add inserted nodes and their descendants to the indexes.
+
+        Also re-files already indexed elements under their current attribute
+        values, so it can be called again after attributes were changed.
+        """
+        self._text_cache.clear()
+        if self._indexes is None:
+            return
+
+        tags = self._indexes["tags"]
+        attrs = self._indexes["attrs"]
+        for node in nodes:
+            if node.nodeType != node.ELEMENT_NODE:
+                continue
+            for elem in [node, *node.getElementsByTagName("*")]:
+                tags.setdefault(elem.tagName, {})[elem] = None
+                for attr_name, index in attrs.get(elem.tagName, {}).items():
+                    index.setdefault(elem.getAttribute(attr_name), {})[elem] = None
+
+    def _unindex_nodes(self, nodes):
+        """Remove nodes that are being taken out of the document from the indexes."""
+        self._text_cache.clear()
+        if self._indexes is None:
+            return
+
+        tags = self._indexes["tags"]
+        attrs = self._indexes["attrs"]
+        for node in nodes:
+            if node.nodeType != node.ELEMENT_NODE:
+                continue
+            for elem in [node, *node.getElementsByTagName("*")]:
+                tags.get(elem.tagName, {}).pop(elem, None)
+                for attr_name, index in attrs.get(elem.tagName, {}).items():
+                    index.get(elem.getAttribute(attr_name), {}).pop(elem, None)
+
+    def invalidate_indexes(self):
+        """Discard the lookup indexes, as the DOM was changed.
+
+        They are rebuilt on the next lookup. The namespace wrapper used to parse
+        fragments is rebuilt too, in case root namespaces were changed, and the
+        file is written on the next save(). Called automatically when the DOM
+        was changed outside the editing methods.
+        """
+        self._indexes = None
+        self._text_cache.clear()
+        self._fragment_prelude = None
+        self._dirty = True
+
+    @_edits_dom
+    def _declare_root_namespace(self, prefix, uri):
+        """Declare a namespace on the root element unless the prefix already is."""
+        root = self.dom.documentElement
+        if not root.hasAttribute(f"xmlns:{prefix}"):  # type: ignore
+            root.setAttribute(f"xmlns:{prefix}", uri)  # type: ignore
+            # Fragments may use the new prefix from now on
+            self._fragment_prelude = None
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
 
         Skips text nodes that contain only whitespace (spaces, tabs, newlines),
         which typically represent XML formatting rather than document content.
+        Results are cached per element until the document is next modified.
 
         Args:
             elem: defusedxml.minidom.Element to extract text from
@@ -193,6 +468,10 @@ class XMLEditor:
         Returns:
             str: Concatenated text from all non-whitespace text nodes within the element
         """
+        cached = self._text_cache.get(elem)
+        if cached is not None:
+            return cached
+
         text_parts = []
         for node in elem.childNodes:
             if node.nodeType == node.TEXT_NODE:
@@ -201,15 +480,19 @@ class XMLEditor:
                     text_parts.append(node.data)
             elif node.nodeType == node.ELEMENT_NODE:
                 text_parts.append(self._get_element_text(node))
-        return "".join(text_parts)
+        text = "".join(text_parts)
+        self._text_cache[elem] = text
+        return text
 
+    @_edits_dom
     def replace_node(self, elem, new_content):
         """
         Replace a DOM element with new XML content.
 
         Args:
             elem: defusedxml.minidom.Element to replace
-            new_content: String containing XML to replace the node with
+            new_content: String containing XML to replace the node with (or a
+                list of nodes already parsed for this document)
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -221,16 +504,20 @@ class XMLEditor:
         nodes = self._parse_fragment(new_content)
         for node in nodes:
             parent.insertBefore(node, elem)
+        self._unindex_nodes([elem])
         parent.removeChild(elem)
+        self._index_nodes(nodes)
         return nodes
 
+    @_edits_dom
     def insert_after(self, elem, xml_content):
         """
         Insert XML content after a DOM element.
 
         Args:
             elem: defusedxml.minidom.Element to insert after
-            xml_content: String containing XML to insert
+            xml_content: String containing XML to insert (or a list of nodes
+                already parsed for this document)
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -246,15 +533,18 @@ class XMLEditor:
                 parent.insertBefore(node, next_sibling)
             else:
                 parent.appendChild(node)
+        self._index_nodes(nodes)
         return nodes
 
+    @_edits_dom
     def insert_before(self, elem, xml_content):
         """
         Insert XML content before a DOM element.
 
         Args:
             elem: defusedxml.minidom.Element to insert before
-            xml_content: String containing XML to insert
+            xml_content: String containing XML to insert (or a list of nodes
+                already parsed for this document)
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -266,15 +556,18 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             parent.insertBefore(node, elem)
+        self._index_nodes(nodes)
         return nodes
 
+    @_edits_dom
     def append_to(self, elem, xml_content):
         """
         Append XML content as a child of a DOM element.
 
         Args:
             elem: defusedxml.minidom.Element to append to
-            xml_content: String containing XML to append
+            xml_content: String containing XML to append (or a list of nodes
+                already parsed for this document)
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -285,12 +578,35 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             elem.appendChild(node)
+        self._index_nodes(nodes)
         return nodes
 
+    def _rename_element(self, elem, tag_name):
+        """
+        Change an element's tag, keeping its attributes and children.
+
+        Args:
+            elem: defusedxml.minidom.Element to rename
+            tag_name: New qualified tag name (e.g. "w:delText")
+
+        Returns:
+            The renamed element, which replaces elem in the DOM
+        """
+        renamed = self.dom.createElement(tag_name)
+        # Copy ALL child nodes (not just firstChild) to handle entities
+        while elem.firstChild:
+            renamed.appendChild(elem.firstChild)
+        # Preserve attributes like xml:space
+        for i in range(elem.attributes.length):
+            attr = elem.attributes.item(i)
+            renamed.setAttribute(attr.name, attr.value)
+        elem.parentNode.replaceChild(renamed, elem)
+        return renamed
+
     def get_next_rid(self):
         """Get the next available rId for relationships files."""
         max_id = 0
-        for rel_elem in self.dom.getElementsByTagName("Relationship"):
+        for rel_elem in self._get_elements_by_tag("Relationship"):
             rel_id = rel_elem.getAttribute("Id")
             if rel_id.startswith("rId"):
                 try:
@@ -304,17 +620,27 @@ class XMLEditor:
         Save the edited XML back to the file.
 
         Serializes the DOM tree and writes it back to the original file path,
-        preserving the original encoding (ascii or utf-8).
+        preserving the original encoding (ascii or utf-8). Nothing is written if
+        the DOM has not changed since it was parsed or last saved.
+
+        Returns:
+            bool: Whether the file was written
         """
+        self._sync_indexes()
+        if not self._dirty:
+            return False
         content = self.dom.toxml(encoding=self.encoding)
         self.xml_path.write_bytes(content)
+        self._dirty = False
+        return True
 
     def _parse_fragment(self, xml_content):
         """
         Parse XML fragment and return list of imported nodes.
 
         Args:
-            xml_content: String containing XML fragment
+            xml_content: String containing XML fragment, or a list of nodes
+                already in this document, which is returned as is
 
         Returns:
             List of defusedxml.minidom.Node objects imported into this document
@@ -322,7 +648,58 @@ class XMLEditor:
         Raises:
             AssertionError: If fragment contains no element nodes
         """
-        # Extract namespace declarations from the root document element
+        if not isinstance(xml_content, str):
+            return list(xml_content)
+        return self._parse_fragments([xml_content])[0]
+
+    def _parse_fragments(self, xml_contents):
+        """
+        Parse several XML fragments together in one wrapper document.
+
+        The wrapper declaring the root element's namespaces is built once and
+        reused until a namespace is added with _declare_root_namespace. Each
+        parsed fragment is kept as a template, so a fragment seen before is
+        cloned instead of parsed again.
+
+        Args:
+            xml_contents: List of strings containing XML fragments
+
+        Returns:
+            List with the list of imported nodes of each fragment
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+        """
+        cache = self._fragment_cache
+        missing = list(dict.fromkeys(c for c in xml_contents if c not in cache))
+        if missing:
+            if self._fragment_prelude is None:
+                self._fragment_prelude = "<root {}>".format(
+                    " ".join(self._namespace_declarations())
+                )
+            fragments = "".join(
+                f"<fragment>{content}</fragment>" for content in missing
+            )
+            wrapper = self._parse_wrapper(f"{self._fragment_prelude}{fragments}</root>")
+            for content, fragment in zip(missing, wrapper.childNodes):
+                elements = [
+                    n for n in fragment.childNodes if n.nodeType == n.ELEMENT_NODE
+                ]
+                assert elements, "Fragment must contain at least one element"
+                cache[content] = fragment
+
+        parsed = []
+        for content in xml_contents:
+            # Move the template to the end, so the least recently used goes first
+            fragment = cache.pop(content)
+            cache[content] = fragment
+            parsed.append(self._clone_fragment(fragment))
+        while len(cache) > FRAGMENT_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        return parsed
+
+    def _namespace_declarations(self):
+        """Get the xmlns attributes of the root element, as name="uri" strings."""
         root_elem = self.dom.documentElement
         namespaces = []
         if root_elem and root_elem.attributes:
@@ -330,26 +707,629 @@ class XMLEditor:
                 attr = root_elem.attributes.item(i)
                 if attr.name.startswith("xmlns"):  # type: ignore
                     namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
+        return namespaces
+
+    def _parse_wrapper(self, wrapper):
+        """Parse a fragment wrapper document and return its root element."""
+        return defusedxml.minidom.parseString(wrapper).documentElement
 
-        ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
-        fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
+    def _clone_fragment(self, fragment):
+        """Get copies of a template fragment's children, imported into this document."""
+        return [self.dom.importNode(child, deep=True) for child in fragment.childNodes]
+
+
+class LxmlXMLEditor(XMLEditor):
+    """
+    XMLEditor backed by lxml instead of minidom.
+
+    Has the same API as XMLEditor but keeps the tree in lxml, which takes a
+    fraction of minidom's memory and serializes much faster, so large parts
+    (e.g. the word/document.xml of a long document) stay cheap to edit.
+
+    Elements support the subset of the minidom API used by the editing
+    scripts (tagName, getAttribute/setAttribute, getElementsByTagName,
+    parentNode, appendChild/insertBefore/removeChild, cloneNode, toxml, ...).
+    Text is only partly exposed as nodes: childNodes lists child elements
+    (and comments) only, and firstChild is the element's text (with a
+    writable data) when it has no child elements or its text is not just
+    whitespace. Text following an element stays with it as lxml's tail.
+    Fragments keep their text: one starting with text gives a text node
+    first, as with minidom.
+
+    Line numbers come from a scan of the original file rather than lxml's
+    sourceline, so line_number lookups match XMLEditor even past line 65535.
+
+    Changes made through the minidom-style methods are noticed like in
+    XMLEditor. Code that changes the tree through lxml's own API (set(),
+    .text, append(), ...) should call invalidate_indexes() afterwards, for
+    lookups to see the changes; save() compares the serialized tree with
+    what was last read or written, so they are always saved.
+    """
+
+    def _parse(self, xml_path):
+        """Parse the XML file with a hardened lxml parser and record element lines."""
+        content = xml_path.read_bytes()
+        self._parser = _create_lxml_parser()
+        tree = lxml.etree.parse(io.BytesIO(content), self._parser)
+        # Start tags in the file pair up with elements in document order
+        self._lines = dict(
+            zip(tree.getroot().iter(lxml.etree.Element), _start_tag_lines(content))
+        )
+        standalone = STANDALONE_PATTERN.match(content)
+        dom = _LxmlDocument(tree, standalone and standalone.group(1) == b"yes")
+        self._saved_digest = hashlib.sha1(dom.toxml(encoding=self.encoding)).digest()
+        return dom
+
+    def save(self):
+        """
+        Save the edited XML back to the file.
+
+        Unlike XMLEditor, the tree is serialized even if no change was noticed,
+        as changes made through lxml's own API are not counted. Nothing is
+        written if the serialized tree is the same as when it was parsed or
+        last saved.
+
+        Returns:
+            bool: Whether the file was written
+        """
+        self._sync_indexes()
+        content = self.dom.toxml(encoding=self.encoding)
+        digest = hashlib.sha1(content).digest()
+        if not self._dirty and digest == self._saved_digest:
+            return False
+        self.xml_path.write_bytes(content)
+        self._dirty = False
+        self._saved_digest = digest
+        return True
+
+    def _get_line_number(self, elem):
+        """Get the line an element started on in the original file (None if inserted)."""
+        return self._lines.get(elem)
+
+    def _change_count(self):
+        """Get the number of changes made to the tree since it was parsed."""
+        return self.dom.documentElement._changes
+
+    def _is_attached(self, elem):
+        """Check if an element is still part of the document."""
+        root = self.dom.documentElement
+        node = elem
+        while node is not None:
+            if node is root:
+                return True
+            node = node.getparent()
+        return False
+
+    def _get_element_text(self, elem):
+        """
+        Recursively extract all text content from an element.
+
+        Skips text that contains only whitespace, like XMLEditor. Results are
+        cached per element until the document is next modified.
+        """
+        cached = self._text_cache.get(elem)
+        if cached is None:
+            cached = "".join(text for text in elem.itertext() if text.strip())
+            self._text_cache[elem] = cached
+        return cached
+
+    def _rename_element(self, elem, tag_name):
+        """Change an element's tag in place, keeping its attributes and children."""
+        elem.tag = elem._qualify(tag_name)
+        elem._note_change()
+        return elem
+
+    def _namespace_declarations(self):
+        """Get the namespaces in scope at the root element, as xmlns attributes."""
+        return [
+            f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+            for prefix, uri in self.dom.documentElement.nsmap.items()
         ]
-        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
-        assert elements, "Fragment must contain at least one element"
+
+    @_edits_dom
+    def insert_after(self, elem, xml_content):
+        """Insert XML content after a DOM element (see XMLEditor.insert_after)."""
+        # Text following elem is its tail in lxml; keep it after the new nodes,
+        # where minidom has it
+        tail, elem.tail = elem.tail, None
+        nodes = super().insert_after(elem, xml_content)
+        if tail:
+            nodes[-1].tail = (nodes[-1].tail or "") + tail
+        return nodes
+
+    def _parse_wrapper(self, wrapper):
+        """Parse a fragment wrapper document and return its root element."""
+        return lxml.etree.fromstring(wrapper.encode("utf-8"), self._parser)
+
+    def _clone_fragment(self, fragment):
+        """Get copies of a template fragment's children, ready to insert."""
+        clone = copy.deepcopy(fragment)
+        nodes = list(clone)
+        if clone.text:
+            nodes.insert(0, _LxmlText(None, clone.text))
         return nodes
 
 
+class _LxmlNode:
+    """minidom-style node type constants and navigation for lxml nodes."""
+
+    ELEMENT_NODE = 1
+    TEXT_NODE = 3
+    PROCESSING_INSTRUCTION_NODE = 7
+    COMMENT_NODE = 8
+
+    @property
+    def parentNode(self):
+        return self.getparent()
+
+    @property
+    def nextSibling(self):
+        return self.getnext()
+
+    @property
+    def previousSibling(self):
+        return self.getprevious()
+
+    def toxml(self, encoding=None):
+        return lxml.etree.tostring(
+            self, encoding=encoding or "unicode", with_tail=False
+        )
+
+
+class _LxmlElement(_LxmlNode, lxml.etree.ElementBase):
+    """lxml element with the minidom methods used by the editing scripts.
+
+    Qualified names ("w:t", "w:id") are resolved against the namespaces in
+    scope at the element. Unprefixed element names use the default namespace.
+    """
+
+    nodeType = _LxmlNode.ELEMENT_NODE
+
+    # Changes made through the methods below, counted on the root element
+    _changes = 0
+
+    @property
+    def tagName(self):
+        localname = lxml.etree.QName(self).localname
+        return f"{self.prefix}:{localname}" if self.prefix else localname
+
+    nodeName = tagName
+
+    def __bool__(self):
+        # Like minidom nodes (lxml elements are false when they have no children)
+        return True
+
+    def _qualify(self, name, attribute=False):
+        """Get the {namespace}local form of a qualified name, or None if undeclared."""
+        prefix, _, localname = name.rpartition(":")
+        if prefix == "xml":
+            return f"{{{XML_NAMESPACE}}}{localname}"
+        if not prefix and attribute:
+            return localname
+        uri = self.nsmap.get(prefix or None)
+        if uri is None:
+            return None if prefix else localname
+        return f"{{{uri}}}{localname}"
+
+    @property
+    def childNodes(self):
+        return list(self)
+
+    @property
+    def firstChild(self):
+        if self.text and (len(self) == 0 or self.text.strip()):
+            return _LxmlText(self)
+        return self[0] if len(self) else None
+
+    def _note_change(self):
+        """Count a change to the tree this element is in (see LxmlXMLEditor)."""
+        root = self.getroottree().getroot()
+        root._changes += 1
+
+    def hasAttribute(self, name):
+        if name.startswith("xmlns:"):
+            return name[6:] in self.nsmap
+        qualified = self._qualify(name, attribute=True)
+        return qualified is not None and qualified in self.attrib
+
+    def getAttribute(self, name):
+        qualified = self._qualify(name, attribute=True)
+        return self.get(qualified, "") if qualified is not None else ""
+
+    def setAttribute(self, name, value):
+        if name.startswith("xmlns:"):
+            self._declare_namespace(name[6:], value)
+            return
+        qualified = self._qualify(name, attribute=True)
+        if qualified is None:
+            raise ValueError(f"Namespace prefix of {name!r} is not declared")
+        self.set(qualified, value)
+        self._note_change()
+
+    def removeAttribute(self, name):
+        qualified = self._qualify(name, attribute=True)
+        if qualified is not None:
+            self.attrib.pop(qualified, None)
+            self._note_change()
+
+    def _declare_namespace(self, prefix, uri):
+        """Declare a namespace prefix on this element (lxml can't add one directly)."""
+        if self.nsmap.get(prefix) == uri:
+            return
+        # cleanup_namespaces moves namespaces used below the top element up to
+        # it under the requested prefix; a placeholder child uses this one
+        placeholder = lxml.etree.SubElement(self, "placeholder")
+        placeholder.set(f"{{{uri}}}placeholder", "")
+        kept = {p for elem in self.iter(lxml.etree.Element) for p in elem.nsmap if p}
+        lxml.etree.cleanup_namespaces(
+            self, top_nsmap={prefix: uri}, keep_ns_prefixes=sorted(kept)
+        )
+        self.remove(placeholder)
+        self._note_change()
+
+    def getElementsByTagName(self, name):
+        if name == "*":
+            elements = list(self.iter(lxml.etree.Element))
+        else:
+            qualified = self._qualify(name)
+            elements = list(self.iter(qualified)) if qualified is not None else []
+        # Like minidom, only descendants are returned
+        if elements and elements[0] is self:
+            del elements[0]
+        return elements
+
+    def appendChild(self, node):
+        if isinstance(node, _LxmlText):
+            return self._insert_text(node, self[-1] if len(self) else None)
+        self.append(node)
+        self._note_change()
+        return node
+
+    def insertBefore(self, node, reference):
+        if reference is None:
+            return self.appendChild(node)
+        if isinstance(reference, _LxmlText):
+            # Before the element's text, which becomes the new node's tail
+            if isinstance(node, _LxmlText):
+                return self._insert_text(node, None, at_start=True)
+            node.tail = (node.tail or "") + (self.text or "")
+            self.text = None
+            self.insert(0, node)
+        elif isinstance(node, _LxmlText):
+            return self._insert_text(node, reference.getprevious())
+        else:
+            reference.addprevious(node)
+        self._note_change()
+        return node
+
+    def _insert_text(self, node, previous, at_start=False):
+        """Move a text node to the text following the child previous.
+
+        With previous None, the text goes to the end of the element's own
+        text (or its start, with at_start).
+        """
+        data = node.data
+        if node.parentNode is not None:
+            node.parentNode.text = None
+        if previous is not None:
+            previous.tail = (previous.tail or "") + data
+        elif at_start:
+            self.text = data + (self.text or "")
+        else:
+            self.text = (self.text or "") + data
+        # The stand-in only stays live if its data is now all of self.text
+        if previous is None and self.text == data:
+            node.parentNode = self
+        else:
+            node.parentNode, node._data = None, data
+        self._note_change()
+        return node
+
+    def removeChild(self, node):
+        # lxml moves the text following an element along with it; leave it behind
+        if node.tail:
+            previous = node.getprevious()
+            if previous is not None:
+                previous.tail = (previous.tail or "") + node.tail
+            else:
+                self.text = (self.text or "") + node.tail
+            node.tail = None
+        self.remove(node)
+        self._note_change()
+        return node
+
+    def replaceChild(self, node, old):
+        self.insertBefore(node, old)
+        return self.removeChild(old)
+
+    def cloneNode(self, deep):
+        if deep:
+            clone = copy.deepcopy(self)
+            clone.tail = None
+            return clone
+        return self.makeelement(self.tag, self.attrib, nsmap=self.nsmap)
+
+
+class _LxmlComment(_LxmlNode, lxml.etree.CommentBase):
+    nodeType = _LxmlNode.COMMENT_NODE
+    nodeName = "#comment"
+
+
+class _LxmlProcessingInstruction(_LxmlNode, lxml.etree.PIBase):
+    nodeType = _LxmlNode.PROCESSING_INSTRUCTION_NODE
+
+
+class _LxmlText:
+    """Stand-in for the text node at the start of an lxml element.
+
+    Its data is the parent element's text. Without a parent (a parsed fragment
+    starting with text, not yet inserted) it holds the data itself.
+    """
+
+    nodeType = _LxmlNode.TEXT_NODE
+    TEXT_NODE = _LxmlNode.TEXT_NODE
+    ELEMENT_NODE = _LxmlNode.ELEMENT_NODE
+    nodeName = "#text"
+
+    def __init__(self, parent, data=None):
+        self.parentNode = parent
+        self._data = data
+
+    @property
+    def data(self):
+        if self.parentNode is None:
+            return self._data
+        return self.parentNode.text or ""
+
+    @data.setter
+    def data(self, value):
+        if self.parentNode is None:
+            self._data = value
+            return
+        self.parentNode.text = value
+        self.parentNode._note_change()
+
+    nodeValue = data
+
+
+class _LxmlDocument:
+    """minidom Document stand-in holding an lxml tree.
+
+    standalone is the declaration's standalone value (None if it had none).
+    """
+
+    def __init__(self, tree, standalone=None):
+        self.tree = tree
+        self.standalone = standalone
+        self.documentElement = tree.getroot()
+
+    def getElementsByTagName(self, name):
+        root = self.documentElement
+        elements = root.getElementsByTagName(name)
+        if name == "*" or root._qualify(name) == root.tag:
+            elements.insert(0, root)
+        return elements
+
+    def createElement(self, name):
+        root = self.documentElement
+        qualified = root._qualify(name)
+        if qualified is None:
+            raise ValueError(f"Namespace prefix of {name!r} is not declared")
+        prefix = name.rpartition(":")[0] or None
+        nsmap = {prefix: root.nsmap[prefix]} if prefix in root.nsmap else None
+        return root.makeelement(qualified, nsmap=nsmap)
+
+    def toxml(self, encoding=None):
+        return lxml.etree.tostring(
+            self.tree,
+            xml_declaration=True,
+            encoding=encoding or "utf-8",
+            standalone=self.standalone,
+        )
+
+
+def _start_tag_lines(content):
+    """Yield the line number of each element start tag in raw XML, in order."""
+    line, position = 1, 0
+    for match in START_TAG_PATTERN.finditer(content):
+        if match.group() == b"<":
+            line += content.count(b"\n", position, match.start())
+            position = match.start()
+            yield line
+
+
+def _create_lxml_parser():
+    """
+    Create an lxml parser that refuses entity expansion and network access.
+
+    Elements are created as _LxmlElement (and comments and processing
+    instructions as their _Lxml* counterparts) to provide the minidom API.
+    """
+    parser = lxml.etree.XMLParser(
+        resolve_entities=False, no_network=True, load_dtd=False
+    )
+    parser.set_element_class_lookup(
+        lxml.etree.ElementDefaultClassLookup(
+            element=_LxmlElement,
+            comment=_LxmlComment,
+            pi=_LxmlProcessingInstruction,
+        )
+    )
+    return parser
+
+
+def _note_change(node):
+    """Count a change to a node of a _TrackedDocument."""
+    document = node.ownerDocument
+    if document is not None:
+        document._changes += 1
+
+
+class _TrackedText(xml.dom.minidom.Text):
+    """minidom text node that counts changes to its data."""
+
+    __slots__ = ()
+
+    def _set_data(self, data):
+        self._data = data
+        _note_change(self)
+
+    data = nodeValue = property(xml.dom.minidom.Text._get_data, _set_data)
+
+
+class _TrackedAttr(xml.dom.minidom.Attr):
+    """minidom attribute that counts changes to its value."""
+
+    __slots__ = ()
+
+    def _set_value(self, value):
+        super()._set_value(value)
+        if self.ownerElement is not None:
+            _note_change(self)
+
+    nodeValue = value = property(xml.dom.minidom.Attr._get_value, _set_value)
+
+
+class _TrackedNamedNodeMap(xml.dom.minidom.NamedNodeMap):
+    """minidom attribute map that counts attributes added and removed through it."""
+
+    __slots__ = ()
+
+    def setNamedItem(self, node):
+        node.__class__ = _TrackedAttr
+        old = super().setNamedItem(node)
+        _note_change(self._ownerElement)
+        return old
+
+    setNamedItemNS = setNamedItem
+
+    def removeNamedItem(self, name):
+        node = super().removeNamedItem(name)
+        _note_change(self._ownerElement)
+        return node
+
+    def removeNamedItemNS(self, namespaceURI, localName):
+        node = super().removeNamedItemNS(namespaceURI, localName)
+        _note_change(self._ownerElement)
+        return node
+
+    def __delitem__(self, attname_or_tuple):
+        super().__delitem__(attname_or_tuple)
+        _note_change(self._ownerElement)
+
+
+class _TrackedElement(xml.dom.minidom.Element):
+    """minidom element that counts changes to its attributes and children."""
+
+    __slots__ = ()
+
+    @property
+    def attributes(self):
+        self._ensure_attributes()
+        return _TrackedNamedNodeMap(self._attrs, self._attrsNS, self)
+
+    def setAttribute(self, attname, value):
+        super().setAttribute(attname, value)
+        _note_change(self)
+
+    def setAttributeNS(self, namespaceURI, qualifiedName, value):
+        super().setAttributeNS(namespaceURI, qualifiedName, value)
+        _note_change(self)
+
+    def setAttributeNode(self, attr):
+        # Later changes to the attribute's value are counted too
+        attr.__class__ = _TrackedAttr
+        old = super().setAttributeNode(attr)
+        _note_change(self)
+        return old
+
+    setAttributeNodeNS = setAttributeNode
+
+    def removeAttributeNode(self, node):
+        node = super().removeAttributeNode(node)
+        _note_change(self)
+        return node
+
+    removeAttributeNodeNS = removeAttributeNode
+
+    def appendChild(self, node):
+        result = super().appendChild(node)
+        _note_change(self)
+        return result
+
+    def insertBefore(self, newChild, refChild):
+        result = super().insertBefore(newChild, refChild)
+        _note_change(self)
+        return result
+
+    def removeChild(self, oldChild):
+        result = super().removeChild(oldChild)
+        _note_change(self)
+        return result
+
+    def replaceChild(self, newChild, oldChild):
+        result = super().replaceChild(newChild, oldChild)
+        _note_change(self)
+        return result
+
+
+class _TrackedDocument(xml.dom.minidom.Document):
+    """minidom document counting the changes made to its nodes.
+
+    Its elements, attributes and text nodes add one to _changes whenever they
+    change, which lets XMLEditor notice changes made to the DOM directly.
+    """
+
+    __slots__ = ()
+
+    _changes = 0
+
+    def createElement(self, tagName):
+        element = super().createElement(tagName)
+        element.__class__ = _TrackedElement
+        return element
+
+    def createElementNS(self, namespaceURI, qualifiedName):
+        element = super().createElementNS(namespaceURI, qualifiedName)
+        element.__class__ = _TrackedElement
+        return element
+
+    def createTextNode(self, data):
+        text = super().createTextNode(data)
+        text.__class__ = _TrackedText
+        return text
+
+    def appendChild(self, node):
+        result = super().appendChild(node)
+        self._changes += 1
+        return result
+
+    def insertBefore(self, newChild, refChild):
+        result = super().insertBefore(newChild, refChild)
+        self._changes += 1
+        return result
+
+    def removeChild(self, oldChild):
+        result = super().removeChild(oldChild)
+        self._changes += 1
+        return result
+
+
+class _TrackedDOMImplementation(xml.dom.minidom.DOMImplementation):
+    """minidom DOM implementation creating _TrackedDocument documents."""
+
+    def _create_document(self):
+        return _TrackedDocument()
+
+
 def _create_line_tracking_parser():
     """
     Create a SAX parser that tracks line and column numbers for each element.
 
     Monkey patches the SAX content handler to store the current line and column
     position from the underlying expat parser onto each element as a parse_position
-    attribute (line, column) tuple.
+    attribute (line, column) tuple. The document is built from _Tracked* nodes,
+    so that all changes to it are counted.
 
     Returns:
         defusedxml.sax.xmlreader.XMLReader: Configured SAX parser
@@ -366,6 +1346,7 @@ def _create_line_tracking_parser():
 
         orig_start_cb = dom_handler.startElementNS
         dom_handler.startElementNS = startElementNS
+        dom_handler.documentFactory = _TrackedDOMImplementation()
         orig_set_content_handler(dom_handler)
 
     parser = defusedxml.sax.make_parser()
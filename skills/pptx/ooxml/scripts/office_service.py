@@ -0,0 +1,405 @@
+"""
+Pool of LibreOffice (soffice) instances for document conversions and recalculation.
+
+Each instance has its own isolated user profile (-env:UserInstallation), so
+instances never contend for LibreOffice's profile lock and can work in parallel.
+Jobs wait on a queue for a free instance and run with a per-job timeout; an
+instance that hangs or crashes is killed and restarted for the next job.
+
+Only with LibreOffice's Python-UNO bridge (the "uno" module) are instances kept
+warm: each is a long-running soffice daemon driven over a UNO pipe, so jobs skip
+the seconds of soffice start-up. Without it, each job starts a new headless
+soffice command and pays the full start-up; the pool then only gives isolation
+(parallel jobs, timeouts, no profile lock contention) and saves just the
+one-time creation of each profile, not per-job start-up time.
+
+This module is shared by the skills that convert documents: pack.py uses it
+here, and it can be passed to pptx's thumbnail.py and xlsx's recalc.py.
+
+Example usage:
+    with OfficeService(workers=4) as service:
+        futures = [service.submit("convert", path, out_dir, "pdf") for path in paths]
+        pdfs = [future.result() for future in futures]
+"""
+
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+except ImportError:  # Only available with LibreOffice's Python bridge
+    uno = None
+
+# Macro run by recalculate() when the UNO bridge is not available
+RECALC_MACRO_URL = (
+    "vnd.sun.star.script:Standard.Module1.RecalculateAndSave"
+    "?language=Basic&location=application"
+)
+RECALC_MACRO = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE script:module PUBLIC "-//OpenOffice.org//DTD OfficeDocument 1.0//EN" "module.dtd">
+<script:module xmlns:script="http://openoffice.org/2000/script" script:name="Module1" script:language="StarBasic">
+    Sub RecalculateAndSave()
+      ThisComponent.calculateAll()
+      ThisComponent.store()
+      ThisComponent.close(True)
+    End Sub
+</script:module>"""
+
+# PDF export filter for each kind of document (UNO conversions need an explicit filter)
+PDF_FILTERS = [
+    ("com.sun.star.presentation.PresentationDocument", "impress_pdf_Export"),
+    ("com.sun.star.sheet.SpreadsheetDocument", "calc_pdf_Export"),
+    ("com.sun.star.drawing.DrawingDocument", "draw_pdf_Export"),
+    ("com.sun.star.text.TextDocument", "writer_pdf_Export"),
+]
+
+# How long a new soffice daemon may take to accept UNO connections
+STARTUP_TIMEOUT = 60
+
+
+class OfficeServiceError(RuntimeError):
+    """A conversion or recalculation job failed."""
+
+
+class OfficeTimeoutError(OfficeServiceError, TimeoutError):
+    """A job did not finish within its timeout; its instance was restarted."""
+
+
+class OfficeService:
+    """Pool of isolated soffice instances that run conversion jobs.
+
+    convert() and recalculate() block until an instance is free and the job is
+    done; submit() queues a job and returns a concurrent.futures.Future. The
+    service is thread-safe. Call close() (or use it as a context manager) to
+    stop the instances and delete their profiles.
+
+    Instances are reused warm only when use_uno is on (see the module
+    docstring); otherwise every job is a cold soffice start.
+    """
+
+    def __init__(self, workers=1, timeout=60, soffice="soffice", use_uno=None):
+        """
+        Args:
+            workers: Number of soffice instances (jobs run concurrently)
+            timeout: Default per-job timeout in seconds
+            soffice: soffice executable
+            use_uno: Drive daemons over UNO (default: when "uno" is importable)
+        """
+        if use_uno and uno is None:
+            raise OfficeServiceError(
+                "The LibreOffice Python-UNO bridge is not available"
+            )
+        self.timeout = timeout
+        self.use_uno = uno is not None if use_uno is None else use_uno
+        self._root = Path(tempfile.mkdtemp(prefix="office_service_"))
+        self._instances = [
+            _OfficeInstance(
+                soffice, self._root / f"profile{i}", f"{self._root.name}_{i}"
+            )
+            for i in range(max(1, workers))
+        ]
+        self._idle = queue.Queue()
+        for instance in self._instances:
+            self._idle.put(instance)
+        self._executor = ThreadPoolExecutor(max_workers=len(self._instances))
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def convert(self, input_path, output_dir, convert_to="pdf", timeout=None):
+        """Convert a document, like soffice --convert-to.
+
+        Args:
+            input_path: Document to convert
+            output_dir: Directory for the converted file
+            convert_to: Target as accepted by --convert-to, e.g. "pdf" or
+                "html:HTML" (extension, optionally followed by a filter name)
+            timeout: Seconds before the job is abandoned (default: self.timeout)
+
+        Returns:
+            Path: The converted file (output_dir / "<input stem>.<extension>")
+
+        Raises:
+            OfficeServiceError: If the conversion failed
+            OfficeTimeoutError: If it did not finish in time
+            FileNotFoundError: If soffice is not installed
+        """
+        input_path = Path(input_path).resolve()
+        output_path = Path(output_dir).resolve() / (
+            f"{input_path.stem}.{convert_to.split(':', 1)[0]}"
+        )
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._run(
+            lambda instance, seconds: instance.convert(
+                input_path, output_path, convert_to, seconds, self.use_uno
+            ),
+            timeout,
+        )
+        if not output_path.exists():
+            raise OfficeServiceError(
+                f"Conversion produced no output for {input_path}"
+            )
+        return output_path
+
+    def recalculate(self, path, timeout=None):
+        """Recalculate all formulas of a spreadsheet and save it in place.
+
+        Raises:
+            OfficeServiceError: If the recalculation failed
+            OfficeTimeoutError: If it did not finish in time
+            FileNotFoundError: If soffice is not installed
+        """
+        path = Path(path).resolve()
+        self._run(
+            lambda instance, seconds: instance.recalculate(
+                path, seconds, self.use_uno
+            ),
+            timeout,
+        )
+
+    def submit(self, job, *args, **kwargs):
+        """Queue a job ("convert" or "recalculate") and return its Future."""
+        if job not in ("convert", "recalculate"):
+            raise ValueError(f"Unknown job: {job}")
+        return self._executor.submit(getattr(self, job), *args, **kwargs)
+
+    def close(self):
+        """Wait for queued jobs, stop every instance and remove the profiles."""
+        if self._closed:
+            return
+        self._executor.shutdown(wait=True)
+        self._closed = True
+        for instance in self._instances:
+            instance.stop()
+        shutil.rmtree(self._root, ignore_errors=True)
+
+    def _run(self, job, timeout):
+        """Run a job on the next free instance, restarting it if it crashed."""
+        if self._closed:
+            raise OfficeServiceError("The office service is closed")
+        seconds = timeout if timeout is not None else self.timeout
+        instance = self._idle.get()
+        try:
+            # Retry once on a fresh instance if the job's instance died under it
+            for attempt in range(2):
+                try:
+                    return job(instance, seconds)
+                except _InstanceCrashed as e:
+                    instance.stop()
+                    if attempt:
+                        raise OfficeServiceError(str(e)) from e
+                except OfficeTimeoutError:
+                    instance.stop()
+                    raise
+        finally:
+            self._idle.put(instance)
+
+
+class _InstanceCrashed(Exception):
+    """The soffice instance running a job exited or stopped responding."""
+
+
+class _OfficeInstance:
+    """One soffice instance with its own user profile."""
+
+    def __init__(self, soffice, profile_dir, pipe_name):
+        self.soffice = soffice
+        self.profile_dir = profile_dir
+        self.pipe_name = pipe_name
+        self.process = None
+        self.desktop = None
+        self.macro_installed = False
+
+    def _command(self, *args):
+        return [
+            self.soffice,
+            f"-env:UserInstallation={self.profile_dir.as_uri()}",
+            "--headless",
+            "--invisible",
+            "--nologo",
+            "--nodefault",
+            "--norestore",
+            "--nolockcheck",
+            *args,
+        ]
+
+    def stop(self):
+        """Stop the daemon, if running."""
+        if self.desktop is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass
+            self.desktop = None
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+
+    def _kill(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+
+    # UNO daemon mode
+
+    def _start(self):
+        """Start the daemon and connect to it over its UNO pipe."""
+        connection = f"pipe,name={self.pipe_name};urp;StarOffice.ComponentContext"
+        self.process = subprocess.Popen(
+            self._command(f"--accept={connection}"),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                context = resolver.resolve(f"uno:{connection}")
+                break
+            except Exception:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise OfficeServiceError("soffice did not start")
+                time.sleep(0.1)
+        self.desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+
+    def _run_uno(self, job, timeout):
+        """Run a job against the daemon, killing it if the timeout passes."""
+        if self.process is None or self.process.poll() is not None:
+            self.stop()
+            self._start()
+
+        timer = threading.Timer(timeout, self._kill)
+        timer.start()
+        try:
+            return job()
+        except Exception as e:
+            if not timer.is_alive():
+                raise OfficeTimeoutError(f"Timed out after {timeout}s") from e
+            if self.process.poll() is not None:
+                raise _InstanceCrashed(f"soffice exited during the job: {e}") from e
+            raise OfficeServiceError(str(e)) from e
+        finally:
+            timer.cancel()
+
+    def _load(self, path):
+        document = self.desktop.loadComponentFromURL(
+            path.as_uri(), "_blank", 0, _properties(Hidden=True)
+        )
+        if document is None:
+            raise OfficeServiceError(f"soffice could not open {path}")
+        return document
+
+    # Per-job command mode
+
+    def _run_command(self, args, timeout):
+        try:
+            result = subprocess.run(
+                self._command(*args), capture_output=True, text=True, timeout=timeout
+            )
+        except subprocess.TimeoutExpired as e:
+            raise OfficeTimeoutError(f"Timed out after {timeout}s") from e
+        return result
+
+    def _install_macro(self, timeout):
+        """Create the profile and add the recalculation macro to it."""
+        macro_dir = self.profile_dir / "user" / "basic" / "Standard"
+        if not macro_dir.exists():
+            self._run_command(["--terminate_after_init"], timeout)
+            macro_dir.mkdir(parents=True, exist_ok=True)
+        (macro_dir / "Module1.xba").write_text(RECALC_MACRO, encoding="utf-8")
+        self.macro_installed = True
+
+    # Jobs
+
+    def convert(self, input_path, output_path, convert_to, timeout, use_uno):
+        if not use_uno:
+            result = self._run_command(
+                [
+                    "--convert-to",
+                    convert_to,
+                    "--outdir",
+                    str(output_path.parent),
+                    str(input_path),
+                ],
+                timeout,
+            )
+            if not output_path.exists():
+                raise OfficeServiceError(
+                    result.stderr.strip() or f"Conversion of {input_path} failed"
+                )
+            return
+
+        def job():
+            document = self._load(input_path)
+            try:
+                extension, _, filter_name = convert_to.partition(":")
+                if not filter_name and extension == "pdf":
+                    filter_name = next(
+                        (
+                            name
+                            for service, name in PDF_FILTERS
+                            if document.supportsService(service)
+                        ),
+                        "writer_pdf_Export",
+                    )
+                properties = (
+                    _properties(FilterName=filter_name) if filter_name else ()
+                )
+                document.storeToURL(output_path.as_uri(), properties)
+            finally:
+                document.close(True)
+
+        self._run_uno(job, timeout)
+
+    def recalculate(self, path, timeout, use_uno):
+        if not use_uno:
+            if not self.macro_installed:
+                self._install_macro(timeout)
+            result = self._run_command([RECALC_MACRO_URL, str(path)], timeout)
+            if result.returncode != 0:
+                raise OfficeServiceError(
+                    result.stderr.strip() or f"Recalculation of {path} failed"
+                )
+            return
+
+        def job():
+            document = self._load(path)
+            try:
+                document.calculateAll()
+                document.store()
+            finally:
+                document.close(True)
+
+        self._run_uno(job, timeout)
+
+
+def _properties(**values):
+    """Build a tuple of UNO PropertyValues from keyword arguments."""
+    properties = []
+    for name, value in values.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        properties.append(prop)
+    return tuple(properties)
+
@@ -7,13 +7,31 @@ Example usage:
 """
 
 import argparse
-import shutil
+import io
 import subprocess
 import sys
 import tempfile
 import defusedxml.minidom
+import xml.dom.minidom
 import zipfile
 from pathlib import Path
+from xml.parsers import expat
+
+# Formats that are already compressed; deflating them again costs time for no gain
+STORED_EXTENSIONS = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".wdp",
+    ".mp4",
+    ".m4v",
+    ".mov",
+    ".wmv",
+    ".mp3",
+    ".m4a",
+    ".wma",
+}
 
 
 def main():
@@ -42,13 +60,15 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, office_service=None):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        office_service: Optional office_service.OfficeService to validate with
+            instead of starting a new soffice process
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,34 +81,46 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
+    # Write members straight from the source files; XML parts are condensed in
+    # memory so the input directory is never modified or copied
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
+            for f in input_dir.rglob("*"):
+                if not f.is_file():
+                    continue
+                arcname = f.relative_to(input_dir)
 
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
+                if f.name.endswith((".xml", ".rels")):
+                    # Remove pretty-printing whitespace
+                    zf.writestr(
+                        zipfile.ZipInfo.from_file(f, arcname),
+                        condense_xml_bytes(f),
+                        compress_type=zipfile.ZIP_DEFLATED,
+                    )
+                elif f.suffix.lower() in STORED_EXTENSIONS:
+                    zf.write(f, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zf.write(f, arcname)
+    except BaseException:
+        output_file.unlink(missing_ok=True)  # Don't leave a partial file behind
+        raise
 
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file, office_service):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
-def validate_document(doc_path):
-    """Validate document by converting to HTML with soffice."""
+def validate_document(doc_path, office_service=None):
+    """Validate document by converting to HTML with soffice.
+
+    The conversion runs on office_service's soffice instances when given (see
+    office_service.OfficeService), and in a new soffice process otherwise.
+    """
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
@@ -100,6 +132,10 @@ def validate_document(doc_path):
 
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
+            if office_service is not None:
+                office_service.convert(doc_path, temp_dir, filter_name, timeout=10)
+                return True
+
             result = subprocess.run(
                 [
                     "soffice",
@@ -122,7 +158,7 @@ def validate_document(doc_path):
         except FileNotFoundError:
             print("Warning: soffice not found. Skipping validation.", file=sys.stderr)
             return True
-        except subprocess.TimeoutExpired:
+        except (subprocess.TimeoutExpired, TimeoutError):
             print("Validation error: Timeout during conversion", file=sys.stderr)
             return False
         except Exception as e:
@@ -132,6 +168,32 @@ def validate_document(doc_path):
 
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
+    condensed = condense_xml_bytes(xml_file)
+
+    # Write back the condensed XML
+    with open(xml_file, "wb") as f:
+        f.write(condensed)
+
+
+def condense_xml_bytes(xml_file):
+    """Get the content of an XML file with unnecessary whitespace and comments removed.
+
+    The file is streamed through expat and written out as it is read, so no DOM
+    is built. The output is byte-identical to serializing the condensed minidom
+    document with the running Python's minidom, which is still used for the
+    rare parts with a DOCTYPE.
+
+    Returns:
+        bytes: The condensed XML, UTF-8 encoded
+    """
+    try:
+        return _XMLCondenser().condense(xml_file)
+    except _DOMRequired:
+        return _condense_xml_dom(xml_file)
+
+
+def _condense_xml_dom(xml_file):
+    """Condense an XML file by building and serializing a minidom document."""
     with open(xml_file, "r", encoding="utf-8") as f:
         dom = defusedxml.minidom.parse(f)
 
@@ -150,9 +212,190 @@ def condense_xml(xml_file):
             ) or child.nodeType == child.COMMENT_NODE:
                 element.removeChild(child)
 
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    return dom.toxml(encoding="UTF-8")
+
+
+def _minidom_escapes(attribute):
+    """Get the (character, replacement) pairs minidom's serializer applies.
+
+    Read from xml.dom.minidom itself, as its escaping differs between Python
+    versions (e.g. 3.13 stopped escaping quotes in text and started escaping
+    tabs and newlines in attribute values). "&" comes first.
+    """
+    document = xml.dom.minidom.Document()
+    escapes = []
+    for char in "&<>\"'\t\n\r":
+        element = document.createElement("x")
+        if attribute:
+            element.setAttribute("a", char)
+            written = element.toxml()[len('<x a="') : -len('"/>')]
+        else:
+            element.appendChild(document.createTextNode(char))
+            written = element.toxml()[len("<x>") : -len("</x>")]
+        if written != char:
+            escapes.append((char, written))
+    return escapes
+
+
+class _DOMRequired(Exception):
+    """Raised when a document needs the minidom path (it has a DOCTYPE)."""
+
+
+class _XMLCondenser:
+    """Streaming equivalent of _condense_xml_dom.
+
+    The expat parser is configured exactly like minidom's builder, and the
+    writer reproduces minidom's serialization: namespace declarations before
+    other attributes, empty elements as "<x/>", and text split into nodes the
+    same way the builder would (so whitespace-only checks see the same text).
+    Comments and whitespace-only text are dropped from every element except
+    prefixed ":t" elements; comments outside the root element are kept.
+
+    Documents with a DOCTYPE raise _DOMRequired. Without a DTD there can be no
+    entity declarations or external entities, which is what defusedxml guards.
+    """
+
+    def condense(self, xml_file):
+        self._result = io.BytesIO()
+        self._output = ['<?xml version="1.0" encoding="UTF-8"?>']
+        # Open elements as [qualified name, keeps whitespace/comments, has content]
+        self._open = []
+        self._namespace_decls = []
+        self._text = []
+        self._cdata = None
+
+        parser = expat.ParserCreate(namespace_separator=" ")
+        parser.namespace_prefixes = True
+        parser.buffer_text = True
+        parser.ordered_attributes = True
+        parser.specified_attributes = True
+        parser.StartDoctypeDeclHandler = self._start_doctype
+        parser.StartNamespaceDeclHandler = self._start_namespace_decl
+        parser.StartElementHandler = self._start_element
+        parser.EndElementHandler = self._end_element
+        parser.CharacterDataHandler = self._character_data
+        parser.CommentHandler = self._comment
+        parser.ProcessingInstructionHandler = self._processing_instruction
+        parser.StartCdataSectionHandler = self._start_cdata
+        parser.EndCdataSectionHandler = self._end_cdata
+
+        # Read as text like condense_xml always has (the declared encoding is ignored)
+        with open(xml_file, "r", encoding="utf-8") as f:
+            while True:
+                buffer = f.read(16 * 1024)
+                if not buffer:
+                    break
+                parser.Parse(buffer, False)
+                self._drain_output()
+            parser.Parse(b"", True)
+
+        self._drain_output()
+        return self._result.getvalue()
+
+    def _drain_output(self):
+        """Encode pending output pieces so only the encoded bytes stay in memory."""
+        self._result.write("".join(self._output).encode("utf-8", "xmlcharrefreplace"))
+        self._output = []
+
+    @staticmethod
+    def _qname(name):
+        # Expat reports "uri local prefix", "uri local" or "local"
+        parts = name.split(" ")
+        if len(parts) == 3:
+            return f"{parts[2]}:{parts[1]}"
+        if len(parts) > 3:
+            raise _DOMRequired()  # Spaces in a URI; let minidom report it
+        return parts[-1]
+
+    # Same replacements as this Python's xml.dom.minidom
+    _TEXT_ESCAPES = _minidom_escapes(attribute=False)
+    _ATTRIBUTE_ESCAPES = _minidom_escapes(attribute=True)
+
+    @staticmethod
+    def _escape(data, escapes):
+        for char, replacement in escapes:
+            if char in data:
+                data = data.replace(char, replacement)
+        return data
+
+    def _begin_content(self):
+        """Close the parent's start tag before writing its first child."""
+        if self._open and not self._open[-1][2]:
+            self._open[-1][2] = True
+            self._output.append(">")
+
+    def _flush_text(self):
+        if not self._text:
+            return
+        data = "".join(self._text)
+        self._text = []
+        if not self._open[-1][1] and data.strip() == "":
+            return  # Whitespace-only text node
+        self._begin_content()
+        self._output.append(self._escape(data, self._TEXT_ESCAPES))
+
+    def _start_doctype(self, *args):
+        raise _DOMRequired()
+
+    def _start_namespace_decl(self, prefix, uri):
+        self._namespace_decls.append((prefix, uri))
+
+    def _start_element(self, name, attributes):
+        self._flush_text()
+        self._begin_content()
+        qname = self._qname(name)
+        output = self._output
+        output.append("<" + qname)
+
+        for prefix, uri in self._namespace_decls:
+            attr_name = f"xmlns:{prefix}" if prefix else "xmlns"
+            uri = self._escape(uri or "", self._ATTRIBUTE_ESCAPES)
+            output.append(f' {attr_name}="{uri}"')
+        self._namespace_decls = []
+
+        for i in range(0, len(attributes), 2):
+            attr_name = self._qname(attributes[i])
+            value = self._escape(attributes[i + 1], self._ATTRIBUTE_ESCAPES)
+            output.append(f' {attr_name}="{value}"')
+
+        # Skip w:t elements and their processing
+        self._open.append([qname, qname.endswith(":t"), False])
+
+    def _end_element(self, name):
+        self._flush_text()
+        qname, _, has_content = self._open.pop()
+        self._output.append(f"</{qname}>" if has_content else "/>")
+
+    def _character_data(self, data):
+        if self._cdata is not None:
+            self._cdata.append(data)
+        else:
+            # Consecutive character data forms a single text node
+            self._text.append(data)
+
+    def _comment(self, data):
+        self._flush_text()
+        if self._open and not self._open[-1][1]:
+            return  # Comment node inside an element
+        self._begin_content()
+        self._output.append(f"<!--{data}-->")
+
+    def _processing_instruction(self, target, data):
+        self._flush_text()
+        self._begin_content()
+        self._output.append(f"<?{target} {data}?>")
+
+    def _start_cdata(self):
+        self._cdata = []
+
+    def _end_cdata(self):
+        data = "".join(self._cdata)
+        self._cdata = None
+        # An empty section creates no node, so text around it stays one node
+        if data:
+            self._flush_text()
+            self._begin_content()
+            self._output.append(f"<![CDATA[{data}]]>")
 
 
 if __name__ == "__main__":
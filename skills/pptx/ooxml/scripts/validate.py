@@ -3,61 +3,150 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir or file> --original <original_file> [--jobs N] [--schema-index <index.json>]
+                       [--profile [table|json]] [--cache]
+    python validate.py --batch <manifest.jsonl> [--jobs N] [--schema-index <index.json>] [--no-cache]
+
+A packed .docx/.pptx/.xlsx is validated in place, without unpacking it. Its
+errors are the same as for the unpacked directory, but line numbers refer to
+the parts as stored in the package: pack.py condenses the XML, so an error
+reported at "Line 21" of an unpacked part may be at "Line 1" of the packed one.
+
+In batch mode each manifest line is a JSON object such as
+{"path": "unpacked/", "original": "file.docx"} ("-" reads the manifest from
+stdin). Documents are validated on a pool of worker processes that keep their
+compiled schemas between documents, and one JSON result line is written to
+stdout as each document finishes.
+
+Per-part XSD results can be kept in an on-disk cache shared across runs. It is
+used by batch runs unless --no-cache is given, and by single-document runs
+only with --cache.
 """
 
 import argparse
+import contextlib
+import io
+import json
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation.base import _schema_cache, save_schema_index, warm_schema_cache
+from validation.result_cache import default_cache_file
 
 
 def main():
     parser = argparse.ArgumentParser(description="Validate Office document XML files")
     parser.add_argument(
         "unpacked_dir",
-        help="Path to unpacked Office document directory",
+        nargs="?",
+        help="Path to unpacked Office document directory, or the packed file itself",
     )
     parser.add_argument(
         "--original",
-        required=True,
         help="Path to original file (.docx/.pptx/.xlsx)",
     )
+    parser.add_argument(
+        "--batch",
+        metavar="MANIFEST",
+        help="Validate every document listed in a JSON Lines manifest ('-' for stdin)",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for XSD validation, or for documents "
+        "in batch mode (default: 1)",
+    )
+    parser.add_argument(
+        "--schema-index",
+        help="Warm-start index of XSD schemas to precompile (updated after the run)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="table",
+        choices=["table", "json"],
+        help="Report per-check and per-part timings to stderr (default format: table)",
+    )
+    cache_options = parser.add_mutually_exclusive_group()
+    cache_options.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Read and write the XSD result cache ({default_cache_file()}) "
+        "for a single document",
+    )
+    cache_options.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the XSD result cache (the default for a single "
+        "document)",
+    )
     args = parser.parse_args()
 
+    if args.batch:
+        if args.unpacked_dir or args.original or args.profile or args.cache:
+            parser.error(
+                "--batch cannot be combined with a path, --original, --profile "
+                "or --cache"
+            )
+        sys.exit(
+            run_batch(args.batch, args.jobs, args.schema_index, not args.no_cache)
+        )
+    if not args.unpacked_dir or not args.original:
+        parser.error("the unpacked_dir and --original arguments are required")
+
     # Validate paths
     unpacked_dir = Path(args.unpacked_dir)
     original_file = Path(args.original)
     file_extension = original_file.suffix.lower()
-    assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
+    assert unpacked_dir.exists(), f"Error: {unpacked_dir} does not exist"
     assert original_file.is_file(), f"Error: {original_file} is not a file"
     assert file_extension in [".docx", ".pptx", ".xlsx"], (
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
     )
 
     # Run validations
-    match file_extension:
-        case ".docx":
-            validators = [DOCXSchemaValidator, RedliningValidator]
-        case ".pptx":
-            validators = [PPTXSchemaValidator]
-        case _:
-            print(f"Error: Validation not supported for file type {file_extension}")
-            sys.exit(1)
+    validators = _validators_for(file_extension)
+    if validators is None:
+        print(f"Error: Validation not supported for file type {file_extension}")
+        sys.exit(1)
+
+    if args.schema_index:
+        warm_schema_cache(args.schema_index)
 
     # Run validators
     success = True
     for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
+        if V is RedliningValidator:
+            validator = V(unpacked_dir, original_file, verbose=args.verbose)
+        else:
+            validator = V(
+                unpacked_dir,
+                original_file,
+                verbose=args.verbose,
+                max_workers=args.jobs,
+                profile=bool(args.profile),
+                cache_file=default_cache_file() if args.cache else None,
+            )
         if not validator.validate():
             success = False
+        if getattr(validator, "profiler", None) is not None:
+            print(f"\n{V.__name__} profile:", file=sys.stderr)
+            print(validator.profiler.report(args.profile), file=sys.stderr)
+
+    if args.schema_index:
+        save_schema_index(args.schema_index)
 
     if success:
         print("All validations PASSED!")
@@ -65,5 +154,196 @@ def main():
     sys.exit(0 if success else 1)
 
 
+def _validators_for(file_extension):
+    """Get the validator classes for a file extension, or None if unsupported."""
+    match file_extension:
+        case ".docx":
+            return [DOCXSchemaValidator, RedliningValidator]
+        case ".pptx":
+            return [PPTXSchemaValidator]
+        case _:
+            return None
+
+
+def run_batch(manifest, jobs=1, schema_index=None, use_cache=True):
+    """Validate every document in a manifest, writing one JSON line per result.
+
+    Results are written in completion order; each carries the "index" of its
+    manifest entry. Manifest lines that cannot be parsed, and documents whose
+    validation failed outside the validators (e.g. a crashed worker), are
+    reported as results with an "error" instead of stopping the batch.
+
+    Args:
+        manifest: Path to a JSON Lines file of {"path", "original"} objects, or "-"
+        jobs: Number of worker processes (documents validated concurrently)
+        schema_index: Optional warm-start index of XSD schemas, loaded by each
+            worker before its first document and updated at the end
+        use_cache: Whether to use the persistent XSD result cache
+
+    Returns:
+        int: Exit status, 0 if every document passed and 1 otherwise
+    """
+    if manifest == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(manifest).read_text(encoding="utf-8").splitlines()
+
+    entries = []
+    success = True
+    for line in lines:
+        if not line.strip():
+            continue
+        index = len(entries)
+        try:
+            entry = json.loads(line)
+            entries.append((index, str(entry["path"]), str(entry["original"])))
+        except (ValueError, KeyError, TypeError) as e:
+            entries.append((index, None, None))
+            _write_result(
+                {"index": index, "valid": False, "error": f"Bad manifest line: {e}"}
+            )
+            success = False
+
+    cache_file = default_cache_file() if use_cache else None
+    schema_paths = set()
+    crashed = []
+    for entry, outcome in _run_batch_pool(
+        [entry for entry in entries if entry[1] is not None],
+        max(1, jobs),
+        schema_index,
+        cache_file,
+    ):
+        if isinstance(outcome, BrokenProcessPool):
+            crashed.append(entry)
+        else:
+            success = _report_outcome(entry, outcome, schema_paths) and success
+
+    # A worker that dies breaks the whole pool and fails every document still
+    # queued on it. Those are run again, each on a fresh worker of its own, so
+    # only the document that crashed is reported as an error.
+    for entry in crashed:
+        for entry, outcome in _run_batch_pool([entry], 1, schema_index, cache_file):
+            success = _report_outcome(entry, outcome, schema_paths) and success
+
+    if schema_index:
+        save_schema_index(schema_index, schema_paths)
+
+    return 0 if success else 1
+
+
+def _run_batch_pool(entries, workers, schema_index, cache_file):
+    """Validate manifest entries on a new worker pool.
+
+    Yields:
+        tuple: (entry, outcome) in completion order, where outcome is the
+            worker's (result, schema_paths) or the exception that stopped it
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_batch_worker,
+        initargs=(schema_index,),
+    ) as executor:
+        futures = {
+            executor.submit(_validate_in_worker, *entry, cache_file): entry
+            for entry in entries
+        }
+        for future in as_completed(futures):
+            try:
+                outcome = future.result()
+            except Exception as e:
+                outcome = e
+            yield futures[future], outcome
+
+
+def _report_outcome(entry, outcome, schema_paths):
+    """Write the result line of a batch document and return whether it passed.
+
+    Args:
+        entry: (index, path, original) manifest entry
+        outcome: Worker (result, schema_paths), or the exception it failed with
+        schema_paths: Set collecting the schemas compiled by the workers
+    """
+    if isinstance(outcome, BaseException):
+        index, path, original = entry
+        result = {
+            "index": index,
+            "path": path,
+            "original": original,
+            "valid": False,
+            "error": f"{type(outcome).__name__}: {outcome}",
+        }
+    else:
+        result, worker_schemas = outcome
+        schema_paths.update(worker_schemas)
+    _write_result(result)
+    return result["valid"]
+
+
+def validate_document(path, original, cache_file=None):
+    """Validate one document, capturing the validators' report.
+
+    Args:
+        path: Unpacked document directory or packed file
+        original: Original .docx/.pptx file to compare against
+        cache_file: Optional XSD result cache database
+
+    Returns:
+        dict: JSON-serializable result with "path", "original", "valid",
+            "validators" (validator name -> passed), "output" (the report the
+            validators printed) and "seconds", plus "error" if the document
+            could not be validated
+    """
+    result = {"path": path, "original": original, "valid": False, "validators": {}}
+    start = time.perf_counter()
+    output = io.StringIO()
+    try:
+        original_file = Path(original)
+        validators = _validators_for(original_file.suffix.lower())
+        if not Path(path).exists():
+            result["error"] = f"{path} does not exist"
+        elif not original_file.is_file():
+            result["error"] = f"{original} is not a file"
+        elif validators is None:
+            result["error"] = (
+                f"Validation not supported for file type {original_file.suffix}"
+            )
+        else:
+            with contextlib.redirect_stdout(output):
+                for V in validators:
+                    if V is RedliningValidator:
+                        validator = V(path, original_file)
+                    else:
+                        validator = V(path, original_file, cache_file=cache_file)
+                    result["validators"][V.__name__] = bool(validator.validate())
+            result["valid"] = all(result["validators"].values())
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    result["output"] = output.getvalue()
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def _write_result(result):
+    print(json.dumps(result), flush=True)
+
+
+def _init_batch_worker(schema_index):
+    """Precompile the indexed schemas once per worker process."""
+    if schema_index:
+        warm_schema_cache(schema_index)
+
+
+def _validate_in_worker(index, path, original, cache_file):
+    """Validate one batch document inside a worker process.
+
+    Returns:
+        tuple: (result, schema_paths) where schema_paths lists the schemas this
+            worker has compiled so far, for the warm-start index
+    """
+    result = {"index": index, **validate_document(path, original, cache_file)}
+    return result, list(_schema_cache)
+
+
 if __name__ == "__main__":
     main()
@@ -2,11 +2,136 @@
 Base validator with common validation logic for document files.
 """
 
+import copy
+import hashlib
+import io
+import json
+import posixpath
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import lxml.etree
 
+from .package import OOXMLPackage, as_package
+from .profiler import ValidationProfiler
+from .result_cache import ResultCache
+
+# Compiled XSD schemas shared by every validator in this process, keyed by schema path
+_schema_cache = {}
+
+# Content hash of each schemas directory, keyed by its path (see schema_set_digest)
+_schema_set_digests = {}
+
+# Parts each XSD worker process should get at least, so that starting it and
+# compiling its schemas pays off; with fewer parts validation runs in-process
+XSD_PARTS_PER_WORKER = 8
+
+
+def load_schema(schema_path):
+    """Get the compiled XMLSchema for a schema file, compiling it on first use.
+
+    Args:
+        schema_path: Path to the XSD file
+
+    Returns:
+        lxml.etree.XMLSchema: The compiled schema
+    """
+    key = str(Path(schema_path).resolve())
+    schema = _schema_cache.get(key)
+    if schema is None:
+        with open(key, "rb") as xsd_file:
+            parser = lxml.etree.XMLParser()
+            xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=key)
+        schema = lxml.etree.XMLSchema(xsd_doc)
+        _schema_cache[key] = schema
+    return schema
+
+
+def schema_set_digest(schemas_dir):
+    """Get a hash of the content of every schema file under a directory.
+
+    Schemas import each other, so cached XSD results are keyed by the whole set
+    rather than by the one schema a part is validated against. Computed once per
+    process.
+    """
+    key = str(Path(schemas_dir).resolve())
+    digest = _schema_set_digests.get(key)
+    if digest is None:
+        sha = hashlib.sha1()
+        for path in sorted(Path(key).rglob("*")):
+            if path.is_file():
+                sha.update(path.relative_to(key).as_posix().encode("utf-8") + b"\0")
+                sha.update(path.read_bytes())
+        digest = _schema_set_digests[key] = sha.hexdigest()
+    return digest
+
+
+def warm_schema_cache(index_file):
+    """Compile every schema listed in a warm-start index written by save_schema_index.
+
+    Compiled schemas cannot be serialized, so the index only records which schemas
+    earlier runs needed. Compiling them up front lets long-lived processes (such as
+    worker pools) pay the cost once before any part is validated.
+
+    Args:
+        index_file: Path to the JSON index file
+
+    Returns:
+        int: Number of schemas now in the cache
+    """
+    index_file = Path(index_file)
+    if not index_file.is_file():
+        return len(_schema_cache)
+
+    try:
+        entries = json.loads(index_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return len(_schema_cache)
+
+    for entry in entries:
+        schema_path = Path(entry.get("path", ""))
+        try:
+            # Skip schemas that changed or disappeared since the index was written
+            if schema_path.stat().st_mtime_ns != entry.get("mtime_ns"):
+                continue
+            load_schema(schema_path)
+        except (OSError, lxml.etree.LxmlError):
+            continue
+
+    return len(_schema_cache)
+
+
+def save_schema_index(index_file, schema_paths=None):
+    """Record the schemas compiled in this process so later runs can warm up.
+
+    Args:
+        index_file: Path to the JSON index file (merged with any existing entries)
+        schema_paths: Resolved schema paths to record instead of this process's
+            cache, e.g. those compiled by worker processes
+    """
+    index_file = Path(index_file)
+    entries = {}
+    if index_file.is_file():
+        try:
+            for entry in json.loads(index_file.read_text(encoding="utf-8")):
+                entries[entry["path"]] = entry
+        except (OSError, ValueError, KeyError, TypeError):
+            entries = {}
+
+    for key in _schema_cache if schema_paths is None else schema_paths:
+        try:
+            entries[key] = {"path": key, "mtime_ns": Path(key).stat().st_mtime_ns}
+        except OSError:
+            entries.pop(key, None)
+
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    index_file.write_text(
+        json.dumps(sorted(entries.values(), key=lambda e: e["path"]), indent=2),
+        encoding="utf-8",
+    )
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -84,6 +209,10 @@ class BaseSchemaValidator:
     # Folders where we should clean ignorable namespaces
     MAIN_CONTENT_FOLDERS = {"word", "ppt", "xl"}
 
+    # Part of every result cache key; bump when XSD preprocessing or comparison
+    # changes so results cached by older versions are not reused
+    VALIDATOR_VERSION = 1
+
     # All allowed OOXML namespaces (superset of all document types)
     OOXML_NAMESPACES = {
         "http://schemas.openxmlformats.org/officeDocument/2006/math",
@@ -103,35 +232,178 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
-        self.unpacked_dir = Path(unpacked_dir).resolve()
-        self.original_file = Path(original_file)
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        max_workers=None,
+        manifest=None,
+        profile=False,
+        cache_file=None,
+    ):
+        # unpacked_dir may also be a packed .docx/.pptx/.xlsx, which is read in
+        # place, or an OOXMLPackage (e.g. with parts set in memory). Either way
+        # files are addressed as unpacked_dir / part name and all reads go
+        # through self.package. original_file may be an OOXMLPackage too.
+        self.package = as_package(unpacked_dir)
+        self.unpacked_dir = self.package.path.resolve()
+        self.original_file = (
+            original_file.path
+            if isinstance(original_file, OOXMLPackage)
+            else Path(original_file)
+        )
         self.verbose = verbose
 
+        # Number of worker processes for XSD validation (None or 1 runs serially)
+        self.max_workers = max_workers
+
+        # Content-hash manifest of the last successful validation (see _is_unchanged).
+        # Owned by the caller so it can be reused across validator instances.
+        self.manifest = manifest
+        self._part_digests = {}
+        self._part_global_ids = {}
+
+        # Per-check and per-part timing, parse and I/O statistics (see _run_check)
+        self.profiler = ValidationProfiler() if profile else None
+
+        # Persistent per-part XSD result cache shared across runs (None disables it)
+        self.cache_file = cache_file
+        self.result_cache = ResultCache(cache_file) if cache_file else None
+
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
         # Get all XML and .rels files
-        patterns = ["*.xml", "*.rels"]
+        part_names = self.package.names()
         self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
+            self.unpacked_dir / part_name
+            for extension in (".xml", ".rels")
+            for part_name in part_names
+            if part_name.endswith(extension)
         ]
 
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Original package and the XSD errors of its parts, loaded on first use
+        self._original_package = (
+            original_file if isinstance(original_file, OOXMLPackage) else None
+        )
+        self._original_errors = {}
+
+        # Files, relationships and content types, built on first use
+        self._package_graph = None
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def _run_check(self, check):
+        """Run a validation check, timing it when profiling is enabled."""
+        if self.profiler is None:
+            return check()
+        with self.profiler.check(check.__name__):
+            return check()
+
+    def _profile_part(self, xml_file, seconds=0.0, nbytes=0, parses=0):
+        """Attribute work on a file to it in the profile, if profiling is enabled."""
+        if self.profiler is not None:
+            try:
+                part_name = self._part_name(xml_file)
+            except ValueError:
+                part_name = str(xml_file)
+            self.profiler.record(part_name, seconds, nbytes, parses)
+
+    def _parse_xml(self, xml_file):
+        """Parse an XML file, reusing the tree parsed by earlier checks.
+
+        Each file is parsed once per validator (by self.package) and shared by
+        every check. A cached tree is discarded when the file changes. Callers
+        must not modify the returned tree; checks that need to mutate it should
+        work on a copy.
+
+        Args:
+            xml_file: Path to the XML file
+
+        Returns:
+            lxml.etree._ElementTree: The parsed document
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed
+        """
+        part_name = self._part_name(xml_file)
+        if self.package.has_tree(part_name):
+            return self.package.get_tree(part_name)
+
+        start = time.perf_counter()
+        tree = self.package.get_tree(part_name)
+        self._profile_part(
+            xml_file,
+            time.perf_counter() - start,
+            self.package.size(part_name),
+            parses=1,
+        )
+        return tree
+
+    def _part_name(self, xml_file):
+        """Get the package part name of a file (e.g. "word/document.xml")."""
+        return Path(xml_file).relative_to(self.unpacked_dir).as_posix()
+
+    def _part_digest(self, xml_file):
+        """Get the SHA-1 hex digest of a file's content."""
+        key = str(xml_file)
+        if key not in self._part_digests:
+            start = time.perf_counter()
+            content = self.package.read(self._part_name(xml_file))
+            self._part_digests[key] = hashlib.sha1(content).hexdigest()
+            self._profile_part(xml_file, time.perf_counter() - start, len(content))
+        return self._part_digests[key]
+
+    def _is_unchanged(self, xml_file):
+        """Check if a part is identical to when the manifest last recorded it.
+
+        Unchanged parts already passed every per-part check (well-formedness,
+        namespaces, file-scoped IDs, XSD and format-specific content checks) at
+        the last successful validation, so those checks skip them. Cross-part
+        checks (relationships, content types, global IDs) always cover every part.
+        """
+        if self.manifest is None:
+            return False
+        entry = self.manifest.get(self._part_name(xml_file))
+        return entry is not None and entry["digest"] == self._part_digest(xml_file)
+
+    def _update_manifest(self):
+        """Record the current content of every part after a successful validation."""
+        if self.manifest is None:
+            return
+
+        entries = {}
+        for xml_file in self.xml_files:
+            part_name = self._part_name(xml_file)
+            if part_name in self._part_global_ids:
+                global_ids = self._part_global_ids[part_name]
+            else:
+                global_ids = self.manifest.get(part_name, {}).get("global_ids", [])
+            entries[part_name] = {
+                "digest": self._part_digest(xml_file),
+                "global_ids": global_ids,
+            }
+
+        self.manifest.clear()
+        self.manifest.update(entries)
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
 
         for xml_file in self.xml_files:
+            if self._is_unchanged(xml_file):
+                continue
+
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                self._parse_xml(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -158,8 +430,11 @@ class BaseSchemaValidator:
         errors = []
 
         for xml_file in self.xml_files:
+            if self._is_unchanged(xml_file):
+                continue
+
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -188,17 +463,49 @@ class BaseSchemaValidator:
         errors = []
         global_ids = {}  # Track globally unique IDs across all files
 
+        def check_global_id(xml_file, id_value, line, tag):
+            if id_value in global_ids:
+                prev_file, prev_line, prev_tag = global_ids[id_value]
+                errors.append(
+                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                    f"Line {line}: Global ID '{id_value}' in <{tag}> "
+                    f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                )
+            else:
+                global_ids[id_value] = (
+                    xml_file.relative_to(self.unpacked_dir),
+                    line,
+                    tag,
+                )
+
         for xml_file in self.xml_files:
+            if self._is_unchanged(xml_file):
+                # File-scoped IDs were already checked; only replay the global IDs
+                # recorded for this part so cross-part uniqueness is still enforced
+                entry = self.manifest[self._part_name(xml_file)]
+                for id_value, line, tag in entry["global_ids"]:
+                    check_global_id(xml_file, id_value, line, tag)
+                continue
+
+            part_global_ids = []
+            self._part_global_ids[self._part_name(xml_file)] = part_global_ids
+
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 file_ids = {}  # Track IDs that must be unique within this file
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
+                # Remove all mc:AlternateContent elements from a private copy of the
+                # tree (copy-on-write: the shared parsed tree is left untouched)
+                mc_namespaces = {"mc": self.MC_NAMESPACE}
+                if root.xpath(
+                    "boolean(.//mc:AlternateContent)", namespaces=mc_namespaces
+                ):
+                    root = copy.deepcopy(root)
+                    mc_elements = root.xpath(
+                        ".//mc:AlternateContent", namespaces=mc_namespaces
+                    )
+                    for elem in mc_elements:
+                        elem.getparent().remove(elem)
 
                 # Now check IDs in the cleaned tree
                 for elem in root.iter():
@@ -228,21 +535,12 @@ class BaseSchemaValidator:
                         if id_value is not None:
                             if scope == "global":
                                 # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
+                                part_global_ids.append(
+                                    (id_value, elem.sourceline, tag)
+                                )
+                                check_global_id(
+                                    xml_file, id_value, elem.sourceline, tag
+                                )
                             elif scope == "file":
                                 # Check file-level uniqueness
                                 key = (tag, attr_name)
@@ -274,99 +572,176 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _get_package_graph(self):
+        """Get an index of the package's files, relationships and content types.
+
+        The package is listed once and every .rels file and [Content_Types].xml is
+        read once, so relationship and content-type checks answer their questions
+        with set and dict lookups instead of filesystem calls and reparses.
+
+        Returns:
+            dict with keys:
+                files: Package-relative POSIX paths of all files, in walk order
+                file_set: The same paths as a set
+                rels: Dict mapping each .rels part name to a dict with "file" (Path),
+                    "error" (exception raised while parsing, or None) and
+                    "relationships" (list of dicts with "id", "type", "target",
+                    "line" and "path", the resolved package-relative target path or
+                    None for external targets)
+                content_types: Dict with "overrides" (set of declared part names)
+                    and "defaults" (set of declared extensions), or None if
+                    [Content_Types].xml is missing
+                content_types_error: Exception raised while parsing
+                    [Content_Types].xml, or None
+        """
+        if self._package_graph is not None:
+            return self._package_graph
+
+        files = self.package.names()
+
+        rels = {}
+        for part_name in files:
+            if part_name.endswith(".rels"):
+                rels[part_name] = self._read_relationships(part_name)
+
+        content_types = None
+        content_types_error = None
+        if "[Content_Types].xml" in files:
+            content_types = {"overrides": set(), "defaults": set()}
+            try:
+                root = self._parse_xml(
+                    self.unpacked_dir / "[Content_Types].xml"
+                ).getroot()
+
+                # Override declarations (specific files)
+                for override in root.findall(
+                    f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
+                ):
+                    part_name = override.get("PartName")
+                    if part_name is not None:
+                        content_types["overrides"].add(part_name.lstrip("/"))
+
+                # Default declarations (by extension)
+                for default in root.findall(
+                    f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
+                ):
+                    extension = default.get("Extension")
+                    if extension is not None:
+                        content_types["defaults"].add(extension.lower())
+            except Exception as e:
+                content_types_error = e
+
+        self._package_graph = {
+            "files": files,
+            "file_set": set(files),
+            "rels": rels,
+            "content_types": content_types,
+            "content_types_error": content_types_error,
+        }
+        return self._package_graph
+
+    def _read_relationships(self, rels_part):
+        """Parse a .rels part into the relationship entries used by the package graph."""
+        rels_file = self.unpacked_dir / rels_part
+        entry = {"file": rels_file, "error": None, "relationships": []}
+
+        # Targets of the root .rels file are relative to the package root; other
+        # .rels files are relative to their source part's directory
+        # e.g., word/_rels/document.xml.rels -> targets relative to word/
+        base_dir = posixpath.dirname(posixpath.dirname(rels_part))
+
+        try:
+            rels_root = self._parse_xml(rels_file).getroot()
+        except Exception as e:
+            entry["error"] = e
+            return entry
+
+        for rel in rels_root.findall(
+            f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+        ):
+            target = rel.get("Target")
+            path = None
+            if target and not target.startswith(("http", "mailto:")):
+                if target.startswith("/"):
+                    # Absolute part names are relative to the package root
+                    path = posixpath.normpath(target.lstrip("/"))
+                else:
+                    path = posixpath.normpath(posixpath.join(base_dir, target))
+            entry["relationships"].append(
+                {
+                    "id": rel.get("Id"),
+                    "type": rel.get("Type", ""),
+                    "target": target,
+                    "line": rel.sourceline,
+                    "path": path,
+                }
+            )
+
+        return entry
+
+    @staticmethod
+    def _rels_part_for(part_name):
+        """Get the .rels part name for a part (dir/file.xml -> dir/_rels/file.xml.rels)."""
+        directory, name = posixpath.split(part_name)
+        return posixpath.join(directory, "_rels", f"{name}.rels")
+
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
         """
         errors = []
+        graph = self._get_package_graph()
 
-        # Find all .rels files
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
-
-        if not rels_files:
+        if not graph["rels"]:
             if self.verbose:
                 print("PASSED - No .rels files found")
             return True
 
-        # Get all files in the unpacked directory (excluding reference files)
-        all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
-                and not file_path.name.endswith(".rels")
-            ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
+        # Get all files in the package (excluding reference files)
+        all_files = [
+            part_name
+            for part_name in graph["files"]
+            if posixpath.basename(part_name) != "[Content_Types].xml"
+            and not part_name.endswith(".rels")
+        ]  # These files are not referenced by .rels
 
         # Track all files that are referenced by any .rels file
         all_referenced_files = set()
 
         if self.verbose:
             print(
-                f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
+                f"Found {len(graph['rels'])} .rels files and {len(all_files)} target files"
             )
 
         # Check each .rels file
-        for rels_file in rels_files:
-            try:
-                # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Get the directory where this .rels file is located
-                rels_dir = rels_file.parent
-
-                # Find all relationships and their targets
-                referenced_files = set()
-                broken_refs = []
-
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):  # Skip external URLs
-                        # Resolve the target path relative to the .rels file location
-                        if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
-                        else:
-                            # Other .rels files - targets are relative to their parent's parent
-                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
-
-                # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
-                        )
+        for rels_part, rels in graph["rels"].items():
+            if rels["error"] is not None:
+                errors.append(f"  Error parsing {rels_part}: {rels['error']}")
+                continue
 
-            except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+            broken_refs = []
+            for rel in rels["relationships"]:
+                if rel["path"] is None:
+                    continue  # Skip external URLs
+                if rel["path"] in graph["file_set"]:
+                    all_referenced_files.add(rel["path"])
+                else:
+                    broken_refs.append((rel["target"], rel["line"]))
+
+            # Report broken references
+            for broken_ref, line_num in broken_refs:
+                errors.append(
+                    f"  {rels_part}: Line {line_num}: Broken reference to {broken_ref}"
+                )
 
         # Check for unreferenced files (files that exist but are not referenced anywhere)
         unreferenced_files = set(all_files) - all_referenced_files
 
         if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
+            for unref_file in sorted(
+                unreferenced_files, key=lambda part_name: part_name.split("/")
+            ):
+                errors.append(f"  Unreferenced file: {unref_file}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship validation errors:")
@@ -390,9 +765,8 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
+        graph = self._get_package_graph()
 
         # Process each XML file that might contain r:id references
         for xml_file in self.xml_files:
@@ -400,31 +774,26 @@ class BaseSchemaValidator:
             if xml_file.suffix == ".rels":
                 continue
 
-            # Determine the corresponding .rels file
-            # For dir/file.xml, it's dir/_rels/file.xml.rels
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
-
             # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
+            rels_part = self._rels_part_for(self._part_name(xml_file))
+            rels = graph["rels"].get(rels_part)
+            if rels is None:
                 continue
 
             try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
+                if rels["error"] is not None:
+                    raise rels["error"]
 
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
+                # Collect valid relationship IDs and their types
+                rid_to_type = {}
+                for rel in rels["relationships"]:
+                    rid = rel["id"]
+                    rel_type = rel["type"]
                     if rid:
                         # Check for duplicate rIds
                         if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
                             errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
+                                f"  {rels_part}: Line {rel['line']}: "
                                 f"Duplicate relationship ID '{rid}' (IDs must be unique)"
                             )
                         # Extract just the type name from the full URL
@@ -434,7 +803,7 @@ class BaseSchemaValidator:
                         rid_to_type[rid] = type_name
 
                 # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                xml_root = self._parse_xml(xml_file).getroot()
 
                 # Find all elements with r:id attributes
                 for elem in xml_root.iter():
@@ -524,32 +893,17 @@ class BaseSchemaValidator:
         errors = []
 
         # Find [Content_Types].xml file
-        content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        graph = self._get_package_graph()
+        if graph["content_types"] is None:
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
-            # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
-            declared_parts = set()
-            declared_extensions = set()
-
-            # Get Override declarations (specific files)
-            for override in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
-            ):
-                part_name = override.get("PartName")
-                if part_name is not None:
-                    declared_parts.add(part_name.lstrip("/"))
-
-            # Get Default declarations (by extension)
-            for default in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
-            ):
-                extension = default.get("Extension")
-                if extension is not None:
-                    declared_extensions.add(extension.lower())
+            # Get all declared parts and extensions
+            if graph["content_types_error"] is not None:
+                raise graph["content_types_error"]
+            declared_parts = graph["content_types"]["overrides"]
+            declared_extensions = graph["content_types"]["defaults"]
 
             # Root elements that require content type declaration
             declarable_roots = {
@@ -575,10 +929,6 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
-
             # Check all XML files for Override declarations
             for xml_file in self.xml_files:
                 path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
@@ -593,7 +943,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self._parse_xml(xml_file).getroot().tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -605,7 +955,9 @@ class BaseSchemaValidator:
                     continue  # Skip unparseable files
 
             # Check all non-XML files for Default extension declarations
-            for file_path in all_files:
+            for part_name in graph["files"]:
+                file_path = Path(part_name)
+
                 # Skip XML files and metadata files (already checked above)
                 if file_path.suffix.lower() in {".xml", ".rels"}:
                     continue
@@ -618,9 +970,8 @@ class BaseSchemaValidator:
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
                     if extension in media_extensions:
-                        relative_path = file_path.relative_to(self.unpacked_dir)
                         errors.append(
-                            f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
+                            f'  {part_name}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
                         )
 
         except Exception as e:
@@ -692,11 +1043,21 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
+        unchanged = {f for f in self.xml_files if self._is_unchanged(f)}
+        results = iter(
+            self._validate_files_against_xsd(
+                [f for f in self.xml_files if f not in unchanged]
+            )
+        )
+
         for xml_file in self.xml_files:
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
+            if xml_file in unchanged:
+                # Passed at the last recorded validation and not modified since
+                has_schema = self._get_schema_path(xml_file) is not None
+                is_valid, new_file_errors = (True if has_schema else None), set()
+            else:
+                is_valid, new_file_errors = next(results)
 
             if is_valid is None:
                 skipped_count += 1
@@ -738,6 +1099,51 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _validate_files_against_xsd(self, xml_files):
+        """Run validate_file_against_xsd on each file, in parallel if max_workers > 1.
+
+        Only as many workers are started as there are XSD_PARTS_PER_WORKER parts
+        for, so small packages are validated in-process. Each worker process
+        builds its own validator (and with it its own compiled schema cache and
+        original-package reader). Results are returned in the same order as
+        xml_files regardless of which worker finishes first.
+
+        Args:
+            xml_files: List of XML file paths to validate
+
+        Returns:
+            list: (is_valid, new_errors_set) tuples, one per file
+        """
+        workers = min(self.max_workers or 1, len(xml_files) // XSD_PARTS_PER_WORKER)
+        # Workers reopen the packages from disk, without parts set in memory
+        in_memory = self.package.has_changes() or (
+            self._original_package is not None
+            and self._original_package.has_changes()
+        )
+        if workers <= 1 or in_memory:
+            return [
+                self.validate_file_against_xsd(xml_file, verbose=False)
+                for xml_file in xml_files
+            ]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_xsd_worker,
+            initargs=(
+                type(self),
+                self.unpacked_dir,
+                self.original_file,
+                self.cache_file,
+            ),
+        ) as executor:
+            return list(
+                executor.map(
+                    _validate_file_in_worker,
+                    xml_files,
+                    chunksize=max(1, len(xml_files) // (workers * 4)),
+                )
+            )
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -813,55 +1219,98 @@ class BaseSchemaValidator:
             root.remove(elem)
 
     def _preprocess_for_mc_ignorable(self, xml_doc):
-        """Preprocess XML to handle mc:Ignorable attribute properly."""
-        # Remove mc:Ignorable attributes before validation
-        root = xml_doc.getroot()
+        """Preprocess XML to handle mc:Ignorable attribute properly.
 
-        # Remove mc:Ignorable attribute from root
-        if f"{{{self.MC_NAMESPACE}}}Ignorable" in root.attrib:
-            del root.attrib[f"{{{self.MC_NAMESPACE}}}Ignorable"]
+        The input tree may be shared (see _parse_xml), so it is only copied, and
+        the copy returned, when there is an attribute to remove.
+        """
+        # Remove mc:Ignorable attribute from root before validation
+        ignorable_attr = f"{{{self.MC_NAMESPACE}}}Ignorable"
+        if ignorable_attr in xml_doc.getroot().attrib:
+            xml_doc = copy.deepcopy(xml_doc)
+            del xml_doc.getroot().attrib[ignorable_attr]
 
         return xml_doc
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+    def _validate_single_file_xsd(self, xml_file, base_path, content=None):
+        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set).
+
+        Args:
+            xml_file: Path to the XML file (also used to pick the schema)
+            base_path: Directory that xml_file is relative to
+            content: Optional XML bytes to validate instead of reading xml_file
+        """
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
+            relative_path = xml_file.relative_to(base_path)
+            in_main_folder = bool(
+                relative_path.parts
+                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
+            )
+
+            # Identical bytes validated by any earlier run give the same result
+            cache_key = None
+            if self.result_cache is not None:
+                if content is not None:
+                    digest = hashlib.sha1(content).hexdigest()
+                else:
+                    digest = self._part_digest(xml_file)
+                cache_key = "|".join(
+                    [
+                        digest,
+                        str(schema_path),
+                        schema_set_digest(self.schemas_dir),
+                        str(in_main_folder),
+                        type(self).__name__,
+                        str(self.VALIDATOR_VERSION),
+                    ]
                 )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+                cached = self.result_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            # Load schema (compiled once per process and shared across files)
+            schema = load_schema(schema_path)
 
             # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            start = time.perf_counter()
+            if content is not None:
+                xml_doc = lxml.etree.parse(io.BytesIO(content))
+                profile_name = f"{self.original_file.name}:{relative_path.as_posix()}"
+                if self.profiler is not None:
+                    self.profiler.record(
+                        profile_name, time.perf_counter() - start, len(content), 1
+                    )
+            else:
+                xml_doc = self._parse_xml(xml_file)
+                profile_name = relative_path.as_posix()
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
-            xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
             # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
+            if in_main_folder:
                 xml_doc = self._clean_ignorable_namespaces(xml_doc)
 
+            xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
+
             # Validate
-            if schema.validate(xml_doc):
-                return True, set()
-            else:
-                errors = set()
+            start = time.perf_counter()
+            is_valid = schema.validate(xml_doc)
+            if self.profiler is not None:
+                self.profiler.record(profile_name, time.perf_counter() - start)
+
+            errors = set()
+            if not is_valid:
                 for error in schema.error_log:
                     # Store normalized error message (without line numbers for comparison)
                     errors.add(error.message)
-                return False, errors
+
+            if cache_key is not None:
+                self.result_cache.put(cache_key, is_valid, errors)
+            return is_valid, errors
 
         except Exception as e:
             return False, {str(e)}
@@ -869,39 +1318,57 @@ class BaseSchemaValidator:
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        The original package is read once per validator and each part is validated
+        straight from its zip member bytes. Results are memoized per part.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
+        part_name = xml_file.relative_to(unpacked_dir).as_posix()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        if part_name not in self._original_errors:
+            content = self._read_original_part(part_name)
+            if content is None:
+                # File didn't exist in original, so no original errors
+                errors = set()
+            else:
+                # Validate the specific file in original
+                _, errors = self._validate_single_file_xsd(
+                    xml_file, unpacked_dir, content=content
+                )
+            self._original_errors[part_name] = errors if errors else set()
 
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+        return self._original_errors[part_name]
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+    def _read_original_part(self, part_name):
+        """Read a part of the original document by its zip member name.
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
+        The original package is opened once, on first use, and its parts are read
+        from the zip one at a time without extracting it.
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
+        Args:
+            part_name: Part name relative to the package root (e.g. "word/document.xml")
+
+        Returns:
+            bytes: The part content, or None if the original has no such part
+        """
+        if self._original_package is None:
+            self._original_package = OOXMLPackage(self.original_file)
+        if part_name not in self._original_package:
+            return None
+
+        content = self._original_package.read(part_name)
+        if self.profiler is not None:
+            self.profiler.record(
+                f"{self.original_file.name}:{part_name}", nbytes=len(content)
             )
-            return errors if errors else set()
+        return content
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
@@ -910,19 +1377,23 @@ class BaseSchemaValidator:
         for content replacement. They should be removed from text content before
         XSD validation while preserving XML structure.
 
+        Only text nodes containing "{{" are visited. When there are none, the input
+        document itself is returned without copying, so callers must not modify it.
+
         Returns:
             tuple: (cleaned_xml_doc, warnings_list)
         """
         warnings = []
         template_pattern = re.compile(r"\{\{[^}]*\}\}")
+        candidates_xpath = "//text()[contains(., '{{')]"
+
+        if not xml_doc.xpath(candidates_xpath):
+            return xml_doc, warnings
 
         # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+        xml_copy = copy.deepcopy(xml_doc)
 
         def process_text_content(text, content_type):
-            if not text:
-                return text
             matches = list(template_pattern.finditer(text))
             if matches:
                 for match in matches:
@@ -932,19 +1403,40 @@ class BaseSchemaValidator:
                 return template_pattern.sub("", text)
             return text
 
-        # Process all text nodes in the document
-        for elem in xml_copy.iter():
-            # Skip processing if this is a w:t element
+        for text in xml_copy.xpath(candidates_xpath):
+            # The element owning this text (for tails, the element it follows)
+            elem = text.getparent()
+
+            # Skip text of comments, processing instructions and w:t elements
             if not hasattr(elem, "tag") or callable(elem.tag):
                 continue
             tag_str = str(elem.tag)
             if tag_str.endswith("}t") or tag_str == "t":
                 continue
 
-            elem.text = process_text_content(elem.text, "text content")
-            elem.tail = process_text_content(elem.tail, "tail content")
+            if text.is_tail:
+                elem.tail = process_text_content(elem.tail, "tail content")
+            else:
+                elem.text = process_text_content(elem.text, "text content")
+
+        return xml_copy, warnings
+
+
+# Validator owned by each XSD worker process (see _validate_files_against_xsd)
+_worker_validator = None
+
+
+def _init_xsd_worker(validator_class, unpacked_dir, original_file, cache_file):
+    """Create the validator that this worker process uses for all of its files."""
+    global _worker_validator
+    _worker_validator = validator_class(
+        unpacked_dir, original_file, cache_file=cache_file
+    )
+
 
-        return lxml.etree.ElementTree(xml_copy), warnings
+def _validate_file_in_worker(xml_file):
+    """Validate one file against its XSD schema inside a worker process."""
+    return _worker_validator.validate_file_against_xsd(xml_file, verbose=False)
 
 
 if __name__ == "__main__":
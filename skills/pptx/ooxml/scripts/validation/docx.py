@@ -3,8 +3,7 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
-import zipfile
+import time
 
 import lxml.etree
 
@@ -21,51 +20,60 @@ class DOCXSchemaValidator(BaseSchemaValidator):
     # Start with empty mapping - add specific cases as we discover them
     ELEMENT_RELATIONSHIP_TYPES = {}
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Memoized single-pass content scans (see _scan_document_content)
+        self._content_scans = {}
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         # Test 0: XML well-formedness
-        if not self.validate_xml():
+        if not self._run_check(self.validate_xml):
             return False
 
         # Test 1: Namespace declarations
         all_valid = True
-        if not self.validate_namespaces():
+        if not self._run_check(self.validate_namespaces):
             all_valid = False
 
         # Test 2: Unique IDs
-        if not self.validate_unique_ids():
+        if not self._run_check(self.validate_unique_ids):
             all_valid = False
 
         # Test 3: Relationship and file reference validation
-        if not self.validate_file_references():
+        if not self._run_check(self.validate_file_references):
             all_valid = False
 
         # Test 4: Content type declarations
-        if not self.validate_content_types():
+        if not self._run_check(self.validate_content_types):
             all_valid = False
 
         # Test 5: XSD schema validation
-        if not self.validate_against_xsd():
+        if not self._run_check(self.validate_against_xsd):
             all_valid = False
 
         # Test 6: Whitespace preservation
-        if not self.validate_whitespace_preservation():
+        if not self._run_check(self.validate_whitespace_preservation):
             all_valid = False
 
         # Test 7: Deletion validation
-        if not self.validate_deletions():
+        if not self._run_check(self.validate_deletions):
             all_valid = False
 
         # Test 8: Insertion validation
-        if not self.validate_insertions():
+        if not self._run_check(self.validate_insertions):
             all_valid = False
 
         # Test 9: Relationship ID reference validation
-        if not self.validate_all_relationship_ids():
+        if not self._run_check(self.validate_all_relationship_ids):
             all_valid = False
 
         # Count and compare paragraphs
-        self.compare_paragraph_counts()
+        self._run_check(self.compare_paragraph_counts)
+
+        if all_valid:
+            self._update_manifest()
 
         return all_valid
 
@@ -77,39 +85,10 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         for xml_file in self.xml_files:
             # Only check document.xml files
-            if xml_file.name != "document.xml":
+            if xml_file.name != "document.xml" or self._is_unchanged(xml_file):
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        # Check if text starts or ends with whitespace
-                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
-                            # Check if xml:space="preserve" attribute exists
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                # Show a preview of the text
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            errors.extend(self._scan_document_content(xml_file)["whitespace"])
 
         if errors:
             print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
@@ -130,35 +109,10 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         for xml_file in self.xml_files:
             # Only check document.xml files
-            if xml_file.name != "document.xml":
+            if xml_file.name != "document.xml" or self._is_unchanged(xml_file):
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements that are descendants of w:del elements
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-                xpath_expression = ".//w:del//w:t"
-                problematic_t_elements = root.xpath(
-                    xpath_expression, namespaces=namespaces
-                )
-                for t_elem in problematic_t_elements:
-                    if t_elem.text:
-                        # Show a preview of the text
-                        text_preview = (
-                            repr(t_elem.text)[:50] + "..."
-                            if len(repr(t_elem.text)) > 50
-                            else repr(t_elem.text)
-                        )
-                        errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
-                        )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            errors.extend(self._scan_document_content(xml_file)["deletions"])
 
         if errors:
             print(f"FAILED - Found {len(errors)} deletion validation violations:")
@@ -180,7 +134,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 # Count all w:p elements
                 paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
                 count = len(paragraphs)
@@ -194,19 +148,15 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
+            # Parse document.xml straight from the original package
+            content = self._read_original_part("word/document.xml")
+            if content is None:
+                raise FileNotFoundError("word/document.xml not found in original")
+            root = lxml.etree.fromstring(content)
 
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            # Count all w:p elements
+            paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+            count = len(paragraphs)
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -221,34 +171,10 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         errors = []
 
         for xml_file in self.xml_files:
-            if xml_file.name != "document.xml":
+            if xml_file.name != "document.xml" or self._is_unchanged(xml_file):
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-                # Find w:delText in w:ins that are NOT within w:del
-                invalid_elements = root.xpath(
-                    ".//w:ins//w:delText[not(ancestor::w:del)]",
-                    namespaces=namespaces
-                )
-
-                for elem in invalid_elements:
-                    text_preview = (
-                        repr(elem.text or "")[:50] + "..."
-                        if len(repr(elem.text or "")) > 50
-                        else repr(elem.text or "")
-                    )
-                    errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
-                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            errors.extend(self._scan_document_content(xml_file)["insertions"])
 
         if errors:
             print(f"FAILED - Found {len(errors)} insertion validation violations:")
@@ -260,6 +186,96 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - No w:delText elements within w:ins elements")
             return True
 
+    def _scan_document_content(self, xml_file):
+        """
+        Check whitespace preservation, deletions and insertions in a single pass.
+
+        The file is streamed with iterparse and each element is discarded once it
+        has been checked, so memory stays bounded even for very large documents.
+        Results are memoized per file and shared by the three validate_* checks.
+
+        Returns:
+            dict: Error lists keyed by "whitespace", "deletions" and "insertions"
+        """
+        key = str(xml_file)
+        if key in self._content_scans:
+            return self._content_scans[key]
+
+        results = {"whitespace": [], "deletions": [], "insertions": []}
+        relative_path = xml_file.relative_to(self.unpacked_dir)
+        t_tag = f"{{{self.WORD_2006_NAMESPACE}}}t"
+        del_text_tag = f"{{{self.WORD_2006_NAMESPACE}}}delText"
+        del_tag = f"{{{self.WORD_2006_NAMESPACE}}}del"
+        ins_tag = f"{{{self.WORD_2006_NAMESPACE}}}ins"
+        xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
+
+        def preview(text):
+            return repr(text)[:50] + "..." if len(repr(text)) > 50 else repr(text)
+
+        # Number of currently open w:del / w:ins ancestors
+        del_depth = 0
+        ins_depth = 0
+
+        part_name = self._part_name(xml_file)
+        start = time.perf_counter()
+        try:
+            with self.package.open(part_name) as part:
+                events = lxml.etree.iterparse(part, events=("start", "end"))
+                for event, elem in events:
+                    if event == "start":
+                        if elem.tag == del_tag:
+                            del_depth += 1
+                        elif elem.tag == ins_tag:
+                            ins_depth += 1
+                        continue
+
+                    if elem.tag == t_tag and elem.text:
+                        text = elem.text
+                        # Check if text starts or ends with whitespace
+                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
+                            # Check if xml:space="preserve" attribute exists
+                            if (
+                                xml_space_attr not in elem.attrib
+                                or elem.attrib[xml_space_attr] != "preserve"
+                            ):
+                                results["whitespace"].append(
+                                    f"  {relative_path}: "
+                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {preview(text)}"
+                                )
+                        if del_depth:
+                            results["deletions"].append(
+                                f"  {relative_path}: "
+                                f"Line {elem.sourceline}: <w:t> found within <w:del>: {preview(text)}"
+                            )
+                    elif elem.tag == del_text_tag and ins_depth and not del_depth:
+                        # w:delText is only allowed in w:ins if nested within a w:del
+                        results["insertions"].append(
+                            f"  {relative_path}: "
+                            f"Line {elem.sourceline}: <w:delText> within <w:ins>: {preview(elem.text or '')}"
+                        )
+                    elif elem.tag == del_tag:
+                        del_depth -= 1
+                    elif elem.tag == ins_tag:
+                        ins_depth -= 1
+
+                    # Free the finished element and any siblings already processed
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            error = f"  {relative_path}: Error: {e}"
+            results = {name: [error] for name in results}
+
+        self._profile_part(
+            xml_file,
+            time.perf_counter() - start,
+            self.package.size(part_name),
+            parses=1,
+        )
+        self._content_scans[key] = results
+        return results
+
     def compare_paragraph_counts(self):
         """Compare paragraph counts between original and new document."""
         original_count = self.count_paragraphs_in_original()
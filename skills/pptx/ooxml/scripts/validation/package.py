@@ -0,0 +1,272 @@
+"""
+Office package (.docx/.pptx/.xlsx) access over a zip file or an unpacked directory.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path
+
+import lxml.etree
+
+# Extensions of files written as Office packages (zips) rather than directories
+PACKAGE_EXTENSIONS = {".docx", ".docm", ".pptx", ".pptm", ".xlsx", ".xlsm", ".zip"}
+
+
+class OOXMLPackage:
+    """An Office package opened directly on its zip file or on an unpacked directory.
+
+    Parts are addressed by their package-relative POSIX names (e.g.
+    "word/document.xml") and read lazily, one member at a time, so a package
+    never has to be extracted to be inspected. Parsed trees are cached and
+    shared by all callers. Parts can be replaced with set_part() and removed
+    with remove_part() without touching the package on disk; write() then
+    writes them out, rewriting only those parts of a directory in place.
+
+    For a directory, cached trees are reparsed when the file changes on disk.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Package not found: {self.path}")
+        self.is_zip = self.path.is_file()
+
+        self._zip = None
+        self._names = None
+        self._trees = {}
+        self._written = {}
+        self.dirty = set()
+        self.removed = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying zip file (reopened on next use)."""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def _zipfile(self):
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.path, "r")
+        return self._zip
+
+    def names(self):
+        """Get the names of all parts, in zip order or directory walk order."""
+        if self._names is None:
+            if self.is_zip:
+                self._names = [
+                    info.filename
+                    for info in self._zipfile().infolist()
+                    if not info.is_dir()
+                ]
+            else:
+                self._names = []
+                for dirpath, dirnames, filenames in os.walk(self.path):
+                    rel_dir = Path(dirpath).relative_to(self.path).as_posix()
+                    for filename in filenames:
+                        self._names.append(
+                            filename if rel_dir == "." else f"{rel_dir}/{filename}"
+                        )
+            self._names = [name for name in self._names if name not in self.removed]
+        return self._names + [
+            name for name in self._written if name not in self._names
+        ]
+
+    def __contains__(self, name):
+        if name in self.removed:
+            return False
+        if name in self._written:
+            return True
+        if self.is_zip:
+            try:
+                self._zipfile().getinfo(name)
+                return True
+            except KeyError:
+                return False
+        return (self.path / name).is_file()
+
+    def _check_exists(self, name):
+        if name not in self:
+            raise KeyError(f"No part named {name!r} in {self.path}")
+
+    def signature(self, name):
+        """Get a value that changes whenever a part's content changes."""
+        self._check_exists(name)
+        if name in self._written:
+            return ("written", id(self._written[name]))
+        if self.is_zip:
+            info = self._zipfile().getinfo(name)
+            return (info.CRC, info.file_size)
+        stat = (self.path / name).stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def size(self, name):
+        """Get the uncompressed size of a part in bytes."""
+        self._check_exists(name)
+        if name in self._written:
+            return len(self._written[name])
+        if self.is_zip:
+            return self._zipfile().getinfo(name).file_size
+        return (self.path / name).stat().st_size
+
+    def open(self, name):
+        """Open a part for streaming reads as a binary file object."""
+        self._check_exists(name)
+        if name in self._written:
+            return io.BytesIO(self._written[name])
+        if self.is_zip:
+            return self._zipfile().open(name)
+        return open(self.path / name, "rb")
+
+    def read(self, name):
+        """Read a part's content.
+
+        Raises:
+            KeyError: If the package has no such part
+        """
+        self._check_exists(name)
+        if name in self._written:
+            return self._written[name]
+        if self.is_zip:
+            return self._zipfile().read(name)
+        return (self.path / name).read_bytes()
+
+    def has_tree(self, name):
+        """Check if a part has an up-to-date parsed tree in the cache."""
+        cached = self._trees.get(name)
+        if cached is None:
+            return False
+        return cached[0] == self.signature(name)
+
+    def get_tree(self, name):
+        """Parse a part, reusing the cached tree when the part hasn't changed.
+
+        The tree is shared, so callers that modify it should work on a copy.
+
+        Raises:
+            KeyError: If the package has no such part
+            lxml.etree.XMLSyntaxError: If the part is not well-formed
+        """
+        if self.has_tree(name):
+            return self._trees[name][1]
+
+        signature = self.signature(name)
+        with self.open(name) as f:
+            tree = lxml.etree.parse(f, base_url=str(self.path / name))
+        self._trees[name] = (signature, tree)
+        return tree
+
+    def has_changes(self):
+        """Check if parts were set or removed since the package was last written."""
+        return bool(self.dirty or self.removed)
+
+    def set_part(self, name, content):
+        """Replace or add a part with the given bytes."""
+        self._written[name] = bytes(content)
+        self._trees.pop(name, None)
+        self.removed.discard(name)
+        self.dirty.add(name)
+
+    def remove_part(self, name):
+        """Remove a part from the package."""
+        self._check_exists(name)
+        self._written.pop(name, None)
+        self._trees.pop(name, None)
+        self.dirty.discard(name)
+        self.removed.add(name)
+        if self._names is not None and name in self._names:
+            self._names.remove(name)
+
+    def write(self, destination=None):
+        """Write the package with the parts that were set or removed.
+
+        Args:
+            destination: Zip file (by extension, see PACKAGE_EXTENSIONS) or
+                directory to write to. Defaults to the package's own path; a
+                directory is then updated in place by writing only the dirty
+                parts, and a zip is rewritten atomically.
+        """
+        destination = Path(destination) if destination is not None else self.path
+        in_place = destination.resolve() == self.path.resolve()
+
+        if destination.suffix.lower() in PACKAGE_EXTENSIONS:
+            # Stream into a temporary file next to the target, then swap it in
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(
+                prefix=f".{destination.name}.", dir=destination.parent
+            )
+            os.close(fd)
+            try:
+                self._write_zip(Path(temp_name))
+                # mkstemp creates the file private to the user
+                if destination.exists():
+                    shutil.copymode(destination, temp_name)
+                else:
+                    os.chmod(temp_name, 0o644)
+                if in_place:
+                    self.close()
+                os.replace(temp_name, destination)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+            if in_place:
+                self._reset()
+        elif in_place and not self.is_zip:
+            for name in self.removed:
+                (self.path / name).unlink(missing_ok=True)
+            for name in self.dirty:
+                target = self.path / name
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(self.read(name))
+            self._reset()
+        else:
+            destination.mkdir(parents=True, exist_ok=True)
+            for name in self.names():
+                target = destination / name
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if name in self.dirty or self.is_zip:
+                    target.write_bytes(self.read(name))
+                else:
+                    shutil.copyfile(self.path / name, target)
+
+    def _write_zip(self, zip_path):
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name in self.names():
+                if self.is_zip and name not in self.dirty:
+                    # Stream the member across, keeping its original compression
+                    source = self._zipfile().getinfo(name)
+                    info = zipfile.ZipInfo(name, source.date_time)
+                    info.compress_type = source.compress_type
+                    info.external_attr = source.external_attr
+                    info.file_size = source.file_size
+                    with self._zipfile().open(source) as src, zf.open(
+                        info, "w"
+                    ) as dst:
+                        shutil.copyfileobj(src, dst)
+                else:
+                    zf.writestr(name, self.read(name))
+
+    def _reset(self):
+        """Forget pending changes after they were written to the package's own path."""
+        self._written.clear()
+        self.dirty.clear()
+        self.removed.clear()
+        self._names = None
+        self._trees.clear()
+
+
+def as_package(source):
+    """Get an OOXMLPackage for a zip file or directory, or source if it is one."""
+    return source if isinstance(source, OOXMLPackage) else OOXMLPackage(source)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
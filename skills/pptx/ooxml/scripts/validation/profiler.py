@@ -0,0 +1,130 @@
+"""
+Profiler recording where validation time, parsing and I/O are spent.
+"""
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+def _peak_rss_kb():
+    """Get the peak resident set size of this process in KiB, or None if unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class ValidationProfiler:
+    """Per-check and per-part timing, parse and I/O statistics for a validator.
+
+    Checks are timed with check(); parses, reads and per-part work are
+    attributed to both the running check and the part they touched with
+    record(). Work done inside XSD worker processes only shows up in the
+    wall time of the check that dispatched it.
+
+    The peak RSS of a process only ever grows, so each check records how
+    much it raised it (peak_rss_growth_kb) and the process peak is reported
+    once for the whole run.
+    """
+
+    def __init__(self):
+        self.checks = {}
+        self.parts = {}
+        self._current_check = None
+
+    @contextmanager
+    def check(self, name):
+        """Time a validation check and attribute parses and reads to it."""
+        stats = self.checks.setdefault(
+            name,
+            {"seconds": 0.0, "parses": 0, "bytes_read": 0, "peak_rss_growth_kb": None},
+        )
+        previous_check = self._current_check
+        self._current_check = stats
+        peak_before = _peak_rss_kb()
+        start = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            stats["seconds"] += time.perf_counter() - start
+            if peak_before is not None:
+                growth = _peak_rss_kb() - peak_before
+                stats["peak_rss_growth_kb"] = (
+                    stats["peak_rss_growth_kb"] or 0
+                ) + growth
+            self._current_check = previous_check
+
+    def record(self, part_name, seconds=0.0, nbytes=0, parses=0):
+        """Attribute time, bytes read and parses for a part to it and the running check."""
+        part = self.parts.setdefault(
+            part_name, {"seconds": 0.0, "parses": 0, "bytes_read": 0}
+        )
+        part["seconds"] += seconds
+        part["parses"] += parses
+        part["bytes_read"] += nbytes
+        if self._current_check is not None:
+            self._current_check["parses"] += parses
+            self._current_check["bytes_read"] += nbytes
+
+    def to_dict(self):
+        """Get the recorded statistics as a JSON-serializable dict."""
+        return {
+            "checks": self.checks,
+            "parts": self.parts,
+            "peak_rss_kb": _peak_rss_kb(),
+        }
+
+    def report(self, fmt="table", top_parts=20):
+        """Format the recorded statistics.
+
+        Args:
+            fmt: "table" for a human-readable report or "json"
+            top_parts: Number of parts to list in the table, slowest first
+
+        Returns:
+            str: The formatted report
+        """
+        if fmt == "json":
+            return json.dumps(self.to_dict(), indent=2)
+
+        def kib(nbytes):
+            return f"{nbytes / 1024:.1f}"
+
+        lines = [
+            f"{'Check':<40} {'Time (s)':>9} {'Parses':>7} {'Read (KiB)':>11} "
+            f"{'Peak RSS +KiB':>14}"
+        ]
+        for name, stats in self.checks.items():
+            growth = stats["peak_rss_growth_kb"]
+            growth = growth if growth is not None else "-"
+            lines.append(
+                f"{name:<40} {stats['seconds']:>9.3f} {stats['parses']:>7} "
+                f"{kib(stats['bytes_read']):>11} {growth:>14}"
+            )
+        peak = _peak_rss_kb()
+        lines.append(f"Process peak RSS: {peak if peak is not None else '-'} KiB")
+
+        parts = sorted(self.parts.items(), key=lambda item: -item[1]["seconds"])
+        lines.append("")
+        lines.append(f"{'Part':<60} {'Time (s)':>9} {'Parses':>7} {'Read (KiB)':>11}")
+        for name, stats in parts[:top_parts]:
+            lines.append(
+                f"{name:<60} {stats['seconds']:>9.3f} {stats['parses']:>7} "
+                f"{kib(stats['bytes_read']):>11}"
+            )
+        if len(parts) > top_parts:
+            lines.append(f"... and {len(parts) - top_parts} more parts")
+
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
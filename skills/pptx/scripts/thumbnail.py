@@ -194,8 +194,13 @@ def get_placeholder_regions(pptx_path):
     return placeholder_regions, (slide_width_inches, slide_height_inches)
 
 
-def convert_to_images(pptx_path, temp_dir, dpi):
-    """Convert PowerPoint to images via PDF, handling hidden slides."""
+def convert_to_images(pptx_path, temp_dir, dpi, office_service=None):
+    """Convert PowerPoint to images via PDF, handling hidden slides.
+
+    The PDF conversion runs on office_service's soffice instances (see
+    ooxml/scripts/office_service.py) when given, and in a new soffice process
+    otherwise.
+    """
     # Detect hidden slides
     print("Analyzing presentation...")
     prs = Presentation(str(pptx_path))
@@ -216,21 +221,24 @@ def convert_to_images(pptx_path, temp_dir, dpi):
 
     # Convert to PDF
     print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
-        raise RuntimeError("PDF conversion failed")
+    if office_service is not None:
+        pdf_path = office_service.convert(pptx_path, temp_dir, "pdf")
+    else:
+        result = subprocess.run(
+            [
+                "soffice",
+                "--headless",
+                "--convert-to",
+                "pdf",
+                "--outdir",
+                str(temp_dir),
+                str(pptx_path),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0 or not pdf_path.exists():
+            raise RuntimeError("PDF conversion failed")
 
     # Convert PDF to images
     print(f"Converting to images at {dpi} DPI...")
@@ -50,13 +50,16 @@ def setup_libreoffice_macro():
         return False
 
 
-def recalc(filename, timeout=30):
+def recalc(filename, timeout=30, office_service=None):
     """
     Recalculate formulas in Excel file and report any errors
     
     Args:
         filename: Path to Excel file
         timeout: Maximum time to wait for recalculation (seconds)
+        office_service: Optional OfficeService (ooxml/scripts/office_service.py
+            in the docx and pptx skills) whose soffice instances run the
+            recalculation instead of a new soffice process
     
     Returns:
         dict with error locations and counts
@@ -66,6 +69,15 @@ def recalc(filename, timeout=30):
     
     abs_path = str(Path(filename).absolute())
     
+    if office_service is not None:
+        try:
+            office_service.recalculate(abs_path, timeout=timeout)
+        except TimeoutError:
+            pass  # Like the timeout command below, check whatever was saved
+        except Exception as e:
+            return {'error': str(e)}
+        return check_errors(filename)
+    
     if not setup_libreoffice_macro():
         return {'error': 'Failed to setup LibreOffice macro'}
     
@@ -98,6 +110,11 @@ def recalc(filename, timeout=30):
         else:
             return {'error': error_msg}
     
+    return check_errors(filename)
+
+
+def check_errors(filename):
+    """Scan a recalculated Excel file for formula errors and count its formulas"""
     # Check for Excel errors in the recalculated file - scan ALL cells
     try:
         wb = load_workbook(filename, data_only=True)